@@ -0,0 +1,55 @@
+"""Benchmarks of the core functions for constructing and manipulating dense
+and sparse operators and states.
+"""
+import quimb as qu
+
+
+class Kron:
+    params = ([2, 4, 8], [False, True])
+    param_names = ['n', 'sparse']
+
+    def setup(self, n, sparse):
+        self.ops = [qu.rand_herm(4, sparse=sparse, density=0.5)
+                    for _ in range(n)]
+
+    def time_kron(self, n, sparse):
+        qu.kron(*self.ops)
+
+    def peakmem_kron(self, n, sparse):
+        qu.kron(*self.ops)
+
+
+class Ikron:
+    params = ([8, 12, 16], [False, True])
+    param_names = ['n', 'sparse']
+
+    def setup(self, n, sparse):
+        self.op = qu.pauli('X') & qu.pauli('Z')
+        self.dims = [2] * n
+
+    def time_ikron(self, n, sparse):
+        qu.ikron(self.op, self.dims, [n // 2, n // 2 + 1], sparse=sparse)
+
+    def peakmem_ikron(self, n, sparse):
+        qu.ikron(self.op, self.dims, [n // 2, n // 2 + 1], sparse=sparse)
+
+
+class PartialTrace:
+    params = ([10, 14, 18], ['ket', 'rho'])
+    param_names = ['n', 'state']
+
+    def setup(self, n, state):
+        if state == 'rho' and n > 12:
+            raise NotImplementedError("Density matrix too large.")
+        self.dims = [2] * n
+        self.keep = list(range(n // 4, 3 * n // 4))
+        if state == 'ket':
+            self.p = qu.rand_ket(2**n)
+        else:
+            self.p = qu.rand_rho(2**n)
+
+    def time_partial_trace(self, n, state):
+        qu.partial_trace(self.p, self.dims, self.keep)
+
+    def peakmem_partial_trace(self, n, state):
+        qu.partial_trace(self.p, self.dims, self.keep)
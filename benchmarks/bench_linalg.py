@@ -0,0 +1,23 @@
+"""Benchmarks of the partial eigen-solvers, for each available backend.
+"""
+import quimb as qu
+
+
+class Eigs:
+    params = ([8, 10, 12, 14], ['numpy', 'scipy', 'lobpcg', 'slepc-nompi'])
+    param_names = ['n', 'backend']
+
+    def setup(self, n, backend):
+        if backend == 'numpy' and n > 10:
+            raise NotImplementedError("Dense eigen-decomposition too large.")
+        if backend == 'slepc-nompi' and not qu.linalg.SLEPC4PY_FOUND:
+            raise NotImplementedError("slepc4py not installed.")
+
+        self.ham = qu.ham_heis(n, sparse=backend != 'numpy')
+        self.v0 = qu.rand_ket(2**n)
+
+    def time_eigh_partial(self, n, backend):
+        qu.eigh(self.ham, k=4, which='SA', v0=self.v0, backend=backend)
+
+    def peakmem_eigh_partial(self, n, backend):
+        qu.eigh(self.ham, k=4, which='SA', v0=self.v0, backend=backend)
@@ -0,0 +1,85 @@
+"""Benchmarks of the main tensor network algorithms.
+"""
+import quimb.tensor as qtn
+
+
+class DMRG2Sweep:
+    params = ([16, 32, 64], [16, 32, 64])
+    param_names = ['L', 'bond_dim']
+
+    def setup(self, L, bond_dim):
+        ham = qtn.MPO_ham_heis(L)
+        p0 = qtn.MPS_rand_state(L, bond_dim)
+        self.dmrg = qtn.DMRG2(ham, bond_dims=[bond_dim], p0=p0)
+        self.sweep_opts = {'max_bond': bond_dim, 'cutoff': 1e-10,
+                           'cutoff_mode': 'rel', 'method': 'svd'}
+
+    def time_sweep(self, L, bond_dim):
+        self.dmrg.sweep('R', **self.sweep_opts)
+
+    def peakmem_sweep(self, L, bond_dim):
+        self.dmrg.sweep('R', **self.sweep_opts)
+
+
+class TEBDStep:
+    params = ([16, 32, 64], [16, 32, 64])
+    param_names = ['L', 'bond_dim']
+
+    def setup(self, L, bond_dim):
+        psi0 = qtn.MPS_neel_state(L)
+        self.tebd = qtn.TEBD(psi0, qtn.ham_1d_heis(L), dt=0.05)
+        self.tebd.split_opts['max_bond'] = bond_dim
+        # grow the bond dimension up to its maximum first
+        for _ in range(L // 2):
+            self.tebd.step()
+
+    def time_step(self, L, bond_dim):
+        self.tebd.step()
+
+    def peakmem_step(self, L, bond_dim):
+        self.tebd.step()
+
+
+class CircuitAmplitude:
+    params = ([12, 20, 28], [4, 8])
+    param_names = ['n', 'depth']
+
+    def setup(self, n, depth):
+        self.circ = qtn.circ_ansatz_1D_brickwork(n, depth)
+        self.b = '01' * (n // 2)
+        # find and cache the contraction path first
+        self.circ.amplitude(self.b)
+
+    def time_amplitude(self, n, depth):
+        self.circ.amplitude(self.b)
+
+    def peakmem_amplitude(self, n, depth):
+        self.circ.amplitude(self.b)
+
+
+class ContractBoundary:
+    params = ([4, 6, 8], [2, 3])
+    param_names = ['L', 'bond_dim']
+
+    def setup(self, L, bond_dim):
+        psi = qtn.PEPS.rand(L, L, bond_dim, seed=42)
+        self.norm = psi.H & psi
+        self.max_bond = bond_dim**2
+
+    def time_contract_boundary(self, L, bond_dim):
+        self.norm.contract_boundary(max_bond=self.max_bond)
+
+    def peakmem_contract_boundary(self, L, bond_dim):
+        self.norm.contract_boundary(max_bond=self.max_bond)
+
+
+class TensorSplit:
+    params = ([(64, 64), (256, 16), (512, 512)], [None, 8],
+              ['svd', 'auto'])
+    param_names = ['shape', 'max_bond', 'method']
+
+    def setup(self, shape, max_bond, method):
+        self.t = qtn.rand_tensor(shape, inds='ab', seed=42)
+
+    def time_tensor_split(self, shape, max_bond, method):
+        self.t.split('a', max_bond=max_bond, method=method, absorb='right')
@@ -81,6 +81,7 @@ from .linalg.base_linalg import (
     sqrtm,
     expm_multiply,
     Lazy,
+    IKronLinearOperator,
 )
 from .linalg.rand_linalg import rsvd, estimate_rank
 from .linalg.mpi_launcher import get_mpi_pool
@@ -110,6 +111,7 @@ from .gen.operators import (
     cX,
     cY,
     cZ,
+    ham_from_terms,
     ham_heis,
     ham_ising,
     ham_XY,
@@ -195,6 +197,7 @@ from .calc import (
     cprint,
     decomp,
     pauli_decomp,
+    pauli_transform,
     bell_decomp,
     correlation,
     pauli_correlations,
@@ -228,6 +231,10 @@ from .linalg.approx_spectral import (
 from .utils import (
     save_to_disk,
     load_from_disk,
+    dumps_oob,
+    loads_oob,
+    profile,
+    profiled,
 )
 
 
@@ -309,6 +316,7 @@ __all__ = [
     'svds',
     'norm',
     'Lazy',
+    'IKronLinearOperator',
     'rsvd',
     'estimate_rank',
     # Gen ------------------------------------------------------------------- #
@@ -335,6 +343,7 @@ __all__ = [
     'cX',
     'cY',
     'cZ',
+    'ham_from_terms',
     'ham_heis',
     'ham_ising',
     'ham_XY',
@@ -416,6 +425,7 @@ __all__ = [
     'cprint',
     'decomp',
     'pauli_decomp',
+    'pauli_transform',
     'bell_decomp',
     'correlation',
     'pauli_correlations',
@@ -455,6 +465,10 @@ __all__ = [
     # Utils ----------------------------------------------------------------- #
     'save_to_disk',
     'load_from_disk',
+    'dumps_oob',
+    'loads_oob',
+    'profile',
+    'profiled',
     'get_thread_pool',
     'get_mpi_pool',
 ]
@@ -1090,7 +1090,7 @@ def decomp(a, fn, fn_args, fn_d, nmlz_func, mode="p", tol=1e-3):
 
     See Also
     --------
-    pauli_decomp, bell_decomp
+    pauli_decomp, pauli_transform, bell_decomp
     """
     if isvec(a):
         a = qu(a, "dop")  # make sure operator
@@ -1119,12 +1119,121 @@ def decomp(a, fn, fn_args, fn_d, nmlz_func, mode="p", tol=1e-3):
         return names_cffs
 
 
-pauli_decomp = functools.partial(decomp,
-                                 fn=pauli,
-                                 fn_args='IXYZ',
-                                 fn_d=2,
-                                 nmlz_func=lambda n: 2**-n)
-"""Decompose an operator into Paulis."""
+def pauli_transform(a):
+    """Compute the coefficients of every Pauli string in the expansion of
+    ``a``, i.e. ``tr(a @ P) / 2**n`` for all ``P`` in ``{I, X, Y, Z}^n``.
+    This uses a Walsh-Hadamard-style butterfly over each qubit in turn, and
+    so takes ``O(n 4^n)`` time rather than the ``O(16^n)`` of computing each
+    overlap separately.
+
+    Parameters
+    ----------
+    a : ket or operator
+        The state or operator to transform, on ``n`` qubits.
+
+    Returns
+    -------
+    numpy.ndarray
+        The coefficients with shape ``(4,) * n``, where index ``0, 1, 2, 3``
+        along each axis corresponds to ``I, X, Y, Z`` on that qubit. Real if
+        ``a`` is hermitian.
+
+    Examples
+    --------
+    >>> c = pauli_transform(up() & down())
+    >>> c[3, 3]  # the ZZ coefficient
+    -0.25
+    """
+    if issparse(a):
+        a = a.A
+
+    a = np.asarray(a)
+    if isvec(a):
+        a = a.reshape(-1)
+        a = np.multiply.outer(a, a.conj())
+
+    n = infer_size(a)
+
+    # pair up the row and column index of each qubit -> (4,) * n
+    x = a.reshape((2,) * 2 * n)
+    x = x.transpose([ax for q in range(n) for ax in (q, q + n)])
+    x = x.reshape(4**n)
+
+    for q in range(n):
+        # view as (left qubits, i_q, j_q, right qubits)
+        x = x.reshape(4**q, 2, 2, 4**(n - q - 1))
+        a00, a01 = x[:, 0, 0], x[:, 0, 1]
+        a10, a11 = x[:, 1, 0], x[:, 1, 1]
+        y = np.empty(x.shape, dtype=np.result_type(x.dtype, complex))
+        y[:, 0, 0] = a00 + a11          # I
+        y[:, 0, 1] = a01 + a10          # X
+        y[:, 1, 0] = 1j * (a01 - a10)   # Y
+        y[:, 1, 1] = a00 - a11          # Z
+        x = y
+
+    x = x.reshape((4,) * n) / 2**n
+
+    # hermitian input -> real coefficients
+    if np.all(np.abs(x.imag) < 1e-12):
+        x = x.real
+
+    return x
+
+
+def pauli_decomp(a, mode="p", tol=1e-3, cutoff=None):
+    """Decompose an operator into Paulis, using the fast transform
+    :func:`~quimb.calc.pauli_transform`.
+
+    Parameters
+    ----------
+    a : ket or density operator
+        Operator to decompose.
+    mode :
+        String, include ``'p'`` to print the decomp and/or ``'c'`` to
+        return OrderedDict, sorted by size of contribution.
+    tol :
+        Print operators with contirbution above ``tol`` only.
+    cutoff : float, optional
+        If given, only keep coefficients with magnitude of at least this in
+        the returned (sparse) dictionary, which avoids generating names for
+        all ``4^n`` strings.
+
+    Returns
+    -------
+    None or OrderedDict:
+        Pauli operator name and expec with ``a``.
+
+    See Also
+    --------
+    pauli_transform, decomp, bell_decomp
+    """
+    c = pauli_transform(a)
+    n = c.ndim
+    c = c.reshape(-1)
+
+    mags = np.abs(c)
+    if cutoff is None:
+        locs = np.argsort(-mags, kind='stable')
+    else:
+        locs, = np.nonzero(mags >= cutoff)
+        locs = locs[np.argsort(-mags[locs], kind='stable')]
+
+    # base-4 digits of each location give the string name
+    digits = (locs[:, None] // 4**np.arange(n - 1, -1, -1)) % 4
+    names = ("".join(s) for s in np.array(tuple('IXYZ'))[digits])
+    names_cffs = collections.OrderedDict(zip(names, c[locs].tolist()))
+
+    # Print decomposition
+    if "p" in mode:
+        for x, cff in names_cffs.items():
+            if abs(cff) < 0.01:
+                break
+            dps = int(round(0.5 - np.log10(1.001 * tol)))  # decimal places
+            print(x, "{: .{prec}f}".format(cff, prec=dps))
+    # Return full calculation
+    if "c" in mode:
+        return names_cffs
+
 
 bell_decomp = functools.partial(decomp,
                                 fn=bell_state,
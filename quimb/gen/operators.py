@@ -1,18 +1,18 @@
 """Functions for generating quantum operators.
 """
-from operator import add
 import math
+import numbers
 import functools
 import itertools
-import operator
+import contextlib
 
+import numba
 import numpy as np
 import scipy.sparse as sp
-from scipy.special import comb
 
 from ..utils import isiterable, concat, unique
-from ..core import (qarray, make_immutable, get_thread_pool,
-                    par_reduce, isreal, qu, eye, kron, ikron)
+from ..core import (qarray, make_immutable, njit, pnjit, isreal, qu, eye,
+                    issparse)
 
 
 # --------------------------------------------------------------------------- #
@@ -417,6 +417,366 @@ def cZ(dtype=complex, sparse=False):
     return controlled('Z', dtype=dtype, sparse=sparse)
 
 
+# --------------------------------------------------------------------------- #
+#                  hamiltonian construction from local terms                  #
+# --------------------------------------------------------------------------- #
+
+@njit
+def _sector_counts(n, d, q):  # pragma: no cover
+    """Compute the table ``N[m, c]``: the number of configurations of ``m``
+    sites, each of local dimension ``d``, whose levels sum to ``c <= q``.
+    """
+    N = np.zeros((n + 1, q + 1), dtype=np.int64)
+    N[0, 0] = 1
+    for m in range(1, n + 1):
+        for c in range(q + 1):
+            for v in range(min(d - 1, c) + 1):
+                N[m, c] += N[m - 1, c - v]
+    return N
+
+
+@njit
+def _sector_unrank(i, n, d, q, N, levels):  # pragma: no cover
+    """Fill ``levels`` with the ``i``-th configuration of the charge ``q``
+    sector, such that configurations are in ascending computational basis
+    order.
+    """
+    c = q
+    for pos in range(n):
+        rem = n - pos - 1
+        v = 0
+        while v < d - 1:
+            if i < N[rem, c - v]:
+                break
+            i -= N[rem, c - v]
+            v += 1
+        levels[pos] = v
+        c -= v
+
+
+@njit
+def _sector_rank(levels, n, d, q, N):  # pragma: no cover
+    """Find the position of configuration ``levels`` in the charge ``q``
+    sector, the inverse of ``_sector_unrank``.
+    """
+    i, c = 0, q
+    for pos in range(n):
+        rem = n - pos - 1
+        for v in range(levels[pos]):
+            i += N[rem, c - v]
+        c -= levels[pos]
+    return i
+
+
+@pnjit
+def _sector_basis(n, d, q, N):  # pragma: no cover
+    """Get the full space computational basis indices of every state in the
+    charge ``q`` sector, in ascending order.
+    """
+    D = N[n, q]
+    basis = np.empty(D, dtype=np.int64)
+    for i in numba.prange(D):
+        levels = np.empty(n, dtype=np.int64)
+        _sector_unrank(i, n, d, q, N, levels)
+        x = 0
+        for pos in range(n):
+            x = x * d + levels[pos]
+        basis[i] = x
+    return basis
+
+
+@njit
+def _unrank(i, n, d, q, N, levels):  # pragma: no cover
+    """Fill ``levels`` with the ``i``-th basis configuration, either of the
+    full space (``q < 0``) or of the charge ``q`` sector.
+    """
+    if q < 0:
+        for pos in range(n - 1, -1, -1):
+            levels[pos] = i % d
+            i //= d
+    else:
+        _sector_unrank(i, n, d, q, N, levels)
+
+
+@njit
+def _ham_row(r, n, d, q, N, strides, sites_ptr, sites, op_ptr, op_indptr,
+             op_levels, op_data, levels, saved, cols,
+             vals):  # pragma: no cover
+    """Compute the (sorted, summed) non-zero entries of row ``r`` of the
+    hamiltonian, writing them into ``cols`` and ``vals`` and returning how
+    many there are.
+    """
+    _unrank(r, n, d, q, N, levels)
+
+    nnz = 0
+    diag = op_data[0] * 0
+    for t in range(sites_ptr.size - 1):
+        k0, k1 = sites_ptr[t], sites_ptr[t + 1]
+
+        # the local row of this term's operator
+        lr = 0
+        for s in range(k0, k1):
+            lr = lr * d + levels[sites[s]]
+
+        for z in range(op_indptr[op_ptr[t] + lr],
+                       op_indptr[op_ptr[t] + lr + 1]):
+
+            # find the change in charge and index of the local column
+            dq = dr = 0
+            for s in range(k0, k1):
+                dv = op_levels[z, s - k0] - levels[sites[s]]
+                dq += dv
+                dr += dv * strides[sites[s]]
+
+            # accumulate the (very common) diagonal entries separately
+            if dr == 0:
+                diag += op_data[z]
+
+            elif q < 0:
+                cols[nnz] = r + dr
+                vals[nnz] = op_data[z]
+                nnz += 1
+
+            # entries that leave the sector are projected out
+            elif dq == 0:
+                for s in range(k0, k1):
+                    saved[s - k0] = levels[sites[s]]
+                    levels[sites[s]] = op_levels[z, s - k0]
+                cols[nnz] = _sector_rank(levels, n, d, q, N)
+                vals[nnz] = op_data[z]
+                nnz += 1
+                for s in range(k0, k1):
+                    levels[sites[s]] = saved[s - k0]
+
+    if diag != 0.0:
+        cols[nnz] = r
+        vals[nnz] = diag
+        nnz += 1
+
+    # insertion sort (rows are short) then sum duplicates, dropping zeros
+    for a in range(1, nnz):
+        c, v = cols[a], vals[a]
+        b = a - 1
+        while (b >= 0) and (cols[b] > c):
+            cols[b + 1], vals[b + 1] = cols[b], vals[b]
+            b -= 1
+        cols[b + 1], vals[b + 1] = c, v
+
+    m = a = 0
+    while a < nnz:
+        c, v = cols[a], vals[a]
+        a += 1
+        while (a < nnz) and (cols[a] == c):
+            v += vals[a]
+            a += 1
+        if v != 0.0:
+            cols[m], vals[m] = c, v
+            m += 1
+
+    return m
+
+
+@njit
+def _chunk_bounds(r0, r1, num_chunks, i):  # pragma: no cover
+    """Get the ``i``-th of ``num_chunks`` equal divisions of ``range(r0, r1)``.
+    """
+    size = (r1 - r0 + num_chunks - 1) // num_chunks
+    return r0 + i * size, min(r0 + (i + 1) * size, r1)
+
+
+@pnjit
+def _ham_csr_count(r0, r1, num_chunks, n, d, q, N, strides, sites_ptr,
+                   sites, op_ptr, op_indptr, op_levels, op_data,
+                   max_nnz):  # pragma: no cover
+    counts = np.zeros(r1 - r0, dtype=np.int64)
+    for i in numba.prange(num_chunks):
+        levels = np.empty(n, dtype=np.int64)
+        saved = np.empty(op_levels.shape[1], dtype=np.int64)
+        cols = np.empty(max_nnz, dtype=np.int64)
+        vals = np.empty(max_nnz, dtype=op_data.dtype)
+        ra, rb = _chunk_bounds(r0, r1, num_chunks, i)
+        for r in range(ra, rb):
+            counts[r - r0] = _ham_row(
+                r, n, d, q, N, strides, sites_ptr, sites, op_ptr, op_indptr,
+                op_levels, op_data, levels, saved, cols, vals)
+    return counts
+
+
+@pnjit
+def _ham_csr_fill(r0, r1, num_chunks, n, d, q, N, strides, sites_ptr,
+                  sites, op_ptr, op_indptr, op_levels, op_data, max_nnz,
+                  indptr, indices, data):  # pragma: no cover
+    for i in numba.prange(num_chunks):
+        levels = np.empty(n, dtype=np.int64)
+        saved = np.empty(op_levels.shape[1], dtype=np.int64)
+        cols = np.empty(max_nnz, dtype=np.int64)
+        vals = np.empty(max_nnz, dtype=op_data.dtype)
+        ra, rb = _chunk_bounds(r0, r1, num_chunks, i)
+        for r in range(ra, rb):
+            m = _ham_row(
+                r, n, d, q, N, strides, sites_ptr, sites, op_ptr, op_indptr,
+                op_levels, op_data, levels, saved, cols, vals)
+            a = indptr[r - r0]
+            indices[a:a + m] = cols[:m]
+            data[a:a + m] = vals[:m]
+
+
+def _pack_terms(terms, d):
+    """Sum together terms acting on the same sites, and pack them into flat
+    arrays describing the sites and local (csr) operator of each.
+    """
+    combined = {}
+    for sites, op, *coeff in terms:
+        sites = (sites,) if isinstance(sites, numbers.Integral) else sites
+        sites = tuple(int(s) for s in sites)
+        if len(set(sites)) != len(sites):
+            raise ValueError(f"Term acts on repeated sites: {sites}.")
+        if op.shape != (d**len(sites),) * 2:
+            raise ValueError(f"Operator of shape {op.shape} doesn't match "
+                             f"the sites {sites} with local dimension {d}.")
+        op = op.A if issparse(op) else np.asarray(op)
+        if coeff:
+            op = coeff[0] * op
+        if sites in combined:
+            combined[sites] = combined[sites] + op
+        else:
+            combined[sites] = op
+
+    if not combined:
+        raise ValueError("No terms were supplied.")
+
+    ops = [sp.csr_matrix(op) for op in combined.values()]
+    dtype = np.result_type(*(op.dtype for op in ops))
+
+    # e.g. XX + YY is real, and real arithmetic is much faster
+    if np.issubdtype(dtype, np.complexfloating) and not any(
+            np.any(op.data.imag) for op in ops):
+        dtype = np.finfo(dtype).dtype
+
+    sites_ptr = np.cumsum([0, *map(len, combined)], dtype=np.int64)
+    sites = np.fromiter(concat(combined), dtype=np.int64)
+    op_ptr = np.cumsum([0, *(op.shape[0] + 1 for op in ops)], dtype=np.int64)
+    nz_offsets = np.cumsum([0, *(op.nnz for op in ops)])
+    op_indptr = np.concatenate([
+        op.indptr + nz for op, nz in zip(ops, nz_offsets)]).astype(np.int64)
+
+    # the level of each site for the local column of every non-zero entry
+    k_max = max(map(len, combined))
+    op_levels = np.zeros((nz_offsets[-1], k_max), dtype=np.int64)
+    for op, nz in zip(ops, nz_offsets):
+        k = int(round(math.log(op.shape[0], d)))
+        op_levels[nz:nz + op.nnz, :k] = np.stack(
+            np.unravel_index(op.indices, (d,) * k), axis=1)
+    op_data = np.concatenate([op.data for op in ops])
+    op_data = (op_data.real if dtype != op_data.dtype else op_data)
+    op_data = op_data.astype(dtype)
+
+    # an upper bound for the number of entries of any single row
+    max_nnz = sum(int(np.diff(op.indptr).max()) for op in ops)
+
+    return (sites_ptr, sites, op_ptr, op_indptr,
+            op_levels, op_data), max(max_nnz, 1)
+
+
+def _parse_sector(n, d, sector):
+    """Convert a total spin-z ``sector``, in the convention of
+    :func:`~quimb.gen.operators.zspin_projector` (where the spin of level
+    ``k`` of a site is ``k - S``), into a total 'charge', the sum of levels.
+    """
+    q = n * (d - 1) / 2 + sector
+    if not float(q).is_integer() or not (0 <= q <= n * (d - 1)):
+        raise ValueError(f"{sector} is not a valid spin-z sector for {n} "
+                         f"sites of local dimension {d}.")
+    return int(round(q))
+
+
+def _parse_num_threads(parallel=None, nthreads=None, default=True):
+    """Work out how many threads to build a hamiltonian with from the
+    ``parallel`` and ``nthreads`` options, ``None`` meaning all of them.
+    """
+    if parallel is None:
+        parallel = default
+    if not parallel:
+        return 1
+    return nthreads
+
+
+@contextlib.contextmanager
+def _numba_num_threads(num_threads=None):
+    """Temporarily set the number of threads numba uses, restoring the
+    previous number on exit, since the setting is otherwise global.
+    """
+    if num_threads is None:
+        yield
+        return
+
+    old_num_threads = numba.get_num_threads()
+    try:
+        numba.set_num_threads(
+            min(num_threads, numba.config.NUMBA_NUM_THREADS))
+        yield
+    finally:
+        numba.set_num_threads(old_num_threads)
+
+
+def _build_ham_from_terms(terms, n, d=2, charge=None, ownership=None,
+                          num_threads=None):
+    """Build a sparse hamiltonian from local terms by computing every
+    non-zero entry directly in two parallel numba passes - one counting the
+    entries of each row, and one filling the preallocated csr arrays.
+    Optionally restrict to the sector of states whose local levels sum to
+    ``charge`` - i.e. fixed total spin-z or particle number, without forming
+    the full space operator or a projector.
+
+    Parameters
+    ----------
+    terms : iterable of (sites, op) or (sites, op, coeff)
+        The local terms, ``op`` acting on ``sites`` in the given order.
+    n : int
+        The number of sites.
+    d : int, optional
+        The local dimension of each site.
+    charge : int, optional
+        If given, the sum of the levels of each site defining the sector. For
+        spin-1/2 this is the number of 'down' spins or particles.
+    ownership : (int, int), optional
+        If given, only build the rows ``range(*ownership)``.
+    num_threads : int, optional
+        How many threads numba should use, by default all of them.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        The hamiltonian with shape ``(D, D)``, where ``D`` is the size of the
+        space or sector, with basis states in ascending computational basis
+        order, i.e. matching :func:`~quimb.gen.operators.zspin_projector`.
+    """
+    if charge is None:
+        q, N = -1, np.zeros((1, 1), dtype=np.int64)
+        D = d**n
+    else:
+        q, N = charge, _sector_counts(n, d, charge)
+        D = int(N[n, charge])
+
+    r0, r1 = (0, D) if ownership is None else ownership
+    strides = d**np.arange(n - 1, -1, -1, dtype=np.int64)
+    packed, max_nnz = _pack_terms(terms, d)
+    if (packed[1].min() < 0) or (packed[1].max() >= n):
+        raise ValueError(f"Terms act on sites outside of range({n}).")
+    num_chunks = min(r1 - r0, 16 * numba.config.NUMBA_NUM_THREADS)
+    args = (num_chunks, n, d, q, N, strides, *packed, max_nnz)
+
+    with _numba_num_threads(num_threads):
+        counts = _ham_csr_count(r0, r1, *args)
+        indptr = np.zeros(r1 - r0 + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        indices = np.empty(indptr[-1], dtype=np.int64)
+        data = np.empty(indptr[-1], dtype=packed[-1].dtype)
+        _ham_csr_fill(r0, r1, *args, indptr, indices, data)
+
+    return sp.csr_matrix((data, indices, indptr), shape=(r1 - r0, D))
+
+
 # --------------------------------------------------------------------------- #
 #                                Hamiltonians                                 #
 # --------------------------------------------------------------------------- #
@@ -452,10 +812,65 @@ def hamiltonian_builder(fn):
     return ham_fn
 
 
+@hamiltonian_builder
+def ham_from_terms(terms, n, d=2, sector=None, parallel=None, nthreads=None,
+                   ownership=None):
+    """Construct a hamiltonian from an arbitrary list of local terms, e.g. the
+    edges of a lattice. Every non-zero entry is computed directly in a
+    parallel numba pass, rather than by summing many operators formed on the
+    full space, which is much faster and uses a fraction of the memory.
+
+    Parameters
+    ----------
+    terms : iterable of (sites, op) or (sites, op, coeff)
+        The local terms, with operator ``op`` acting on ``sites`` in the given
+        order, optionally scaled by ``coeff``. Terms acting on the same sites
+        are summed first.
+    n : int
+        The total number of sites.
+    d : int, optional
+        The local dimension of each site.
+    sector : float, optional
+        If given, build the hamiltonian directly in this total spin-z
+        subspace, see :func:`~quimb.gen.operators.ham_heis`.
+    sparse : bool, optional
+        Whether to return the hamiltonian in sparse form.
+    stype : str, optional
+        What format of sparse operator to return if ``sparse``.
+    parallel : bool, optional
+        Whether to build the operator in parallel, by default yes.
+    nthreads : int optional
+        How many threads to use in parallel to build the operator.
+    ownership : (int, int), optional
+        If given, which range of rows to generate.
+
+    Returns
+    -------
+    H : operator
+        The hamiltonian.
+
+    Examples
+    --------
+    A transverse field ising model with next nearest neighbour interactions:
+
+    >>> n = 10
+    >>> edges = [(i, (i + k) % n) for i in range(n) for k in (1, 2)]
+    >>> terms = [(edge, pauli('Z') & pauli('Z')) for edge in edges]
+    >>> terms += [(i, pauli('X'), -0.5) for i in range(n)]
+    >>> H = ham_from_terms(terms, n, sparse=True)
+    >>> H.shape
+    (1024, 1024)
+    """
+    return _build_ham_from_terms(
+        terms, n, d=d, ownership=ownership,
+        charge=None if sector is None else _parse_sector(n, d, sector),
+        num_threads=_parse_num_threads(parallel, nthreads))
+
+
 @functools.lru_cache(maxsize=8)
 @hamiltonian_builder
 def ham_heis(n, j=1.0, b=0.0, cyclic=False,
-             parallel=False, nthreads=None, ownership=None):
+             parallel=None, nthreads=None, ownership=None, sector=None):
     """Constructs the nearest neighbour 1d heisenberg spin-1/2 hamiltonian.
 
     Parameters
@@ -481,6 +896,11 @@ def ham_heis(n, j=1.0, b=0.0, cyclic=False,
         How mny threads to use in parallel to build the operator.
     ownership : (int, int), optional
         If given, which range of rows to generate.
+    sector : float, optional
+        If given, build the hamiltonian directly in this total spin-z
+        subspace, equivalent to ``P.T @ H @ P`` with
+        ``P = zspin_projector(n, sector)`` but without ever forming the full
+        operator. ``ownership`` then refers to rows of the subspace.
     kwargs
         Supplied to :func:`~quimb.core.quimbify`.
 
@@ -489,7 +909,6 @@ def ham_heis(n, j=1.0, b=0.0, cyclic=False,
     H : immutable operator
         The Hamiltonian.
     """
-    dims = (2,) * n
     try:
         jx, jy, jz = j
     except TypeError:
@@ -501,49 +920,20 @@ def ham_heis(n, j=1.0, b=0.0, cyclic=False,
         bz = b
         bx = by = 0.0
 
-    parallel = (n > 16) if parallel is None else parallel
-
-    op_kws = {'sparse': True, 'stype': 'coo'}
-    ikron_kws = {'sparse': True, 'stype': 'coo',
-                 'coo_build': True, 'ownership': ownership}
-
-    # The basic operator (interaction and single b-field) that can be repeated.
-    two_site_term = sum(
-        j * kron(spin_operator(s, **op_kws), spin_operator(s, **op_kws))
-        for j, s in zip((jx, jy, jz), 'xyz')
-    ) - sum(
-        b * kron(spin_operator(s, **op_kws), eye(2, **op_kws))
-        for b, s in zip((bx, by, bz), 'xyz') if b != 0.0
-    )
-
-    single_site_b = sum(-b * spin_operator(s, **op_kws)
-                        for b, s in zip((bx, by, bz), 'xyz') if b != 0.0)
-
-    def gen_term(i):
-        # special case: the last b term needs to be added manually
-        if i == -1:
-            return ikron(single_site_b, dims, n - 1, **ikron_kws)
+    Sxyz = [spin_operator(s) for s in 'xyz']
 
-        # special case: the interaction between first and last spins if cyclic
-        if i == n - 1:
-            return sum(
-                j * ikron(spin_operator(s, **op_kws),
-                          dims, [0, n - 1], **ikron_kws)
-                for j, s in zip((jx, jy, jz), 'xyz') if j != 0.0)
+    # the interaction and single site b-field
+    bond = sum(j * (S & S) for j, S in zip((jx, jy, jz), Sxyz))
+    field = sum(-b * S for b, S in zip((bx, by, bz), Sxyz) if b != 0.0)
 
-        # General term, on-site b-field plus interaction with next site
-        return ikron(two_site_term, dims, [i, i + 1], **ikron_kws)
-
-    terms_needed = range(0 if not any((bx, by, bz)) else -1,
-                         n if cyclic else n - 1)
-
-    if parallel:
-        pool = get_thread_pool(nthreads)
-        ham = par_reduce(add, pool.map(gen_term, terms_needed))
-    else:
-        ham = sum(map(gen_term, terms_needed))
+    terms = [((i, (i + 1) % n), bond) for i in range(n if cyclic else n - 1)]
+    if any((bx, by, bz)):
+        terms += [((i,), field) for i in range(n)]
 
-    return ham
+    return _build_ham_from_terms(
+        terms, n, ownership=ownership,
+        charge=None if sector is None else _parse_sector(n, 2, sector),
+        num_threads=_parse_num_threads(parallel, nthreads, n > 16))
 
 
 def ham_ising(n, jz=1.0, bx=1.0, **ham_opts):
@@ -572,7 +962,8 @@ def ham_XXZ(n, delta, jxy=1.0, **ham_opts):
 
 @functools.lru_cache(maxsize=8)
 @hamiltonian_builder
-def ham_j1j2(n, j1=1.0, j2=0.5, bz=0.0, cyclic=False, ownership=None):
+def ham_j1j2(n, j1=1.0, j2=0.5, bz=0.0, cyclic=False, ownership=None,
+             sector=None):
     """Generate the j1-j2 hamiltonian, i.e. next nearest neighbour
     interactions.
 
@@ -592,6 +983,9 @@ def ham_j1j2(n, j1=1.0, j2=0.5, bz=0.0, cyclic=False, ownership=None):
         Return hamiltonian as sparse-csr operator.
     ownership : (int, int), optional
         If given, which range of rows to generate.
+    sector : float, optional
+        If given, build the hamiltonian directly in this total spin-z
+        subspace, see :func:`~quimb.gen.operators.ham_heis`.
     kwargs
         Supplied to :func:`~quimb.core.quimbify`.
 
@@ -600,13 +994,7 @@ def ham_j1j2(n, j1=1.0, j2=0.5, bz=0.0, cyclic=False, ownership=None):
     H : immutable operator
         The Hamiltonian.
     """
-    dims = (2,) * n
-
-    op_kws = {'sparse': True, 'stype': 'coo'}
-    ikron_kws = {'sparse': True, 'stype': 'coo',
-                 'coo_build': True, 'ownership': ownership}
-
-    sxyz = [spin_operator(i, **op_kws) for i in 'xyz']
+    SS = sum(S & S for S in map(spin_operator, 'xyz'))
 
     coosj1 = np.array([(i, i + 1) for i in range(n)])
     coosj2 = np.array([(i, i + 2) for i in range(n)])
@@ -616,29 +1004,14 @@ def ham_j1j2(n, j1=1.0, j2=0.5, bz=0.0, cyclic=False, ownership=None):
         coosj1 = coosj1[np.all(coosj1 < n, axis=1)]
         coosj2 = coosj2[np.all(coosj2 < n, axis=1)]
 
-    def j1_terms():
-        for coo in coosj1:
-            if abs(coo[1] - coo[0]) == 1:  # can sum then tensor (faster)
-                yield ikron(sum(op & op for op in sxyz),
-                            dims, coo, **ikron_kws)
-            else:  # tensor then sum (slower)
-                yield sum(ikron(op, dims, coo, **ikron_kws) for op in sxyz)
-
-    def j2_terms():
-        for coo in coosj2:
-            if abs(coo[1] - coo[0]) == 2:  # can add then tensor (faster)
-                yield ikron(sum(op & eye(2, **op_kws) & op for op in sxyz),
-                            dims, coo, **ikron_kws)
-            else:
-                yield sum(ikron(op, dims, coo, **ikron_kws) for op in sxyz)
-
-    ham = j1 * sum(j1_terms()) + j2 * sum(j2_terms())
-
+    terms = [*((coo, SS, j1) for coo in coosj1),
+             *((coo, SS, j2) for coo in coosj2)]
     if bz != 0:
-        gen_bz = (ikron([sxyz[2]], dims, i, **ikron_kws) for i in range(n))
-        ham += bz * sum(gen_bz)
+        terms += [((i,), spin_operator('z'), bz) for i in range(n)]
 
-    return ham
+    return _build_ham_from_terms(
+        terms, n, ownership=ownership,
+        charge=None if sector is None else _parse_sector(n, 2, sector))
 
 
 def _gen_mbl_random_factors(n, dh, dh_dim, dh_dist, seed=None, beta=None):
@@ -679,7 +1052,8 @@ def _gen_mbl_random_factors(n, dh, dh_dim, dh_dist, seed=None, beta=None):
 
 @hamiltonian_builder
 def ham_mbl(n, dh, j=1.0, bz=0.0, cyclic=False,
-            seed=None, dh_dist="s", dh_dim=1, beta=None, ownership=None):
+            seed=None, dh_dist="s", dh_dim=1, beta=None, ownership=None,
+            sector=None):
     """ Constructs a heisenberg hamiltonian with isotropic coupling and
     random fields acting on each spin - the many-body localized (MBL)
     spin hamiltonian.
@@ -721,6 +1095,10 @@ def ham_mbl(n, dh, j=1.0, bz=0.0, cyclic=False,
         The sparse format.
     ownership : (int, int), optional
         If given, which range of rows to generate.
+    sector : float, optional
+        If given, build the hamiltonian directly in this total spin-z
+        subspace, see :func:`~quimb.gen.operators.ham_heis`. Only sensible
+        for z-noise, ``dh_dim=1``.
     kwargs
         Supplied to :func:`~quimb.core.quimbify`.
 
@@ -735,30 +1113,31 @@ def ham_mbl(n, dh, j=1.0, bz=0.0, cyclic=False,
     """
     dhds, rs = _gen_mbl_random_factors(n, dh, dh_dim, dh_dist, seed, beta)
 
-    # the base hamiltonian ('csr' is most efficient format to add with)
-    ham = ham_heis(n=n, j=j, b=bz, cyclic=cyclic,
-                   sparse=True, stype='csr', ownership=ownership)
+    try:
+        jx, jy, jz = j
+    except TypeError:
+        jx = jy = jz = j
 
-    op_kws = {'sparse': True, 'stype': 'coo'}
-    ikron_kws = {'sparse': True, 'stype': 'coo',
-                 'coo_build': True, 'ownership': ownership}
+    Sxyz = [spin_operator(s) for s in 'xyz']
+    bond = sum(j * (S & S) for j, S in zip((jx, jy, jz), Sxyz))
 
-    def dh_terms():
-        for i in range(n):
-            # dhd - the total strength in direction x, y, or z
-            # r - the random strength in direction x, y, or z for site i
-            hdh = sum(dhd * r * spin_operator(s, **op_kws)
-                      for dhd, r, s in zip(dhds, rs[:, i], 'xyz'))
-            yield ikron(hdh, (2,) * n, i, **ikron_kws)
+    terms = [((i, (i + 1) % n), bond) for i in range(n if cyclic else n - 1)]
 
-    ham = ham + sum(dh_terms())
+    # the global and random fields
+    for i in range(n):
+        # dhd - the total strength in direction x, y, or z
+        # r - the random strength in direction x, y, or z for site i
+        hdh = sum(dhd * r * S for dhd, r, S in zip(dhds, rs[:, i], Sxyz))
+        terms.append(((i,), hdh - bz * Sxyz[2]))
 
-    return ham
+    return _build_ham_from_terms(
+        terms, n, ownership=ownership,
+        charge=None if sector is None else _parse_sector(n, 2, sector))
 
 
 @hamiltonian_builder
 def ham_heis_2D(n, m, j=1.0, bz=0.0, cyclic=False,
-                parallel=False, ownership=None):
+                parallel=None, ownership=None, sector=None):
     """Construct the 2D spin-1/2 heisenberg model hamiltonian.
 
     Parameters
@@ -779,10 +1158,12 @@ def ham_heis_2D(n, m, j=1.0, bz=0.0, cyclic=False,
     stype : {'csr', 'csc', 'coo'}, optional
         The sparse format.
     parallel : bool, optional
-        Construct the hamiltonian in parallel. Faster but might use more
-        memory.
+        Construct the hamiltonian in parallel, by default yes.
     ownership : (int, int), optional
         If given, which range of rows to generate.
+    sector : float, optional
+        If given, build the hamiltonian directly in this total spin-z
+        subspace, see :func:`~quimb.gen.operators.ham_heis`.
     kwargs
         Supplied to :func:`~quimb.core.quimbify`.
 
@@ -798,8 +1179,6 @@ def ham_heis_2D(n, m, j=1.0, bz=0.0, cyclic=False,
     except (TypeError, ValueError):
         jx = jy = jz = j
 
-    dims = [[2] * m] * n  # shape (n, m)
-
     sites = tuple(itertools.product(range(n), range(m)))
 
     # generate neighbouring pair coordinates
@@ -812,41 +1191,19 @@ def ham_heis_2D(n, m, j=1.0, bz=0.0, cyclic=False,
             if cyclic or right != 0:
                 yield ((i, j), (i, right))
 
-    # build the hamiltonian in sparse 'coo' format always for efficiency
-    op_kws = {'sparse': True, 'stype': 'coo'}
-    ikron_kws = {'sparse': True, 'stype': 'coo',
-                 'coo_build': True, 'ownership': ownership}
-
-    # generate all pairs of coordinates and directions
-    pairs_ss = tuple(itertools.product(gen_pairs(), 'xyz'))
+    Sxyz = [spin_operator(s) for s in 'xyz']
+    bond = sum(J * (S & S) for J, S in zip((jx, jy, jz), Sxyz))
 
-    # generate XX, YY and ZZ interaction from
-    #     e.g. arg ([(3, 4), (3, 5)], 'z')
-    def interactions(pair_s):
-        pair, s = pair_s
-        Sxyz = spin_operator(s, **op_kws)
-        J = {'x': jx, 'y': jy, 'z': jz}[s]
-        return ikron(J * Sxyz, dims, inds=pair, **ikron_kws)
+    # flatten the 2D coordinates in row-major order
+    terms = [((i1 * m + j1, i2 * m + j2), bond)
+             for (i1, j1), (i2, j2) in gen_pairs()]
+    if bz != 0.0:
+        terms += [((i * m + j,), Sxyz[2], bz) for i, j in sites]
 
-    # generate Z field
-    def fields(site):
-        Sz = spin_operator('z', **op_kws)
-        return ikron(bz * Sz, dims, inds=[site], **ikron_kws)
-
-    if not parallel:
-        # combine all terms
-        all_terms = itertools.chain(
-            map(interactions, pairs_ss),
-            map(fields, sites) if bz != 0.0 else ())
-        H = sum(all_terms)
-    else:
-        pool = get_thread_pool()
-        all_terms = itertools.chain(
-            pool.map(interactions, pairs_ss),
-            pool.map(fields, sites) if bz != 0.0 else ())
-        H = par_reduce(add, all_terms)
-
-    return H
+    return _build_ham_from_terms(
+        terms, n * m, ownership=ownership,
+        charge=None if sector is None else _parse_sector(n * m, 2, sector),
+        num_threads=_parse_num_threads(parallel))
 
 
 def uniq_perms(xs):
@@ -917,25 +1274,21 @@ def zspin_projector(n, sz=0, stype="csr", dtype=float):
     if not isiterable(sz):
         sz = (sz,)
 
-    p = 0
-    all_perms = []
-
+    cjs = []
     for s in sz:
         # Number of 'up' spins
         k = n / 2 + s
-        if not k.is_integer():
+        if not k.is_integer() or not (0 <= k <= n):
             raise ValueError(f"{s} is not a valid spin half subspace for {n} "
                              "spins.")
         k = int(round(k))
-        # Size of subspace
-        p += comb(n, k, exact=True)
         # Find all computational basis states with correct number of 0s and 1s
-        base_perm = '0' * (n - k) + '1' * k
-        all_perms += [uniq_perms(base_perm)]
+        cjs.append(_sector_basis(n, 2, k, _sector_counts(n, 2, k)))
 
     # Coordinates
-    cis = tuple(range(p))  # arbitrary basis
-    cjs = tuple(int("".join(perm), 2) for perm in concat(all_perms))
+    cjs = np.concatenate(cjs)
+    p = cjs.size
+    cis = np.arange(p)  # arbitrary basis
 
     # Construct matrix which projects only on to these basis states
     prj = sp.coo_matrix((np.ones(p, dtype=dtype), (cjs, cis)),
@@ -981,7 +1334,7 @@ def num(n, **qu_opts):
 @functools.lru_cache(maxsize=8)
 @hamiltonian_builder
 def ham_hubbard_hardcore(n, t=0.5, V=1., mu=1., cyclic=False,
-                         parallel=False, ownership=None):
+                         parallel=None, ownership=None, sector=None):
     """Generate the spinless fermion hopping hamiltonian.
 
     Parameters
@@ -997,10 +1350,14 @@ def ham_hubbard_hardcore(n, t=0.5, V=1., mu=1., cyclic=False,
     cyclic : bool, optional
         Whether to use periodic boundary conditions.
     parallel : bool, optional
-        Construct the hamiltonian in parallel. Faster but might use more
-        memory.
+        Construct the hamiltonian in parallel. By default will do this for
+        n >= 14.
     ownership : (int, int), optional
         If given, which range of rows to generate.
+    sector : int, optional
+        If given, build the hamiltonian directly in the subspace with this
+        many particles, without ever forming the full operator.
+        ``ownership`` then refers to rows of the subspace.
     kwargs
         Supplied to :func:`~quimb.core.quimbify`.
 
@@ -1010,34 +1367,19 @@ def ham_hubbard_hardcore(n, t=0.5, V=1., mu=1., cyclic=False,
         The hamiltonian.
     """
 
-    op_kws = {'sparse': True, 'stype': 'coo'}
-    ikron_kws = {'sparse': True, 'stype': 'csr',
-                 'coo_build': True, 'ownership': ownership}
-
-    cdag, c, cnum = (f(2, **op_kws) for f in (create, destroy, num))
+    cdag, c, cnum = (f(2) for f in (create, destroy, num))
     neighbor_term = t * ((cdag & c) + (c & cdag)) + V * (cnum & cnum)
 
-    dims = [2] * n
-
-    def terms():
-        # interacting terms
-        for i, j in [(i, i + 1) for i in range(n - 1)]:
-            yield ikron(neighbor_term, dims, (i, j), **ikron_kws)
-
-        if cyclic:
-            # can't sum terms and kron later since identity in middle
-            yield ikron([t * cdag, c], dims, (0, n - 1), **ikron_kws)
-            yield ikron([t * c, cdag], dims, (0, n - 1), **ikron_kws)
-            yield ikron([V * cnum, cnum], dims, (0, n - 1), **ikron_kws)
-
-        # single site terms
-        for i in range(n):
-            yield ikron(-mu * cnum, dims, i, **ikron_kws)
+    pairs = [(i, i + 1) for i in range(n - 1)]
+    if cyclic:
+        pairs.append((0, n - 1))
 
-    if parallel is None:
-        parallel = (n >= 14)
+    terms = [*((pair, neighbor_term) for pair in pairs),
+             *(((i,), cnum, -mu) for i in range(n))]
 
-    if parallel:
-        return par_reduce(operator.add, terms())
+    if (sector is not None) and not (0 <= sector <= n):
+        raise ValueError(f"Can't have {sector} particles on {n} sites.")
 
-    return functools.reduce(operator.add, terms())
+    return _build_ham_from_terms(
+        terms, n, charge=sector, ownership=ownership,
+        num_threads=_parse_num_threads(parallel, default=n >= 14))
@@ -2,6 +2,7 @@
 any operator which has an efficient representation of action on a vector.
 """
 import functools
+import contextlib
 from math import sqrt, log2, exp, inf, nan
 import random
 import warnings
@@ -10,7 +11,8 @@ import numpy as np
 import scipy.linalg as scla
 from scipy.ndimage.filters import uniform_filter1d
 
-from ..core import ptr, prod, vdot, njit, dot, subtract_update_, divide_update_
+from ..core import (ptr, prod, vdot, njit, dot, subtract_update_,
+                    divide_update_, get_thread_pool, _NUM_THREAD_WORKERS)
 from ..utils import int2tup, find_library, raise_cant_find_library_function
 from ..gen.rand import randn, rand_rademacher, rand_phase, seed_rand
 from ..linalg.mpi_launcher import get_mpi_pool
@@ -451,6 +453,21 @@ def calc_est_window(estimates, mean_ests, conv_n):
     return est, err
 
 
+def _parse_fns(f, pos):
+    """Normalize a single function, or sequence of functions, and the
+    corresponding ``pos`` option(s) into tuples.
+    """
+    fs = (f,) if callable(f) else tuple(f)
+    if isinstance(pos, bool):
+        pos = (pos,) * len(fs)
+    else:
+        pos = tuple(pos)
+        if len(pos) != len(fs):
+            raise ValueError("``pos`` should be a single bool or match the "
+                             f"number of functions, {len(fs)}.")
+    return fs, pos
+
+
 def single_random_estimate(A, K, bsz, beta_tol, v0, f, pos, tau, tol_scale,
                            k_min=10, verbosity=0, *, seed=None,
                            v0_opts=None, **lanczos_opts):
@@ -461,8 +478,13 @@ def single_random_estimate(A, K, bsz, beta_tol, v0, f, pos, tau, tol_scale,
         lanc_fn = construct_lanczos_tridiag
         lanczos_opts['bsz'] = bsz
 
-    estimates = []
-    mean_ests = []
+    # several functions can share the same lanczos tridiagonals
+    fs, poss = _parse_fns(f, pos)
+    nf = len(fs)
+
+    estimates = [[] for _ in range(nf)]
+    mean_ests = [[] for _ in range(nf)]
+    ests = [nan] * nf
 
     # the number of samples to check standard deviation convergence with
     conv_n = 6  # 3 pairs
@@ -474,51 +496,127 @@ def single_random_estimate(A, K, bsz, beta_tol, v0, f, pos, tau, tol_scale,
 
         try:
             Tl, Tv = lanczos_tridiag_eig(alpha, beta, check_finite=False)
-            Gf = scaling * calc_trace_fn_tridiag(Tl, Tv, f=f, pos=pos)
+            Gfs = [scaling * calc_trace_fn_tridiag(Tl, Tv, f=fi, pos=pi)
+                   for fi, pi in zip(fs, poss)]
         except scla.LinAlgError:  # pragma: no cover
             warnings.warn("Approx Spectral Gf tri-eig didn't converge.")
-            estimates.append(np.nan)
+            for i in range(nf):
+                estimates[i].append(np.nan)
             continue
 
         k = alpha.size
-        estimates.append(Gf)
 
         # check for break-down convergence (e.g. found entire subspace)
         #     in which case latest estimate should be accurate
         if abs(beta[-1]) < beta_tol:
             if verbosity >= 2:
-                print(f"k={k}: Beta breadown, returning {Gf}.")
-            return Gf
+                print(f"k={k}: Beta breadown, returning {Gfs}.")
+            return Gfs[0] if callable(f) else tuple(Gfs)
 
-        # compute an estimate and error using a window of the last few results
-        win_est, win_err = calc_est_window(estimates, mean_ests, conv_n)
+        all_converged = True
+        for i, Gf in enumerate(Gfs):
+            estimates[i].append(Gf)
 
-        # try and compute an estimate and error using exponential fit
-        fit_est, fit_err = calc_est_fit(mean_ests, conv_n, tau)
+            # compute an estimate and error using a window of the last few
+            win_est, win_err = calc_est_window(
+                estimates[i], mean_ests[i], conv_n)
 
-        # take whichever has lowest error
-        est, err = min((win_est, win_err), (fit_est, fit_err),
-                       key=lambda est_err: est_err[1])
+            # try and compute an estimate and error using exponential fit
+            fit_est, fit_err = calc_est_fit(mean_ests[i], conv_n, tau)
 
-        converged = err < tau * (abs(win_est) + tol_scale)
+            # take whichever has lowest error
+            est, err = min((win_est, win_err), (fit_est, fit_err),
+                           key=lambda est_err: est_err[1])
+            ests[i] = est
 
-        if verbosity >= 2:
+            converged = err < tau * (abs(win_est) + tol_scale)
+            all_converged &= converged
 
-            if verbosity >= 3:
-                print(f"est_win={win_est}, err_win={win_err}")
-                print(f"est_fit={fit_est}, err_fit={fit_err}")
+            if verbosity >= 2:
 
-            print(f"k={k}: Gf={Gf}, Est={est}, Err={err}")
-            if converged:
-                print(f"k={k}: Converged to tau {tau}.")
+                if verbosity >= 3:
+                    print(f"est_win={win_est}, err_win={win_err}")
+                    print(f"est_fit={fit_est}, err_fit={fit_err}")
 
-        if converged:
+                print(f"k={k}: Gf={Gf}, Est={est}, Err={err}")
+                if converged:
+                    print(f"k={k}: Converged to tau {tau}.")
+
+        if all_converged:
             break
 
+    ests = ests[0] if callable(f) else tuple(ests)
+
     if verbosity >= 1:
-        print(f"k={k}: Returning estimate {est}.")
+        print(f"k={k}: Returning estimate {ests}.")
+
+    return ests
+
+
+@contextlib.contextmanager
+def blas_thread_limits(num_threads=None):
+    """Context manager limiting the number of threads used by BLAS and OpenMP
+    in this process, if ``threadpoolctl`` is installed.
+    """
+    if (num_threads is None) or not find_library('threadpoolctl'):
+        yield
+        return
 
-    return est
+    from threadpoolctl import threadpool_limits
+    with threadpool_limits(limits=num_threads):
+        yield
+
+
+_WORKER_KWARGS = None
+
+
+def _init_estimate_worker(kwargs, num_threads):
+    """Setup a pool process to repeatedly run random estimates, so that the
+    operator itself only needs to be sent once.
+    """
+    global _WORKER_KWARGS
+    _WORKER_KWARGS = kwargs
+
+    if find_library('threadpoolctl'):
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(limits=num_threads)
+
+
+def _worker_random_estimate():
+    return single_random_estimate(**_WORKER_KWARGS)
+
+
+def _parse_parallel(parallel):
+    if parallel in (False, None):
+        return None
+    if parallel in (True, 'thread', 'threads'):
+        return 'threads'
+    if parallel in ('process', 'processes'):
+        return 'processes'
+    raise ValueError(f"``parallel={parallel}`` not understood, should be one "
+                     "of {False, True, 'threads', 'processes'}.")
+
+
+def _submit_local_estimates(kwargs, R, parallel, num_workers, num_threads):
+    """Submit ``R`` random estimates to a local pool of threads or processes,
+    returning the pool and the futures.
+    """
+    # each repeat needs to seed the random number generator independently
+    kwargs = {**kwargs, 'seed': True}
+
+    if parallel == 'threads':
+        pool = get_thread_pool(num_workers)
+        return pool, [pool.submit(single_random_estimate, **kwargs)
+                      for _ in range(R)]
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # forking processes with running thread pools is not safe
+    pool = ProcessPoolExecutor(
+        num_workers, mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_estimate_worker, initargs=(kwargs, num_threads))
+    return pool, [pool.submit(_worker_random_estimate) for _ in range(R)]
 
 
 def calc_stats(samples, mean_p, mean_s, tol, tol_scale):
@@ -561,9 +659,10 @@ def get_equivalent_real_dtype(dtype):
 
 def approx_spectral_function(A, f, tol=1e-2, *, bsz=1, R=1024, tol_scale=1,
                              tau=1e-4, k_min=10, k_max=512, beta_tol=1e-6,
-                             mpi=False, mean_p=0.7, mean_s=1.0, pos=False,
-                             v0=None, verbosity=0, single_precision='AUTO',
-                             **lanczos_opts):
+                             mpi=False, parallel=False, num_workers=None,
+                             num_threads=None, mean_p=0.7, mean_s=1.0,
+                             pos=False, v0=None, verbosity=0,
+                             single_precision='AUTO', **lanczos_opts):
     """Approximate a spectral function, that is, the quantity ``Tr(f(A))``.
 
     Parameters
@@ -571,8 +670,11 @@ def approx_spectral_function(A, f, tol=1e-2, *, bsz=1, R=1024, tol_scale=1,
     A : dense array, sparse matrix or LinearOperator
         Operator to approximate spectral function for. Should implement
         ``A.dot(vec)``.
-    f : callable
-        Scalar function with which to act on approximate eigenvalues.
+    f : callable or sequence of callable
+        Scalar function with which to act on approximate eigenvalues. If a
+        sequence of functions is given, estimate all of them at once from the
+        same set of lanczos runs, which is much cheaper than separate calls,
+        iterating until every estimate has converged.
     tol : float, optional
         Relative convergence tolerance threshold for error on mean of repeats.
         This can pretty much be relied on as the overall accuracy. See also
@@ -581,7 +683,9 @@ def approx_spectral_function(A, f, tol=1e-2, *, bsz=1, R=1024, tol_scale=1,
         Number of simultenous vector columns to use at once, 1 equating to the
         standard lanczos method. If ``bsz > 1`` then ``A`` must implement
         matrix-matrix multiplication. This is a more performant way of
-        essentially increasing ``R``, at the cost of more memory. Default: 1.
+        essentially increasing ``R``, at the cost of more memory, since ``A``
+        is streamed through memory once per block rather than per vector.
+        Can be combined with ``parallel``. Default: 1.
     R : int, optional
         The number of repeats with different initial random vectors to perform.
         Increasing this should increase accuracy as ``sqrt(R)``. Cost of
@@ -606,6 +710,18 @@ def approx_spectral_function(A, f, tol=1e-2, *, bsz=1, R=1024, tol_scale=1,
         been found, terminate early. Default: 1e-6.
     mpi : bool, optional
         Whether to parallelize repeat runs over MPI processes.
+    parallel : {False, True, 'threads', 'processes'}, optional
+        Whether to parallelize repeat runs over a local pool of threads
+        (``True`` or ``'threads'``) or processes (``'processes'``), which
+        doesn't require MPI. For processes, ``A`` and ``f`` must be
+        picklable, and are sent to each worker only once.
+    num_workers : int, optional
+        How many workers to use if ``parallel``, defaults to the number of
+        cores.
+    num_threads : int, optional
+        How many BLAS threads each worker should use if ``parallel``, defaults
+        to the number of cores divided by ``num_workers``. Requires
+        ``threadpoolctl`` to have an effect.
     mean_p : float, optional
         Factor for robustly finding mean and err of repeat estimates,
         see :func:`ext_per_trim`.
@@ -615,9 +731,10 @@ def approx_spectral_function(A, f, tol=1e-2, *, bsz=1, R=1024, tol_scale=1,
     v0 : vector, or callable
         Initial vector to iterate with, sets ``R=1`` if given. If callable, the
         function to produce a random intial vector (sequence).
-    pos : bool, optional
+    pos : bool or sequence of bool, optional
         If True, make sure any approximate eigenvalues are positive by
-        clipping below 0.
+        clipping below 0. If several functions are given, this can be
+        a sequence specifying it for each.
     verbosity : {0, 1, 2}, optional
         How much information to print while computing.
     single_precision : {'AUTO', False, True}, optional
@@ -633,13 +750,30 @@ def approx_spectral_function(A, f, tol=1e-2, *, bsz=1, R=1024, tol_scale=1,
 
     Returns
     -------
-    scalar
-        The approximate value ``Tr(f(a))``.
+    scalar or tuple of scalar
+        The approximate value ``Tr(f(a))``, or a tuple of such values if
+        several functions were supplied.
+
+    Examples
+    --------
+    Estimate the trace of the square root and entropy of a random density
+    matrix together:
+
+    >>> rho = rand_rho(2**10)
+    >>> tr_sqrt, tr_xlogx = approx_spectral_function(
+    ...     rho, [sqrt, xlogx], pos=[True, False])
 
     See Also
     --------
     construct_lanczos_tridiag
     """
+    fns, _ = _parse_fns(f, pos)
+    nf = len(fns)
+
+    parallel = _parse_parallel(parallel)
+    if mpi and parallel:
+        raise ValueError("Can't use both ``mpi`` and ``parallel``.")
+
     if single_precision == 'AUTO':
         single_precision = hasattr(A, 'astype')
     if single_precision:
@@ -662,18 +796,69 @@ def approx_spectral_function(A, f, tol=1e-2, *, bsz=1, R=1024, tol_scale=1,
               'v0': v0, 'f': f, 'pos': pos, 'tau': tau, 'k_min': k_min,
               'tol_scale': tol_scale, 'verbosity': verbosity, **lanczos_opts}
 
-    if not mpi:
+    if parallel:
+        if num_workers is None:
+            num_workers = _NUM_THREAD_WORKERS
+        if num_threads is None:
+            num_threads = max(1, _NUM_THREAD_WORKERS // num_workers)
+
+    # threads share the BLAS thread pool of this process
+    thread_limits = blas_thread_limits(
+        num_threads if parallel == 'threads' else None)
+
+    with thread_limits:
+        if mpi:
+            pool = get_mpi_pool()
+            kwargs['seed'] = True
+            futures = [pool.submit(single_random_estimate, **kwargs)
+                       for _ in range(R)]
+        elif parallel:
+            pool, futures = _submit_local_estimates(
+                kwargs, R, parallel, num_workers, num_threads)
+        else:
+            futures = None
+
+        try:
+            estimate, err = _gather_estimates(
+                kwargs, futures, R, f, nf, tol, tol_scale,
+                mean_p, mean_s, verbosity)
+        finally:
+            # the thread pool is cached, but process pools are not, and
+            #     should be shutdown even if an estimate fails
+            if parallel == 'processes':
+                for future in futures:
+                    future.cancel()
+                pool.shutdown()
+
+    if verbosity >= 1:
+        print(f"ESTIMATE is {estimate} ± {err}")
+
+    return estimate
+
+
+def _gather_estimates(kwargs, futures, R, f, nf, tol, tol_scale,
+                      mean_p, mean_s, verbosity):
+    """Collect random estimates, either computed here or via ``futures``,
+    until the mean has converged or ``R`` have been gathered.
+    """
+    if futures is None:
         def gen_results():
             for _ in range(R):
                 yield single_random_estimate(**kwargs)
     else:
-        pool = get_mpi_pool()
-        kwargs['seed'] = True
-        fs = [pool.submit(single_random_estimate, **kwargs) for _ in range(R)]
-
         def gen_results():
-            for f in fs:
-                yield f.result()
+            for future in futures:
+                yield future.result()
+
+    def get_stats():
+        if callable(f):
+            return calc_stats(samples, mean_p, mean_s, tol, tol_scale)
+
+        # compute the stats for each function separately
+        estimate, err, converged = zip(*(
+            calc_stats([x[i] for x in samples], mean_p, mean_s, tol, tol_scale)
+            for i in range(nf)))
+        return estimate, err, all(converged)
 
     # iterate through estimates, waiting for convergence
     results = gen_results()
@@ -687,8 +872,7 @@ def approx_spectral_function(A, f, tol=1e-2, *, bsz=1, R=1024, tol_scale=1,
 
         # wait a few iterations before checking error on mean breakout
         if len(samples) >= 3:
-            estimate, err, converged = calc_stats(
-                samples, mean_p, mean_s, tol, tol_scale)
+            estimate, err, converged = get_stats()
 
             if verbosity >= 1:
                 print(f"Total estimate = {estimate} ± {err}")
@@ -698,28 +882,23 @@ def approx_spectral_function(A, f, tol=1e-2, *, bsz=1, R=1024, tol_scale=1,
                     print(f"Repeat {len(samples)}: converged to tol {tol}")
                 break
 
-    if mpi:
-        # deal with remaining futures
+    if futures is not None:
+        # deal with remaining futures, using any already started
         extra_futures = []
-        for f in fs:
-            if f.done() or f.running():
-                extra_futures.append(f)
+        for future in futures[len(samples):]:
+            if future.done() or future.running():
+                extra_futures.append(future)
             else:
-                f.cancel()
+                future.cancel()
 
         if extra_futures:
-            samples.extend(f.result() for f in extra_futures)
-            estimate, err, converged = calc_stats(
-                samples, mean_p, mean_s, tol, tol_scale)
+            samples.extend(future.result() for future in extra_futures)
+            estimate, err, converged = get_stats()
 
     if estimate is None:
-        estimate, err, _ = calc_stats(
-            samples, mean_p, mean_s, tol, tol_scale)
-
-    if verbosity >= 1:
-        print(f"ESTIMATE is {estimate} ± {err}")
+        estimate, err, _ = get_stats()
 
-    return estimate
+    return estimate, err
 
 
 @functools.wraps(approx_spectral_function)
@@ -1,14 +1,17 @@
 """Backend agnostic functions for solving matrices either fully or partially.
 """
 import functools
+import itertools
 import warnings
 
 import numpy as np
 import scipy.linalg as sla
+import scipy.sparse as sp
 import scipy.sparse.linalg as spla
 
-from ..utils import raise_cant_find_library_function
-from ..core import qarray, dag, issparse, isdense, vdot, ldmul
+from ..utils import raise_cant_find_library_function, profiled
+from ..core import (qarray, dag, issparse, isdense, vdot, ldmul, prod, eye,
+                    kron, dim_map)
 from .numpy_linalg import (
     eig_numpy,
     eigs_numpy,
@@ -76,6 +79,11 @@ _EIGS_METHODS = {
 }
 
 
+def _eigensystem_partial_profile_info(A, k, *_, backend=None, **__):
+    return {'shapes': (A.shape,), 'backend': backend, 'k': k}
+
+
+@profiled('eigensystem_partial', info=_eigensystem_partial_profile_info)
 def eigensystem_partial(A, k, isherm, *, B=None, which=None, return_vecs=True,
                         sigma=None, ncv=None, tol=None, v0=None, sort=True,
                         backend=None, fallback_to_scipy=False, **backend_opts):
@@ -499,6 +507,11 @@ _EXPM_MULTIPLY_METHODS = {
 }
 
 
+def _expm_multiply_profile_info(mat, vec, backend="AUTO", **_):
+    return {'shapes': (mat.shape, vec.shape), 'backend': backend}
+
+
+@profiled('expm_multiply', info=_expm_multiply_profile_info)
 def expm_multiply(mat, vec, backend="AUTO", **kwargs):
     """Compute the action of ``expm(mat)`` on ``vec``.
 
@@ -585,6 +598,183 @@ class IdentityLinearOperator(spla.LinearOperator):
         return self.factor * mat
 
 
+def _group_ikron_ops(ops, dims, inds):
+    """Group ``ops`` placed at ``inds`` into contiguous blocks of ``dims``,
+    following the same placement rules as :func:`~quimb.core.ikron`.
+
+    Returns
+    -------
+    tuple[tuple[array, int, int]]
+        The dense local operators with the ``(start, stop)`` range of
+        subsystems each acts on.
+    """
+    if isinstance(ops, (np.ndarray, sp.spmatrix)):
+        ops = (ops,)
+
+    if np.ndim(dims) > 1:
+        dims, inds = dim_map(dims, inds)
+    elif np.ndim(inds) == 0:
+        inds = (inds,)
+
+    inds, ops = zip(*sorted(zip(inds, itertools.cycle(ops)),
+                            key=lambda x: x[0]))
+    if len(set(inds)) != len(inds):
+        raise ValueError("Can't place more than one operator on the same "
+                         f"subsystem, got inds={inds}.")
+
+    blocks = []
+    i = 0
+    while i < len(inds):
+        op = ops[i]
+        op = op.A if issparse(op) else np.asarray(op)
+        start = stop = inds[i]
+        sz = dims[start]
+        while sz < op.shape[0]:
+            stop += 1
+            i += 1
+            if (i >= len(inds)) or (inds[i] != stop):
+                raise ValueError(
+                    f"Operator of size {op.shape[0]} can't be placed on "
+                    f"the non-contiguous or too small subsystems starting at "
+                    f"{start}.")
+            sz *= dims[stop]
+        if sz != op.shape[0]:
+            raise ValueError(
+                f"Operator of size {op.shape[0]} doesn't match the dimensions "
+                f"of the subsystems {tuple(range(start, stop + 1))}.")
+        blocks.append((op, start, stop + 1))
+        i += 1
+
+    return tuple(blocks)
+
+
+class IKronLinearOperator(spla.LinearOperator):
+    """A matrix-free ``LinearOperator`` representing a sum of 'padded' tensor
+    products, i.e. ``sum(ikron(ops, dims, inds) for ops, inds in terms)``,
+    without ever constructing anything on the full space. Each term is applied
+    by reshaping the vector and acting locally with each of its operators.
+
+    Parameters
+    ----------
+    terms : sequence of (operator(s), inds) or (coeff, operator(s), inds)
+        The terms to sum, each specifying local operator(s) and the indices
+        they are placed at exactly as for :func:`~quimb.core.ikron`, with an
+        optional leading coefficient.
+    dims : sequence of int or nested sequences of int
+        The subsystem dimensions.
+    dtype : numpy.dtype, optional
+        The data type of the operator, by default inferred from the terms.
+
+    Examples
+    --------
+    Lazily build a cyclic heisenberg hamiltonian:
+
+    >>> n = 10
+    >>> Sx, Sy, Sz = map(spin_operator, 'xyz')
+    >>> terms = [((S, S), (i, (i + 1) % n))
+    ...          for i in range(n) for S in (Sx, Sy, Sz)]
+    >>> H = IKronLinearOperator(terms, dims=[2] * n)
+    >>> H
+    <1024x1024 IKronLinearOperator with dtype=complex128>
+    >>> groundenergy(H) / n
+    -0.45154463544920453
+
+    See Also
+    --------
+    quimb.core.ikron, IdentityLinearOperator
+    """
+
+    def __init__(self, terms, dims, dtype=None):
+        self.terms = []
+        self.coeffs = []
+
+        self.dims = tuple(np.ravel(dims).tolist())
+
+        for term in terms:
+            if len(term) == 3:
+                coeff, ops, inds = term
+            else:
+                (ops, inds), coeff = term, 1
+            self.coeffs.append(coeff)
+            self.terms.append(_group_ikron_ops(ops, dims, inds))
+
+        if dtype is None:
+            dtype = np.result_type(*self.coeffs, *(
+                op.dtype for term in self.terms for op, _, _ in term))
+
+        d = prod(self.dims)
+        super().__init__(dtype=dtype, shape=(d, d))
+
+    def _apply_term(self, term, x):
+        # act with each local operator in turn, viewing ``x`` as having shape
+        # (left dims, op dim, right dims * k) so that a single matmul suffices
+        k = x.shape[-1]
+        for op, start, stop in term:
+            dl = prod(self.dims[:start])
+            dr = prod(self.dims[stop:]) * k
+            x = np.matmul(op, x.reshape(dl, op.shape[1], dr))
+        return x
+
+    def _matmat(self, X):
+        X = np.asarray(X)
+        k = X.shape[1]
+        X = X.reshape(-1, 1, k)
+        Y = np.zeros(X.shape, dtype=np.result_type(self.dtype, X.dtype))
+
+        for coeff, term in zip(self.coeffs, self.terms):
+            if coeff == 1:
+                Y += self._apply_term(term, X).reshape(Y.shape)
+            else:
+                Y += coeff * self._apply_term(term, X).reshape(Y.shape)
+
+        return Y.reshape(-1, k)
+
+    def _matvec(self, x):
+        return self._matmat(np.asarray(x).reshape(-1, 1))
+
+    def _adjoint(self):
+        new = object.__new__(IKronLinearOperator)
+        new.dims = self.dims
+        new.coeffs = [np.conj(coeff) for coeff in self.coeffs]
+        new.terms = [tuple((op.conj().T, start, stop)
+                           for op, start, stop in term)
+                     for term in self.terms]
+        spla.LinearOperator.__init__(new, dtype=self.dtype, shape=self.shape)
+        return new
+
+    def trace(self):
+        """Compute the exact trace of the operator, cheaply.
+        """
+        d = prod(self.dims)
+        tr = 0.0
+        for coeff, term in zip(self.coeffs, self.terms):
+            x = coeff * d
+            for op, start, stop in term:
+                x *= np.trace(op) / prod(self.dims[start:stop])
+            tr += x
+        return tr
+
+    def to_sparse(self, stype='csr'):
+        """Explicitly construct the full operator as a sparse matrix, mostly
+        useful for testing and small sizes.
+        """
+        A = None
+        for coeff, term in zip(self.coeffs, self.terms):
+            ops, cur = [], 0
+            for op, start, stop in term:
+                if start > cur:
+                    ops.append(eye(prod(self.dims[cur:start]), sparse=True))
+                ops.append(sp.csr_matrix(op))
+                cur = stop
+            if cur < len(self.dims):
+                ops.append(eye(prod(self.dims[cur:]), sparse=True))
+
+            Ai = coeff * kron(*ops, stype=stype)
+            A = Ai if A is None else A + Ai
+
+        return A.asformat(stype)
+
+
 class Lazy:
     """A simple class representing an unconstructed matrix. This can be passed
     to, for example, MPI workers, who can then construct the matrix themselves.
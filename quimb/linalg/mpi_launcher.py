@@ -10,6 +10,7 @@ from .slepc_linalg import (
     eigs_slepc, svds_slepc, mfn_multiply_slepc, ssolve_slepc,
 )
 from ..core import _NUM_THREAD_WORKERS
+from ..utils import dumps_oob, loads_oob
 
 # Work out if already running as mpi
 if ('OMPI_COMM_WORLD_SIZE' in os.environ) or ('PMI_SIZE' in os.environ):
@@ -40,7 +41,8 @@ else:
 
 def bcast(result, comm, result_rank):
     """Broadcast a result to all workers, dispatching to proper MPI (rather
-    than pickled) communication if the result is a numpy array.
+    than pickled) communication if the result is a numpy array, or for any
+    buffers, such as the arrays of a tensor network, found when pickling it.
     """
     rank = comm.Get_rank()
 
@@ -51,9 +53,26 @@ def bcast(result, comm, result_rank):
         is_ndarray = None
     is_ndarray = comm.bcast(is_ndarray, root=result_rank)
 
-    # standard (pickle) bcast if not array
+    # pickle bcast if not array, but sending large buffers out-of-band
     if not is_ndarray:
-        return comm.bcast(result, root=result_rank)
+        if rank == result_rank:
+            header, buffers = dumps_oob(result)
+            buffers = [b.raw() for b in buffers]
+            header_sizes = header, [b.nbytes for b in buffers]
+        else:
+            header_sizes = None
+
+        header, sizes = comm.bcast(header_sizes, root=result_rank)
+
+        if rank != result_rank:
+            buffers = [bytearray(n) for n in sizes]
+
+        for b in buffers:
+            comm.Bcast(b, root=result_rank)
+
+        if rank == result_rank:
+            return result
+        return loads_oob(header, buffers)
 
     # make sure all workers have shape and dtype
     if rank == result_rank:
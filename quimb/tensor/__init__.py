@@ -1,5 +1,11 @@
 from .tensor_core import (
     set_contract_path_cache,
+    get_contract_path_cache_info,
+    calibrate_contraction_speed,
+    get_contraction_speed,
+    calibrate_split_auto,
+    get_split_auto_opts,
+    set_split_auto_opts,
     get_contract_strategy,
     set_contract_strategy,
     contract_strategy,
@@ -26,6 +32,7 @@ from .tensor_core import (
     new_bond,
     Tensor,
     TensorNetwork,
+    ContractionTree,
     PTensor,
     oset,
 )
@@ -56,6 +63,7 @@ from .tensor_gen import (
     MPO_rand_herm,
     SpinHam,
     SpinHam1D,
+    fit_exponential_sum,
     MPO_ham_ising,
     MPO_ham_XY,
     MPO_ham_heis,
@@ -124,6 +132,12 @@ from .tensor_2d_tebd import (
 
 __all__ = (
     "set_contract_path_cache",
+    "get_contract_path_cache_info",
+    "calibrate_contraction_speed",
+    "get_contraction_speed",
+    "calibrate_split_auto",
+    "get_split_auto_opts",
+    "set_split_auto_opts",
     "contract_strategy",
     "get_contract_strategy",
     "set_contract_strategy",
@@ -150,6 +164,7 @@ __all__ = (
     "new_bond",
     "Tensor",
     "TensorNetwork",
+    "ContractionTree",
     "TNLinearOperator1D",
     "PTensor",
     "oset",
@@ -179,6 +194,7 @@ __all__ = (
     "MPO_rand_herm",
     "SpinHam",
     "SpinHam1D",
+    "fit_exponential_sum",
     "MPO_ham_ising",
     "MPO_ham_XY",
     "MPO_ham_heis",
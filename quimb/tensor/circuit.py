@@ -8,6 +8,7 @@ from autoray import do, reshape
 import quimb as qu
 from ..utils import progbar as _progbar
 from ..utils import oset, partitionby, concatv, partition_all, ensure_dict
+from ..utils import profiled
 from .tensor_core import (get_tags, tags_to_oset, oset_union,
                           PTensor, Tensor, TensorNetwork, rand_uuid)
 from .tensor_gen import MPS_computational_state
@@ -1099,6 +1100,7 @@ class Circuit:
         # return a copy so we can modify it inplace
         return rho_lc.copy()
 
+    @profiled()
     def amplitude(
         self,
         b,
@@ -1162,8 +1164,12 @@ class Circuit:
         for i, x in zip(range(self.N), b):
             psi_b.isel_({psi_b.site_ind(i): int(x)})
 
-        # perform a final simplification and cast
-        psi_b.full_simplify_(seq=simplify_sequence, atol=simplify_atol)
+        # perform a final simplification and cast, each bitstring gives the
+        #     same structure so we can replay the first simplification found
+        record = self._storage.setdefault(
+            ('amplitude_simplify', simplify_sequence, simplify_atol), {})
+        psi_b.full_simplify_(seq=simplify_sequence, atol=simplify_atol,
+                             record=record)
         psi_b.astype_(dtype)
 
         # get the contraction path info
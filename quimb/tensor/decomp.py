@@ -5,6 +5,7 @@ import scipy.linalg.interpolative as sli
 from autoray import do, reshape, dag, infer_backend, astype, get_dtype_name
 
 from ..core import njit
+from ..utils import profiled
 from ..linalg.base_linalg import svds, eigh
 from ..linalg.rand_linalg import rsvd, estimate_rank
 
@@ -214,6 +215,13 @@ def _svd_numpy(x, cutoff=-1.0, cutoff_mode=3,
         raise e
 
 
+def _svd_profile_info(x, *_, **__):
+    m, n = x.shape
+    return {'shapes': (x.shape,), 'backend': infer_backend(x),
+            'flops': 4 * m * n * min(m, n)}
+
+
+@profiled('svd', info=_svd_profile_info)
 def _svd(x, cutoff=-1.0, cutoff_mode=3, max_bond=-1, absorb=0, renorm=0):
     if isinstance(x, np.ndarray):
         return _svd_numpy(x, cutoff, cutoff_mode, max_bond, absorb, renorm)
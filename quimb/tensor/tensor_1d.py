@@ -7,6 +7,7 @@ import functools
 from math import log2
 from numbers import Integral
 
+import numpy as np
 import opt_einsum as oe
 import scipy.sparse.linalg as spla
 from autoray import do, dag, reshape, conj, get_dtype_name, transpose
@@ -16,6 +17,7 @@ import quimb as qu
 from .tensor_core import (
     Tensor,
     TensorNetwork,
+    tensor_contract,
     rand_uuid,
     bonds,
     bonds_size,
@@ -964,6 +966,213 @@ def set_default_compress_mode(opts, cyclic=False):
     opts.setdefault('cutoff_mode', 'rel' if cyclic else 'rsum2')
 
 
+def _flat_obc_arrays(tn, *ind_fns):
+    """Get the arrays of the open boundary, flat 1D tensor network ``tn``,
+    each transposed to ``(left_bond, right_bond, *(f(i) for f in ind_fns))``
+    and with size 1 dummy bonds added at the ends.
+    """
+    L = tn.L
+    arrays = []
+    for i in range(L):
+        lix = (tn.bond(i - 1, i),) if i > 0 else ()
+        rix = (tn.bond(i, i + 1),) if i < L - 1 else ()
+        x = tn[i].transpose(*lix, *rix, *(f(i) for f in ind_fns)).data
+        shape = list(x.shape)
+        if i == 0:
+            shape.insert(0, 1)
+        if i == L - 1:
+            shape.insert(1, 1)
+        arrays.append(reshape(x, shape))
+    return arrays
+
+
+def _set_flat_obc_arrays(tn, arrays, *ind_fns):
+    """Inverse of :func:`_flat_obc_arrays`, inplace, the bonds of ``tn``
+    taking on the sizes of the new arrays.
+    """
+    L = tn.L
+    for i, x in enumerate(arrays):
+        lix = (tn.bond(i - 1, i),) if i > 0 else ()
+        rix = (tn.bond(i, i + 1),) if i < L - 1 else ()
+        shape = (*x.shape[:1 if i > 0 else 0],
+                 *x.shape[1:2 if i < L - 1 else 1],
+                 *x.shape[2:])
+        t = Tensor(reshape(x, shape),
+                   inds=(*lix, *rix, *(f(i) for f in ind_fns)))
+        t.transpose_like_(tn[i])
+        tn[i].modify(data=t.data)
+
+
+def _mpo_mps_zipup(Ws, xs, **split_opts):
+    """Apply the MPO arrays ``Ws``, ordered ``(left, right, upper, lower)``,
+    to the MPS arrays ``xs``, ordered ``(left, right, phys)`` and ideally
+    right canonical, using the zip-up algorithm. A carry tensor is swept from
+    left to right, each new site found by a truncated SVD of the carry
+    contracted with the next MPO and MPS tensors, such that the exact product
+    (with bond dimension D * chi) is never formed. The result is left
+    canonical.
+    """
+    L = len(xs)
+    ys = []
+
+    # the carry, with indices (new bond, mpo bond, mps bond)
+    C = do('ones', (1, 1, 1), like=xs[0])
+    for i in range(L):
+        T = oe.contract('kws,wWud,sSd->kuWS', C, Ws[i], xs[i])
+
+        if i == L - 1:
+            ys.append(reshape(T, (T.shape[0], 1, T.shape[1])))
+            break
+
+        U, C = Tensor(T, inds=('k', 'u', 'W', 'S')).split(
+            ('k', 'u'), get='arrays', absorb='right', **split_opts)
+        ys.append(transpose(U, (0, 2, 1)))
+
+    return ys
+
+
+# the density matrix eigenvalues are the squared singular values, so the
+#     singular value cutoff modes map to these, with the cutoff transformed
+_DENSITY_CUTOFF_MODES = {
+    'abs': ('abs', lambda c: c**2),
+    'rel': ('rel', lambda c: c**2),
+    'sum2': ('sum1', lambda c: c),
+    'rsum2': ('rsum1', lambda c: c),
+}
+
+
+def _mpo_mps_density(Ws, xs, cutoff=1e-10, cutoff_mode='rel',
+                     **split_opts):
+    """Apply the MPO arrays ``Ws``, ordered ``(left, right, upper, lower)``,
+    to the MPS arrays ``xs``, ordered ``(left, right, phys)``, using the
+    density matrix algorithm. The right environments of the exact product
+    with its conjugate are built first, then each new site is found, from
+    left to right, as the dominant eigenvectors of the reduced density matrix
+    of that site and the new sites to its left. The result is left canonical.
+    The ``cutoff`` is applied to the singular values of the product, as for
+    the other methods, and eigenvectors with zero weight are always dropped.
+    """
+    try:
+        cutoff_mode, fn = _DENSITY_CUTOFF_MODES[cutoff_mode]
+    except KeyError:
+        raise ValueError(f"``cutoff_mode='{cutoff_mode}'`` is not supported "
+                         "by the density matrix method.")
+    if cutoff is not None:
+        cutoff = fn(cutoff)
+
+    L = len(xs)
+
+    # ``R[i]`` is the environment right of site ``i``, with indices
+    #     (mpo bond, mps bond, conj mpo bond, conj mps bond)
+    R = [None] * L
+    R[L - 1] = do('ones', (1, 1, 1, 1), like=xs[0])
+    for i in range(L - 1, 0, -1):
+        R[i - 1] = oe.contract('wWud,sSd,WSXT,xXue,tTe->wsxt',
+                               Ws[i], xs[i], R[i],
+                               conj(Ws[i]), conj(xs[i]))
+
+    ys = []
+    C = do('ones', (1, 1, 1), like=xs[0])
+    for i in range(L):
+        T = oe.contract('kws,wWud,sSd->kuWS', C, Ws[i], xs[i])
+
+        if i == L - 1:
+            ys.append(reshape(T, (T.shape[0], 1, T.shape[1])))
+            break
+
+        rho = oe.contract('kuWS,WSXT,lvXT->kulv', T, R[i], conj(T))
+        U, s, _ = Tensor(rho, inds=('k', 'u', 'l', 'v')).split(
+            ('k', 'u'), method='eigh', get='arrays', absorb=None,
+            cutoff=cutoff, cutoff_mode=cutoff_mode, **split_opts)
+
+        # eigenvalues at the level of rounding error have zero weight
+        eps = np.finfo(get_dtype_name(s)).eps
+        k = max(int(do('sum', s > s[0] * eps * s.shape[0])), 1)
+        U = U[:, :, :k]
+        ys.append(transpose(U, (0, 2, 1)))
+
+        # project the carry into the new basis
+        C = oe.contract('kuWS,kuc->cWS', T, conj(U))
+
+    return ys
+
+
+def _mpo_mps_fit(Ws, xs, ys, max_sweeps=4, tol=1e-10):
+    """Variationally fit the MPS arrays ``ys``, ordered ``(left, right,
+    phys)`` and right canonical, to the MPO arrays ``Ws`` applied to the MPS
+    arrays ``xs``, by sweeping back and forth and setting each site to its
+    optimal value given the cached left and right environments of the overlap
+    of ``ys`` with the product. Stops once the norm of the fitted state, which
+    increases monotonically to that of the projected product, converges to
+    relative tolerance ``tol``. The result is right canonical.
+    """
+    L = len(xs)
+    ys = list(ys)
+
+    # environments of ``<y|W|x>``, with indices (y bond, mpo bond, mps bond)
+    one = do('ones', (1, 1, 1), like=xs[0])
+    Ls = [one] + [None] * (L - 1)
+    Rs = [None] * (L - 1) + [one]
+
+    def update_left(i):
+        Ls[i + 1] = oe.contract('aws,aAu,wWud,sSd->AWS',
+                                Ls[i], conj(ys[i]), Ws[i], xs[i])
+
+    def update_right(i):
+        Rs[i - 1] = oe.contract('aAu,wWud,sSd,AWS->aws',
+                                conj(ys[i]), Ws[i], xs[i], Rs[i])
+
+    def local(i):
+        return oe.contract('aws,wWud,sSd,AWS->aAu',
+                           Ls[i], Ws[i], xs[i], Rs[i])
+
+    for i in range(L - 1, 0, -1):
+        update_right(i)
+
+    old_norm = None
+    right_canonical = True
+    for _ in range(max_sweeps):
+        if right_canonical:
+            # sweep right, moving the orthogonality center with QR
+            for i in range(L - 1):
+                Q, R = Tensor(local(i), inds=('a', 'A', 'u')).split(
+                    ('a', 'u'), method='qr', get='arrays')
+                ys[i] = transpose(Q, (0, 2, 1))
+                ys[i + 1] = oe.contract('kA,ABu->kBu', R, ys[i + 1])
+                update_left(i)
+            ys[L - 1] = local(L - 1)
+            center = ys[L - 1]
+        else:
+            # sweep left, moving the orthogonality center with LQ
+            for i in range(L - 1, 0, -1):
+                Lm, Q = Tensor(local(i), inds=('a', 'A', 'u')).split(
+                    ('a',), method='lq', get='arrays')
+                ys[i] = Q
+                ys[i - 1] = oe.contract('bau,ak->bku', ys[i - 1], Lm)
+                update_right(i)
+            ys[0] = local(0)
+            center = ys[0]
+
+        right_canonical = not right_canonical
+
+        norm = do('linalg.norm', reshape(center, (-1,)))
+        converged = ((old_norm is not None) and
+                     (abs(norm - old_norm) < tol * norm))
+        if converged and right_canonical:
+            break
+        old_norm = norm
+
+    if not right_canonical:
+        # finish in right canonical form
+        for i in range(L - 1, 0, -1):
+            Lm, Q = Tensor(ys[i], inds=('a', 'A', 'u')).split(
+                ('a',), method='lq', get='arrays')
+            ys[i] = Q
+            ys[i - 1] = oe.contract('bau,ak->bku', ys[i - 1], Lm)
+
+    return ys
+
+
 class TensorNetwork1DFlat(TensorNetwork1D,
                           TensorNetwork):
     """1D Tensor network which has a flat structure.
@@ -971,6 +1180,60 @@ class TensorNetwork1DFlat(TensorNetwork1D,
 
     _EXTRA_PROPS = ('_site_tag_id', '_L')
 
+    # the number of sites known to be left and right canonical, i.e.
+    #     ``(nl, nr)`` means sites ``[0, nl)`` are left isometries and sites
+    #     ``[L - nr, L)`` are right isometries - this is updated by the
+    #     canonizing methods and lowered whenever a tensor is modified
+    _num_canonized = (0, 0)
+
+    def _site_of_tid(self, tid):
+        """Find the site of tensor ``tid`` from its site tag, if it has one.
+        """
+        prefix, _, suffix = self.site_tag_id.partition('{}')
+        for tag in self.tensor_map[tid].tags:
+            if tag.startswith(prefix) and tag.endswith(suffix):
+                site = tag[len(prefix):len(tag) - len(suffix)]
+                if site.isdigit():
+                    return int(site)
+        return None
+
+    def _mark_modified(self, tid):
+        super()._mark_modified(tid)
+
+        nl, nr = self._num_canonized
+        if not (nl or nr):
+            return
+
+        site = self._site_of_tid(tid)
+        if site is None:
+            self._num_canonized = (0, 0)
+        else:
+            self._num_canonized = (min(nl, site), min(nr, self.L - 1 - site))
+
+    def add_tensor(self, tensor, tid=None, virtual=False):
+        super().add_tensor(tensor, tid=tid, virtual=virtual)
+        self._num_canonized = (0, 0)
+
+    def _pop_tensor(self, tid):
+        self._num_canonized = (0, 0)
+        return super()._pop_tensor(tid)
+
+    def copy(self, virtual=False, deep=False):
+        new = super().copy(virtual=virtual, deep=deep)
+        new._num_canonized = self._num_canonized
+        return new
+
+    __copy__ = copy
+
+    def conj(self, mangle_inner=False, inplace=False):
+        # conjugation doesn't change which tensors are isometries
+        num_canonized = self._num_canonized
+        tn = super().conj(mangle_inner=mangle_inner, inplace=inplace)
+        tn._num_canonized = num_canonized
+        return tn
+
+    conj_ = functools.partialmethod(conj, inplace=True)
+
     def _left_decomp_site(self, i, bra=None, **split_opts):
         T1, T2 = self[i], self[i + 1]
         rix, lix = T1.filter_bonds(T2)
@@ -982,9 +1245,18 @@ class TensorNetwork1DFlat(TensorNetwork1D,
         Q.transpose_like_(T1)
         R.transpose_like_(T2)
 
+        nl, _ = self._num_canonized
         self[i].modify(data=Q.data)
         self[i + 1].modify(data=R.data)
 
+        # site i is now a left isometry - extend the canonical region
+        method = split_opts.get('method', 'svd')
+        absorb = split_opts.get('absorb', 'both')
+        isometric = ((method == 'qr') or
+                     (method not in ('lq', 'cholesky') and absorb == 'right'))
+        if isometric and (nl >= i) and not self.cyclic:
+            self._num_canonized = (i + 1, self._num_canonized[1])
+
         if bra is not None:
             bra[i].modify(data=Q.data.conj())
             bra[i + 1].modify(data=R.data.conj())
@@ -1000,9 +1272,18 @@ class TensorNetwork1DFlat(TensorNetwork1D,
         L.transpose_like_(T2)
         Q.transpose_like_(T1)
 
+        _, nr = self._num_canonized
         self[i - 1].modify(data=L.data)
         self[i].modify(data=Q.data)
 
+        # site i is now a right isometry - extend the canonical region
+        method = split_opts.get('method', 'svd')
+        absorb = split_opts.get('absorb', 'both')
+        isometric = ((method == 'lq') or
+                     (method not in ('qr', 'cholesky') and absorb == 'left'))
+        if isometric and (nr >= self.L - 1 - i) and not self.cyclic:
+            self._num_canonized = (self._num_canonized[0], self.L - i)
+
         if bra is not None:
             bra[i - 1].modify(data=L.data.conj())
             bra[i].modify(data=Q.data.conj())
@@ -1216,10 +1497,15 @@ class TensorNetwork1DFlat(TensorNetwork1D,
         where : int or sequence of int
             Which site(s) to orthogonalize around. If a sequence of int then
             make sure that section from min(where) to max(where) is orthog.
-        cur_orthog : int, sequence of int, or 'calc'
+        cur_orthog : None, int, sequence of int, or 'calc'
             If given, the current site(s), so as to shift the orthogonality
-            ceneter as efficiently as possible. If 'calc', calculate the
-            current orthogonality center.
+            ceneter as efficiently as possible. If ``'calc'``, use the
+            canonical form tracked by the canonizing methods, or if nothing is
+            tracked, calculate the current orthogonality center. Note the
+            tracked form is only invalidated by changing tensors with
+            :meth:`~quimb.tensor.tensor_core.Tensor.modify` (or adding and
+            removing tensors) - if the arrays have been changed inplace
+            directly, use ``None``, which always fully canonizes.
         bra : MatrixProductState, optional
             If supplied, simultaneously mixed canonize this MPS too, assuming
             it to be the conjugate state.
@@ -1229,6 +1515,18 @@ class TensorNetwork1DFlat(TensorNetwork1D,
         else:
             i, j = min(where), max(where)
 
+        if (cur_orthog == 'calc') and (not self.cyclic):
+            nl, nr = self._num_canonized
+
+            if not (nl or nr):
+                # nothing tracked -> find the canonical form explicitly
+                nl, nr = self.count_canonized()
+
+            # only (re-)canonize the sites not already in the correct form
+            self.left_canonize(start=nl, stop=i, bra=bra)
+            self.right_canonize(start=self.L - nr - 1, stop=j, bra=bra)
+            return self
+
         if cur_orthog == 'calc':
             cur_orthog = self.calc_current_orthog_center()
 
@@ -1503,6 +1801,14 @@ class TensorNetwork1DFlat(TensorNetwork1D,
         return expanded
 
     def count_canonized(self):
+        """Count the number of sites, from the left and right respectively,
+        that are isometries, by contracting the norm network. The result is
+        also tracked for use by :meth:`canonize`.
+
+        Returns
+        -------
+        num_can_l, num_can_r : int
+        """
         if self.cyclic:
             return 0, 0
 
@@ -1535,17 +1841,21 @@ class TensorNetwork1DFlat(TensorNetwork1D,
             else:
                 break
 
+        self._num_canonized = (num_can_l, num_can_r)
         return num_can_l, num_can_r
 
     def calc_current_orthog_center(self):
-        """Calculate the site(s) of the current orthogonality center.
+        """Calculate the site(s) of the current orthogonality center, using
+        the canonical form tracked by the canonizing methods if available.
 
         Returns
         -------
         int or (int, int)
             The site, or min/max, around which this MPS is orthogonal.
         """
-        lo, ro = self.count_canonized()
+        lo, ro = self._num_canonized
+        if not (lo or ro):
+            lo, ro = self.count_canonized()
         i, j = lo, self.L - ro - 1
         return i if i == j else i, j
 
@@ -2042,6 +2352,213 @@ class MatrixProductState(TensorNetwork1DVector,
 
         return Tk.contract(TO, Tb)
 
+    def correlation_matrix(self, A, B=None, sites=None, connected=False):
+        r"""Compute the correlations ``<A_i B_j>`` between every pair of sites
+        in a single sweep. Environments of the norm network are built once
+        from both ends, then for each site ``i`` the left environment with
+        ``A`` inserted is extended one site at a time, and closed with ``B``
+        and the right environment at each ``j > i``::
+
+            +-A-o-o-B-+
+            L | | | | R
+            +-o-o-o-o-+
+              i     j
+
+        such that the whole matrix costs ``O(L^2)`` small contractions, rather
+        than a full contraction for every pair.
+
+        Parameters
+        ----------
+        A : array or sequence of arrays
+            The single site operator(s) to act with on site ``i``. If a
+            sequence, the correlations for every operator are computed in the
+            same sweep.
+        B : array or sequence of arrays, optional
+            The single site operator(s) to act with on site ``j``, by default
+            the same as ``A``.
+        sites : sequence of int, optional
+            The sites to compute the correlations between, by default all.
+        connected : bool, optional
+            Whether to compute the connected correlations,
+            ``<A_i B_j> - <A_i><B_j>``, instead.
+
+        Returns
+        -------
+        C : array
+            If ``A`` and ``B`` are single operators, an array with shape
+            ``(len(sites), len(sites))`` such that ``C[i, j] = <A_i B_j>``,
+            else an array with shape ``(len(A), len(B), len(sites),
+            len(sites))`` such that ``C[a, b, i, j] = <A[a]_i B[b]_j>``.
+
+        Examples
+        --------
+        >>> ghz = (MPS_computational_state('000') +
+        ...        MPS_computational_state('111')) / 2**0.5
+        >>> ghz.correlation_matrix(pauli('Z')).real
+        array([[1., 1., 1.],
+               [1., 1., 1.],
+               [1., 1., 1.]])
+        """
+        if self.cyclic:
+            raise NotImplementedError("``correlation_matrix`` is only "
+                                      "implemented for open boundaries.")
+
+        multi = isinstance(A, (tuple, list)) or isinstance(B, (tuple, list))
+        As = tuple(A) if isinstance(A, (tuple, list)) else (A,)
+        if B is None:
+            # the 'B' operators are the same as the 'A' operators
+            Bs, b0 = As, 0
+            op_arrays = As
+        else:
+            Bs = tuple(B) if isinstance(B, (tuple, list)) else (B,)
+            b0 = len(As)
+            op_arrays = As + Bs
+
+        L = self.L
+        sites = tuple(range(L)) if sites is None else tuple(sorted(sites))
+        site_set = set(sites)
+        last = sites[-1]
+
+        # bra with distinct bonds and physical indices to insert operators
+        bra = self.H
+        bra.mangle_inner_()
+        bra_ind_id = '__bra{}__'
+        bra.reindex_sites(bra_ind_id, inplace=True)
+
+        def site_tensors(i, op=None):
+            kix, bix = self.site_ind(i), bra_ind_id.format(i)
+            if op is None:
+                return (self[i], bra[i].reindex({bix: kix}))
+            return (self[i], Tensor(op, inds=(bix, kix)), bra[i])
+
+        # ``left[i]`` and ``right[i]`` are the environments of site ``i``
+        left = [()]
+        for i in range(L - 1):
+            left.append((tensor_contract(*left[i], *site_tensors(i)),))
+        right = [()]
+        for i in range(L - 1, 0, -1):
+            right.append((tensor_contract(*site_tensors(i), *right[-1]),))
+        right.reverse()
+
+        norm = tensor_contract(*left[0], *site_tensors(0), *right[0])
+
+        def local(i, op):
+            return tensor_contract(*left[i], *site_tensors(i, op), *right[i])
+
+        # ``pairs[x, y, i, j]`` is ``<X_i Y_j>`` for ``i < j`` only
+        pairs = {}
+        for i in sites:
+            if i == last:
+                break
+
+            for x, X in enumerate(op_arrays):
+                env = tensor_contract(*left[i], *site_tensors(i, X))
+
+                for j in range(i + 1, last + 1):
+                    if j in site_set:
+                        for y, Y in enumerate(op_arrays):
+                            pairs[x, y, i, j] = tensor_contract(
+                                env, *site_tensors(j, Y), *right[j])
+                    if j != last:
+                        env = tensor_contract(env, *site_tensors(j))
+
+        if connected:
+            expecs = {(x, i): local(i, X) / norm
+                      for x, X in enumerate(op_arrays) for i in sites}
+
+        def correlation(a, b, i, j):
+            if i < j:
+                c = pairs[a, b0 + b, i, j]
+            elif i > j:
+                c = pairs[b0 + b, a, j, i]
+            else:
+                c = local(i, As[a] @ Bs[b])
+            c = c / norm
+
+            if connected:
+                c = c - expecs[a, i] * expecs[b0 + b, j]
+
+            return c
+
+        C = np.array([[[[correlation(a, b, i, j) for j in sites]
+                        for i in sites]
+                       for b in range(len(Bs))]
+                      for a in range(len(As))])
+
+        if not multi:
+            return C[0, 0]
+        return C
+
+    def sample(self, C, seed=None, batch_size=1024):
+        """Generate ``C`` computational basis samples from this MPS, along
+        with their probabilities. A copy of the state is first canonized at
+        the first site, after which the marginal distribution of each
+        successive site, conditioned on the outcomes so far, only depends on
+        the sites to its left. Samples are drawn in batches, such that each
+        site is a single contraction for the whole batch.
+
+        Parameters
+        ----------
+        C : int
+            The number of samples to generate.
+        seed : None or int, optional
+            A random seed, passed to ``numpy.random.default_rng``.
+        batch_size : int, optional
+            How many samples to draw at once.
+
+        Yields
+        ------
+        config : tuple[int]
+            The sampled outcome of each site.
+        omega : float
+            The probability of ``config``, i.e. ``|<config|psi>|^2`` for a
+            normalized state.
+        """
+        if self.cyclic:
+            raise NotImplementedError("``sample`` is only implemented for "
+                                      "open boundaries.")
+
+        L = self.L
+        rng = np.random.default_rng(seed)
+
+        # the rest of the chain is then right canonical - canonize a copy so
+        #     as not to change the tensors of this state
+        psi = self.copy()
+        psi.canonize(0)
+
+        # arrays with shape (left bond, right bond, physical)
+        arrays = [do('to_numpy', x)
+                  for x in _flat_obc_arrays(psi, psi.site_ind)]
+
+        for c0 in range(0, C, batch_size):
+            B = min(batch_size, C - c0)
+            batch = np.arange(B)
+            configs = np.empty((B, L), dtype=int)
+            omegas = np.ones(B)
+
+            # the left environment of each sample, given its outcomes so far
+            v = np.ones((B, 1))
+            for i, x in enumerate(arrays):
+                # (B, l) @ (l, r, p) -> (B, r, p)
+                w = np.tensordot(v, x, axes=1)
+
+                # right part is isometric -> marginal is just the local norm
+                p = np.sum(abs(w)**2, axis=1)
+                p /= p.sum(axis=1, keepdims=True)
+
+                # sample each outcome via the cumulative distribution
+                r = rng.random((B, 1))
+                xi = np.minimum((p.cumsum(axis=1) < r).sum(axis=1),
+                                p.shape[1] - 1)
+                configs[:, i] = xi
+                omegas *= p[batch, xi]
+
+                v = w[batch, :, xi]
+                v /= np.linalg.norm(v, axis=1, keepdims=True)
+
+            for config, omega in zip(configs.tolist(), omegas.tolist()):
+                yield tuple(config), omega
+
     def schmidt_values(self, i, cur_orthog=None, method='svd'):
         r"""Find the schmidt values associated with the bipartition of this
         MPS between sites on either site of ``i``. In other words, ``i`` is the
@@ -2875,7 +3392,49 @@ class MatrixProductOperator(TensorNetwork1DOperator,
 
         return AB
 
-    def apply(self, other, compress=False, **compress_opts):
+    def _apply_mps_approx(self, other, method, max_sweeps=4, tol=1e-10,
+                          **compress_opts):
+        if self.cyclic or other.cyclic:
+            raise NotImplementedError(
+                f"``method='{method}'`` is only implemented for open "
+                "boundary conditions.")
+
+        set_default_compress_mode(compress_opts)
+
+        # the zip-up algorithm is most accurate on a right canonical state
+        x = other.copy()
+        x.right_canonize()
+
+        Ws = _flat_obc_arrays(self, self.upper_ind, self.lower_ind)
+        xs = _flat_obc_arrays(x, x.site_ind)
+
+        if method == 'density':
+            ys = _mpo_mps_density(Ws, xs, **compress_opts)
+            _set_flat_obc_arrays(x, ys, x.site_ind)
+            return x
+
+        # the zip-up truncates without an orthonormal right environment, so
+        #     only do so loosely, leaving the final sweep to fix the bonds
+        zipup_opts = dict(compress_opts)
+        if zipup_opts.get('cutoff', 1e-10) is not None:
+            zipup_opts['cutoff'] = zipup_opts.get('cutoff', 1e-10) / 10
+        if zipup_opts.get('max_bond', None) is not None:
+            zipup_opts['max_bond'] = 2 * zipup_opts['max_bond']
+
+        ys = _mpo_mps_zipup(Ws, xs, **zipup_opts)
+        _set_flat_obc_arrays(x, ys, x.site_ind)
+
+        # the zip-up is left canonical, so a final sweep fixes the truncation
+        x.right_compress(**compress_opts)
+
+        if method == 'fit':
+            ys = _mpo_mps_fit(Ws, xs, _flat_obc_arrays(x, x.site_ind),
+                              max_sweeps=max_sweeps, tol=tol)
+            _set_flat_obc_arrays(x, ys, x.site_ind)
+
+        return x
+
+    def apply(self, other, compress=False, method='direct', **compress_opts):
         r"""Act with this MPO on another MPO or MPS, such that the resulting
         object has the same tensor network structure/indices as ``other``.
 
@@ -2914,17 +3473,52 @@ class MatrixProductOperator(TensorNetwork1DOperator,
         other : MatrixProductOperator or MatrixProductState
             The object to act on.
         compress : bool, optional
-            Whether to compress the resulting object.
+            Whether to compress the resulting object, only relevant for
+            ``method='direct'``, since the other methods always compress.
+        method : {'direct', 'zipup', 'fit', 'density'}, optional
+            How to apply this MPO to a MPS:
+
+                - ``'direct'``: contract the MPO into the MPS exactly, such
+                  that the bond dimensions multiply, then optionally compress.
+                - ``'zipup'``: sweep a carry tensor along the chain, finding
+                  each new site by a loosely truncated SVD (with ten times
+                  smaller ``cutoff`` and twice the ``max_bond``), then perform
+                  a final compression sweep.
+                - ``'fit'``: start from the ``'zipup'`` result then
+                  variationally fit it to the exact product, using cached
+                  left and right environments. ``max_sweeps`` and ``tol`` can
+                  be supplied to control the number of (half) sweeps.
+                - ``'density'``: the density matrix algorithm, finding each
+                  new site from the dominant eigenvectors of the reduced
+                  density matrix of the exact product.
+
+            The non-direct methods never form the exact product and truncate
+            according to ``max_bond`` and ``cutoff`` as they go. For backwards
+            compatibility, any other value is used as the ``method`` of the
+            compression.
         compress_opts
-            Supplied to :meth:`TensorNetwork1DFlat.compress`.
+            Supplied to :meth:`TensorNetwork1DFlat.compress`, or for the
+            non-direct methods, the truncations, see
+            :func:`~quimb.tensor.tensor_core.tensor_split`.
 
         Returns
         -------
         MatrixProductOperator or MatrixProductState
         """
+        if method not in ('direct', 'zipup', 'fit', 'density'):
+            # the decomposition method used to compress
+            compress_opts['method'] = method
+            method = 'direct'
+
         if isinstance(other, MatrixProductState):
+            if method != 'direct':
+                return self._apply_mps_approx(other, method, **compress_opts)
             return self._apply_mps(other, compress=compress, **compress_opts)
         elif isinstance(other, MatrixProductOperator):
+            if method != 'direct':
+                raise NotImplementedError(
+                    f"``method='{method}'`` is only implemented for applying "
+                    "to a MatrixProductState.")
             return self._apply_mpo(other, compress=compress, **compress_opts)
         else:
             raise TypeError("Can only Dot with a MatrixProductOperator or a "
@@ -4,7 +4,7 @@ import numpy as np
 from autoray import do, to_numpy, dag
 
 from ..core import qarray, eye, kron
-from ..utils import ensure_dict, continuous_progbar, deprecated
+from ..utils import ensure_dict, continuous_progbar, deprecated, profiled
 from ..utils import progbar as qu_progbar
 from .array_ops import norm_fro
 
@@ -473,6 +473,7 @@ class TEBD:
         self._step_order2(tau2, **sweep_opts)
         self._step_order2(tau1, **sweep_opts)
 
+    @profiled()
     def step(self, order=2, dt=None, progbar=None, **sweep_opts):
         """Perform a single step of time ``self.dt``.
         """
@@ -2,14 +2,19 @@
 """
 import os
 import copy
+import time
 import uuid
 import math
+import heapq
 import string
+import struct
 import weakref
+import zipfile
 import operator
 import functools
 import itertools
 import contextlib
+import json
 import collections
 from numbers import Integral
 
@@ -19,9 +24,10 @@ import scipy.sparse.linalg as spla
 from autoray import (do, conj, reshape, transpose, astype,
                      infer_backend, get_dtype_name, dag)
 
-from ..core import qarray, prod, realify_scalar, vdot, common_type
+from ..core import (qarray, prod, realify_scalar, vdot, common_type,
+                    get_thread_pool)
 from ..utils import (check_opt, oset, concat, frequencies,
-                     merge_with, valmap, ensure_dict)
+                     merge_with, valmap, ensure_dict, profiled)
 from ..gen.rand import randn, seed_rand
 from . import decomp
 from .array_ops import (iscomplex, norm_fro, unitize, ndim, asarray, PArray,
@@ -102,13 +108,219 @@ def _get_contract_info(eq, *shapes, **kwargs):
     return oe.contract_path(eq, *shapes, shapes=True, **kwargs)[1]
 
 
-_CONTRACT_PATH_CACHE = None
+def _mix_hash(x):
+    """Vectorized 'splitmix64' finalizer, scrambling uint64 array ``x``.
+    """
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xbf58476d1ce4e5b9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94d049bb133111eb)
+    return x ^ (x >> np.uint64(31))
+
+
+def _canonicalize_contraction(eq, shapes, max_ties_broken=4):
+    """Find a canonical form of the contraction ``eq`` with ``shapes``, such
+    that contractions which only differ by the names of their indices, the
+    order of their output indices or the order of their inputs (up to a few
+    symmetries) map to the same key. Inputs are sorted by a label independent
+    signature, refined by their neighbours' signatures until stable, then
+    indices are relabelled by first appearance.
+
+    Returns
+    -------
+    canonical_eq : str
+        The relabelled, reordered equation.
+    canonical_shapes : tuple[tuple[int]]
+        The correspondingly reordered shapes.
+    perm : tuple[int]
+        The original position of each canonical input.
+    """
+    lhs, rhs = eq.split('->')
+    terms = lhs.split(',')
+    nterms = len(terms)
+
+    ix_terms = collections.defaultdict(list)
+    ix_sizes = {}
+    for i, (term, shape) in enumerate(zip(terms, shapes)):
+        for p, (ix, d) in enumerate(zip(term, shape)):
+            ix_terms[ix].append((i, p))
+            ix_sizes[ix] = d
+
+    # every (term, position, index) 'slot' and the other terms it connects to
+    slot_term, slot_sig = [], []
+    edge_slot, edge_term, edge_pos = [], [], []
+    for i, term in enumerate(terms):
+        for p, ix in enumerate(term):
+            s = len(slot_term)
+            slot_term.append(i)
+            slot_sig.append((p, ix_sizes[ix], len(ix_terms[ix]), ix in rhs))
+            for j, q in ix_terms[ix]:
+                if j != i:
+                    edge_slot.append(s)
+                    edge_term.append(j)
+                    edge_pos.append(q)
+
+    slot_term = np.array(slot_term, dtype=np.int64)
+    slot_sig = _mix_hash(np.array(slot_sig, dtype=np.uint64) @
+                         np.array([1, 2**16, 2**32, 2**48], dtype=np.uint64))
+    edge_slot = np.array(edge_slot, dtype=np.int64)
+    edge_term = np.array(edge_term, dtype=np.int64)
+    edge_pos = np.array(edge_pos, dtype=np.uint64)
+
+    def combine(sigs, slot_vals):
+        new_sigs = np.zeros(nterms, dtype=np.uint64)
+        np.add.at(new_sigs, slot_term, _mix_hash(slot_sig + slot_vals))
+        return _mix_hash(sigs + new_sigs)
+
+    def refine(sigs):
+        # repeatedly distinguish terms by their neighbours' signatures
+        num_classes = np.unique(sigs).size
+        while num_classes < nterms:
+            slot_vals = np.zeros(slot_term.size, dtype=np.uint64)
+            np.add.at(slot_vals, edge_slot,
+                      _mix_hash(sigs[edge_term] + edge_pos))
+            sigs = combine(sigs, slot_vals)
+            new_num_classes = np.unique(sigs).size
+            if new_num_classes == num_classes:
+                break
+            num_classes = new_num_classes
+        return sigs
+
+    sigs = refine(combine(np.zeros(nterms, dtype=np.uint64),
+                          np.zeros(slot_term.size, dtype=np.uint64)))
+
+    # break remaining ties, e.g. from symmetries, by singling out one term
+    for _ in range(max_ties_broken):
+        uniq, inverse, counts = np.unique(
+            sigs, return_inverse=True, return_counts=True)
+        if counts.max() == 1:
+            break
+        i = np.flatnonzero(counts[inverse] > 1)[0]
+        sigs = sigs.copy()
+        sigs[i:i + 1] = _mix_hash(sigs[i:i + 1] + np.uint64(1))
+        sigs = refine(sigs)
+
+    perm = np.argsort(sigs, kind='stable').tolist()
+
+    symbols = {}
+    for ix in concat(terms[i] for i in perm):
+        if ix not in symbols:
+            symbols[ix] = oe.get_symbol(len(symbols))
+
+    # the path doesn't depend on the order of the output indices
+    canonical_eq = (
+        ",".join("".join(map(symbols.__getitem__, terms[i])) for i in perm) +
+        "->" + "".join(sorted(map(symbols.__getitem__, rhs))))
+    canonical_shapes = tuple(tuple(shapes[i]) for i in perm)
+    return canonical_eq, canonical_shapes, tuple(perm)
+
+
+def _permute_contract_path(path, perm):
+    """Convert the contraction ``path`` for inputs ordered like ``perm`` (the
+    original position of each input) to a path for the original inputs.
+    """
+    ssa_path = oe.paths.linear_to_ssa(path)
+    n = len(perm)
+    ssa_path = tuple(
+        tuple(perm[i] if i < n else i for i in con) for con in ssa_path)
+    return tuple(map(tuple, oe.paths.ssa_to_linear(ssa_path)))
+
+
+class ContractPathCache:
+    """A cache of contraction paths, keyed on the canonical form of each
+    contraction, so that contractions differing only by index names or input
+    order share the same path. Optionally persist paths to disk using
+    ``diskcache`` (https://pypi.org/project/diskcache/), such that they can
+    be shared between processes, with least-recently-used eviction.
+
+    Parameters
+    ----------
+    directory : None or path, optional
+        If a path, use ``diskcache.Cache`` there as the persistent store.
+    max_size : int, optional
+        If not using disk, the maximum number of paths to keep in memory.
+    disk_size_limit : int, optional
+        If using disk, the maximum size in bytes of the store.
+    """
+
+    def __init__(self, directory=None, max_size=2**12, disk_size_limit=2**30):
+        if directory is None:
+            self._store = collections.OrderedDict()
+        else:
+            import diskcache
+            self._store = diskcache.Cache(
+                directory, size_limit=disk_size_limit,
+                eviction_policy='least-recently-used')
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.search_time = 0.0
+
+    @property
+    def on_disk(self):
+        return not isinstance(self._store, collections.OrderedDict)
+
+    def _get(self, key):
+        if self.on_disk:
+            return self._store.get(key, None)
+
+        try:
+            self._store.move_to_end(key)
+        except KeyError:
+            return None
+        return self._store[key]
+
+    def _set(self, key, path):
+        self._store[key] = path
+        if not self.on_disk:
+            while len(self._store) > self.max_size:
+                self._store.popitem(last=False)
+
+    def __call__(self, eq, *shapes, **kwargs):
+        """Get the contraction path for ``eq`` and ``shapes``, searching for
+        one only if an equivalent contraction hasn't been seen before.
+        """
+        # nothing to search for or cache
+        if eq.count(',') < 2:
+            return _get_contract_path(eq, *shapes, **kwargs)
+
+        canonical_eq, canonical_shapes, perm = _canonicalize_contraction(
+            eq, shapes)
+        key = (canonical_eq, canonical_shapes, tuple(sorted(kwargs.items())))
+
+        path = self._get(key)
+        if path is None:
+            self.misses += 1
+            t0 = time.time()
+            path = _get_contract_path(canonical_eq, *canonical_shapes,
+                                      **kwargs)
+            self.search_time += time.time() - t0
+            self._set(key, path)
+        else:
+            self.hits += 1
+
+        return _permute_contract_path(path, perm)
+
+    def info(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'search_time': self.search_time,
+            'size': len(self._store),
+        }
+
+    def close(self):
+        if self.on_disk:
+            self._store.close()
+
+
+_CONTRACT_PATH_CACHE = ContractPathCache()
 
 
 _CONTRACT_FNS = {
     # key: (get, cache)
     ('path', False): _get_contract_path,
-    ('path', True): functools.lru_cache(2**12)(_get_contract_path),
+    ('path', True): functools.lru_cache(2**12)(_CONTRACT_PATH_CACHE),
     ('expr', False): _get_contract_expr,
     ('expr', True): functools.lru_cache(2**12)(_get_contract_expr),
     ('info', False): _get_contract_info,
@@ -119,44 +331,61 @@ _CONTRACT_FNS = {
 def set_contract_path_cache(
     directory=None,
     in_mem_cache_size=2**12,
+    disk_size_limit=2**30,
 ):
     """Specify an directory to cache all contraction paths to, if a directory
     is specified ``diskcache`` (https://pypi.org/project/diskcache/) will be
-    used to write all contraction expressions / paths to.
+    used to write all contraction expressions / paths to. Paths are stored
+    under a canonical form of each contraction, so that ones differing only by
+    index names or input order are also cache hits. This also resets the
+    statistics reported by :func:`get_contract_path_cache_info`.
 
     Parameters
     ----------
     directory : None or path, optimize
         If None (the default), don't use any disk caching. If a path, supply it
         to ``diskcache.Cache`` to use as the persistent store.
-    in_mem_cache_size_expr : int, optional
-        The size of the in memory cache to use for contraction expressions.
-    in_mem_cache_size_path : int, optional
-        The size of the in memory cache to use for contraction paths.
+    in_mem_cache_size : int, optional
+        The size of the in memory caches to use for contraction paths,
+        expressions and path infos.
+    disk_size_limit : int, optional
+        The maximum size in bytes of the disk cache, after which the least
+        recently used paths are evicted.
     """
     global _CONTRACT_PATH_CACHE
 
-    if _CONTRACT_PATH_CACHE is not None:
-        _CONTRACT_PATH_CACHE.close()
-
-    if directory is None:
-        _CONTRACT_PATH_CACHE = None
-        path_fn = _get_contract_path
-    else:
-        # for size reasons we only cache actual path to disk
-        import diskcache
-        _CONTRACT_PATH_CACHE = diskcache.Cache(directory)
-        path_fn = _CONTRACT_PATH_CACHE.memoize()(_get_contract_path)
+    _CONTRACT_PATH_CACHE.close()
+    _CONTRACT_PATH_CACHE = ContractPathCache(
+        directory, max_size=in_mem_cache_size, disk_size_limit=disk_size_limit)
 
     # second layer of in memory caching applies to all functions
     _CONTRACT_FNS['path', True] = (
-        functools.lru_cache(in_mem_cache_size)(path_fn))
+        functools.lru_cache(in_mem_cache_size)(_CONTRACT_PATH_CACHE))
     _CONTRACT_FNS['expr', True] = (
         functools.lru_cache(in_mem_cache_size)(_get_contract_expr))
     _CONTRACT_FNS['info', True] = (
         functools.lru_cache(in_mem_cache_size)(_get_contract_info))
 
 
+def get_contract_path_cache_info():
+    """Get statistics about the contraction path cache.
+
+    Returns
+    -------
+    dict
+        With keys:
+
+        - ``'hits'``: the number of paths found in the canonical cache,
+          plus those found in the first, literal, in memory cache.
+        - ``'misses'``: the number of paths that had to be searched for.
+        - ``'search_time'``: the total time in seconds spent searching.
+        - ``'size'``: the number of paths currently cached.
+    """
+    info = _CONTRACT_PATH_CACHE.info()
+    info['hits'] += _CONTRACT_FNS['path', True].cache_info().hits
+    return info
+
+
 def _get_contraction(eq, shapes, optimize, cache, get, **kwargs):
     # don't cache path if using a 'single-shot' path-optimizer
     #     (you may want to run these several times, each time improving path)
@@ -291,6 +520,107 @@ def tensor_linop_backend(backend):
         set_tensor_linop_backend(orig_backend)
 
 
+_CONTRACT_CALIBRATION_FILE = os.environ.get(
+    'QUIMB_CONTRACT_CALIBRATION_FILE',
+    os.path.join(os.path.expanduser('~'), '.quimb', 'contract_speed.json'))
+_CONTRACT_CALIBRATION = {}
+
+
+def calibrate_contraction_speed(dtype='float64', size=512, repeats=3,
+                                save=True):
+    """Measure how fast this machine performs contractions of ``dtype``
+    arrays, for predicting the time a contraction will take, see
+    :meth:`~quimb.tensor.tensor_core.TensorNetwork.contraction_cost`.
+
+    Parameters
+    ----------
+    dtype : str, optional
+        The data type to time contractions of.
+    size : int, optional
+        The dimension of the square matrices to multiply for measuring the
+        throughput of large contractions.
+    repeats : int, optional
+        Take the best time out of this many repeats.
+    save : bool, optional
+        Whether to save the calibration to the file given by the environment
+        variable ``QUIMB_CONTRACT_CALIBRATION_FILE``, by default
+        ``~/.quimb/contract_speed.json``, for use in later sessions.
+
+    Returns
+    -------
+    dict
+        With keys ``'flops_per_second'``, the throughput of large
+        contractions, and ``'overhead'``, the time in seconds taken by a
+        trivially small contraction.
+    """
+    def best_time(x):
+        times = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            np.tensordot(x, x, 1)
+            times.append(time.perf_counter() - t0)
+        return min(times)
+
+    dtype = np.dtype(dtype)
+    big = np.ones((size, size), dtype=dtype)
+    small = np.ones((2, 2), dtype=dtype)
+
+    overhead = best_time(small)
+    # the flop count convention here matches that of ``opt_einsum``
+    flops = 2 * size**3
+    calibration = {
+        'flops_per_second': flops / max(best_time(big) - overhead, 1e-9),
+        'overhead': overhead,
+    }
+    _CONTRACT_CALIBRATION[dtype.name] = calibration
+
+    if save:
+        try:
+            with open(_CONTRACT_CALIBRATION_FILE) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            saved = {}
+        saved[dtype.name] = calibration
+
+        os.makedirs(os.path.dirname(_CONTRACT_CALIBRATION_FILE),
+                    exist_ok=True)
+        with open(_CONTRACT_CALIBRATION_FILE, 'w') as f:
+            json.dump(saved, f)
+
+    return calibration
+
+
+def get_contraction_speed(dtype='float64', calibrate=False):
+    """Get the calibration of contraction speed for ``dtype``, loading it from
+    the calibration file if needed.
+
+    Parameters
+    ----------
+    dtype : str, optional
+        The data type to get the calibration of.
+    calibrate : bool, optional
+        If no calibration exists yet, whether to measure (and save) one with
+        :func:`calibrate_contraction_speed`, else return ``None``.
+
+    Returns
+    -------
+    dict or None
+    """
+    dtype = np.dtype(dtype).name
+
+    if dtype not in _CONTRACT_CALIBRATION:
+        try:
+            with open(_CONTRACT_CALIBRATION_FILE) as f:
+                _CONTRACT_CALIBRATION.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+    if (dtype not in _CONTRACT_CALIBRATION) and calibrate:
+        calibrate_contraction_speed(dtype)
+
+    return _CONTRACT_CALIBRATION.get(dtype, None)
+
+
 # --------------------------------------------------------------------------- #
 #                                Tensor Funcs                                 #
 # --------------------------------------------------------------------------- #
@@ -356,9 +686,72 @@ def _inds_to_eq(all_inds, inputs, output):
     return ",".join(in_str) + "->" + out_str
 
 
+def _slice_key(nd, axes, which):
+    """Get the indexing key selecting, for each ``(axis, j)`` in ``axes``,
+    entry ``which[j]`` along ``axis`` of an array with ``nd`` dimensions.
+    """
+    key = [slice(None)] * nd
+    for ax, j in axes:
+        key[ax] = which[j]
+    return key
+
+
+@functools.lru_cache(2**12)
+def _pairwise_contract_spec(inds_a, inds_b, output_inds=None):
+    """Work out how to contract two tensors with indices ``inds_a`` and
+    ``inds_b`` directly with ``tensordot``, returning ``None`` if that isn't
+    possible, e.g. because of traces or batch (hyper) indices.
+
+    Returns
+    -------
+    axes : (tuple[int], tuple[int])
+        The axes of each tensor to sum over.
+    perm : tuple[int] or None
+        The permutation to apply to the ``tensordot`` output, if needed.
+    output_inds : tuple
+        The indices of the result.
+    """
+    set_a, set_b = set(inds_a), set(inds_b)
+    if (len(set_a) != len(inds_a)) or (len(set_b) != len(inds_b)):
+        return None
+
+    shared = set_a & set_b
+    td_inds = (tuple(ix for ix in inds_a if ix not in shared) +
+               tuple(ix for ix in inds_b if ix not in shared))
+
+    if output_inds is None:
+        output_inds = td_inds
+    elif ((len(output_inds) != len(td_inds)) or
+          (set(output_inds) != set_a ^ set_b)):
+        return None
+
+    axes = (tuple(inds_a.index(ix) for ix in shared),
+            tuple(inds_b.index(ix) for ix in shared))
+
+    if output_inds == td_inds:
+        perm = None
+    else:
+        perm = tuple(map(td_inds.index, output_inds))
+
+    return axes, perm, output_inds
+
+
 _VALID_CONTRACT_GET = {None, 'expression', 'path-info', 'symbol-map'}
 
 
+def _tensor_contract_profile_info(*tensors, backend=None, **_):
+    info = {'shapes': tuple(t.shape for t in tensors)}
+    if tensors:
+        info['backend'] = infer_backend(tensors[0]._data)
+    if len(tensors) == 2:
+        # for a pair, every combination of indices is visited once
+        size_dict = dict(zip(tensors[0].inds, tensors[0].shape))
+        size_dict.update(zip(tensors[1].inds, tensors[1].shape))
+        info['flops'] = 2 * prod(size_dict.values())
+    return info
+
+
+@profiled('tensor_contract', info=_tensor_contract_profile_info)
 def tensor_contract(*tensors, output_inds=None, get=None,
                     backend=None, **contract_opts):
     """Efficiently contract multiple tensors, combining their tags.
@@ -398,6 +791,15 @@ def tensor_contract(*tensors, output_inds=None, get=None,
     if backend is None:
         backend = _CONTRACT_BACKEND
 
+    # fast path for pairwise contractions, bypassing the einsum machinery
+    if (get is None) and (len(tensors) == 2) and (backend == 'auto'):
+        ta, tb = tensors
+        spec = _pairwise_contract_spec(
+            ta.inds, tb.inds, None if output_inds is None else
+            tuple(output_inds))
+        if spec is not None:
+            return _tensor_contract_pair(ta, tb, *spec)
+
     i_ix = tuple(t.inds for t in tensors)  # input indices per tensor
     total_ix = tuple(concat(i_ix))  # list of all input indices
     all_ix = tuple(oset(total_ix))
@@ -432,7 +834,11 @@ def tensor_contract(*tensors, output_inds=None, get=None,
     # perform the contraction
     shapes = (t.shape for t in tensors)
     expression = get_contraction(eq, *shapes, **contract_opts)
-    o_array = expression(*(t.data for t in tensors), backend=backend)
+    if len(tensors) > 1:
+        # the output is a new array, so copy-on-write data can be read as is
+        o_array = expression(*(t._data for t in tensors), backend=backend)
+    else:
+        o_array = expression(tensors[0].data, backend=backend)
 
     if not o_ix:
         if isinstance(o_array, np.ndarray):
@@ -445,6 +851,23 @@ def tensor_contract(*tensors, output_inds=None, get=None,
     return Tensor(data=o_array, inds=o_ix, tags=o_tags)
 
 
+def _tensor_contract_pair(ta, tb, axes, perm, o_ix):
+    """Contract two tensors directly with ``tensordot``, given the spec found
+    by :func:`_pairwise_contract_spec`.
+    """
+    o_array = do('tensordot', ta._data, tb._data, axes=axes)
+    if perm is not None:
+        o_array = transpose(o_array, perm)
+
+    if not o_ix:
+        # match ``opt_einsum``, which returns numpy scalars
+        if isinstance(o_array, np.ndarray):
+            o_array = o_array[()]
+        return o_array
+
+    return Tensor(data=o_array, inds=o_ix, tags=oset.union(ta.tags, tb.tags))
+
+
 # generate a random base to avoid collisions on difference processes ...
 _RAND_PREFIX = str(uuid.uuid4())[:6]
 # but then make the list orderable to help contraction caching
@@ -506,6 +929,151 @@ def _parse_split_opts(method, cutoff, absorb, max_bond, cutoff_mode, renorm):
     return opts
 
 
+# thresholds used to pick a decomposition for ``tensor_split(method='auto')``
+_SPLIT_AUTO_OPTS = {
+    # use the gram matrix eigen-decomposition, rather than the svd, if the
+    #     matrix is at least this many times taller than wide (or vice versa)
+    'eig_aspect': 4.0,
+    # use the randomized svd if ``max_bond`` is at most this fraction of the
+    #     smaller dimension ...
+    'rsvd_fraction': 0.1,
+    # ... and the smaller dimension is at least this size
+    'rsvd_min_dim': 256,
+}
+
+
+def get_split_auto_opts():
+    """Get the thresholds used by ``tensor_split(method='auto')`` to choose a
+    decomposition, see :func:`set_split_auto_opts`.
+    """
+    return dict(_SPLIT_AUTO_OPTS)
+
+
+def set_split_auto_opts(eig_aspect=None, rsvd_fraction=None,
+                        rsvd_min_dim=None):
+    """Set the thresholds used by ``tensor_split(method='auto')`` to choose a
+    decomposition. These can also be measured for the current machine with
+    :func:`calibrate_split_auto`.
+
+    Parameters
+    ----------
+    eig_aspect : float, optional
+        Use the gram matrix eigen-decomposition (``'eig'``) rather than the
+        full SVD if the matrix is at least this many times taller than it is
+        wide, or vice versa.
+    rsvd_fraction : float, optional
+        Use the randomized SVD (``'rsvd'``) if ``max_bond`` is at most this
+        fraction of the smaller matrix dimension...
+    rsvd_min_dim : int, optional
+        ...and that dimension is at least this large.
+    """
+    for k, v in (('eig_aspect', eig_aspect),
+                 ('rsvd_fraction', rsvd_fraction),
+                 ('rsvd_min_dim', rsvd_min_dim)):
+        if v is not None:
+            _SPLIT_AUTO_OPTS[k] = v
+
+
+def calibrate_split_auto(size=256, dtype='float64', repeats=3, set_opts=True):
+    """Measure the thresholds used by ``tensor_split(method='auto')`` by
+    timing the candidate decompositions of random matrices on this machine.
+
+    Parameters
+    ----------
+    size : int, optional
+        The smaller dimension of the matrices to decompose, this is also
+        used as the ``rsvd_min_dim`` threshold if the randomized SVD is found
+        to be faster.
+    dtype : str, optional
+        The data type of the matrices to decompose.
+    repeats : int, optional
+        Take the best time out of this many repeats.
+    set_opts : bool, optional
+        Whether to set the measured thresholds, see
+        :func:`set_split_auto_opts`.
+
+    Returns
+    -------
+    dict
+        The measured thresholds, with keys ``'eig_aspect'``,
+        ``'rsvd_fraction'`` and ``'rsvd_min_dim'``.
+    """
+    def best_time(method, x, max_bond=None):
+        split_fn = {'svd': decomp._svd, 'eig': decomp._eig,
+                    'rsvd': decomp._rsvd}[method]
+        opts = _parse_split_opts(method, 0.0, 'both', max_bond, 'rel', 0)
+        times = []
+        # the extra run compiles any jitted functions
+        for _ in range(repeats + 1):
+            t0 = time.perf_counter()
+            split_fn(x, **opts)
+            times.append(time.perf_counter() - t0)
+        return min(times[1:])
+
+    # the smallest aspect ratio at which the gram matrix is faster
+    eig_aspect = float('inf')
+    for aspect in (1, 2, 4, 8, 16):
+        x = randn((size * aspect, size), dtype=dtype)
+        if best_time('eig', x) < best_time('svd', x):
+            eig_aspect = float(aspect)
+            break
+
+    # the largest fraction of the full rank at which rsvd is faster
+    rsvd_fraction = 0.0
+    x = randn((size, size), dtype=dtype)
+    for fraction in (1 / 2, 1 / 4, 1 / 8, 1 / 16, 1 / 32):
+        max_bond = max(1, int(fraction * size))
+        if (best_time('rsvd', x, max_bond) <
+                best_time('svd', x, max_bond)):
+            rsvd_fraction = fraction
+            break
+
+    opts = {
+        'eig_aspect': eig_aspect,
+        'rsvd_fraction': rsvd_fraction,
+        'rsvd_min_dim': size,
+    }
+    if set_opts:
+        set_split_auto_opts(**opts)
+
+    return opts
+
+
+def _choose_split_method(m, n, max_bond, cutoff, absorb, get,
+                         randomizable=True):
+    """Choose the decomposition used by ``tensor_split(method='auto')`` for an
+    ``m`` x ``n`` matrix.
+    """
+    k = min(m, n)
+
+    # no truncation -> don't need the singular values at all
+    no_truncation = (((cutoff is None) or (cutoff <= 0.0)) and
+                     ((max_bond is None) or (max_bond >= k)))
+    if no_truncation and (get != 'values'):
+        if absorb == 'right':
+            return 'qr'
+        if absorb == 'left':
+            return 'lq'
+
+    # only a few singular values of a large matrix are needed
+    if (randomizable and (get != 'values') and (max_bond is not None) and
+            (k >= _SPLIT_AUTO_OPTS['rsvd_min_dim']) and
+            (max_bond <= _SPLIT_AUTO_OPTS['rsvd_fraction'] * k)):
+        return 'rsvd'
+
+    # very tall or flat matrix -> decompose the much smaller gram matrix
+    if max(m, n) >= _SPLIT_AUTO_OPTS['eig_aspect'] * k:
+        return 'eig'
+
+    return 'svd'
+
+
+def _tensor_split_profile_info(T, *_, method='svd', **__):
+    return {'shapes': (T.shape,), 'backend': infer_backend(T._data),
+            'method': method}
+
+
+@profiled('tensor_split', info=_tensor_split_profile_info)
 def tensor_split(
     T,
     left_inds,
@@ -548,6 +1116,12 @@ def tensor_split(
             - ``'lq'``: full LR decomposition.
             - ``'cholesky'``: full cholesky decomposition, tensor must be
               positive.
+            - ``'auto'``: choose based on the shape of the matrix and the
+              truncation requested - ``'qr'`` or ``'lq'`` if there is none
+              and ``absorb`` allows, ``'rsvd'`` if ``max_bond`` is much
+              smaller than the matrix, ``'eig'`` if the matrix is very tall
+              or flat, else ``'svd'``. See :func:`set_split_auto_opts` and
+              :func:`calibrate_split_auto` for tuning the thresholds.
 
     get : {None, 'arrays', 'tensors', 'values'}
         If given, what to return instead of a TN describing the split:
@@ -622,6 +1196,22 @@ def tensor_split(
     if right_inds is None:
         right_inds = oset(T.inds) - oset(left_inds)
 
+    if method == 'auto':
+        if renorm is None:
+            # match the renormalization the full decompositions would perform
+            renorm = _RENORM_LOOKUP.get(cutoff_mode, 0)
+
+        if isinstance(T, spla.LinearOperator):
+            m, n = prod(T.ldims), prod(T.rdims)
+            randomizable = True
+        else:
+            m = prod(T.ind_size(ix) for ix in left_inds)
+            n = prod(T.ind_size(ix) for ix in right_inds)
+            randomizable = isinstance(T._data, np.ndarray)
+
+        method = _choose_split_method(m, n, max_bond, cutoff, absorb, get,
+                                      randomizable=randomizable)
+
     if isinstance(T, spla.LinearOperator):
         left_dims = T.ldims
         right_dims = T.rdims
@@ -1193,10 +1783,121 @@ def tensor_network_distance(
     return do('real', xAA - 2 * xAB + xBB)**0.5
 
 
+def _npz_fname(fname):
+    """Append ``'.npz'`` to ``fname`` if missing, as :func:`numpy.savez`
+    does, so that the same name can be used to save and load.
+    """
+    fname = os.fspath(fname)
+    if not fname.endswith('.npz'):
+        fname += '.npz'
+    return fname
+
+
+def _meta_to_json(obj):
+    """Convert ``obj`` to a json compatible form, marking tuples so that they
+    can be restored by :func:`_meta_from_json`.
+    """
+    if isinstance(obj, tuple):
+        return {'__tuple__': [_meta_to_json(x) for x in obj]}
+    if isinstance(obj, (list, oset)):
+        return [_meta_to_json(x) for x in obj]
+    if isinstance(obj, dict):
+        return {k: _meta_to_json(v) for k, v in obj.items()}
+    if isinstance(obj, np.generic):
+        # e.g. sizes computed from array shapes
+        return obj.item()
+    return obj
+
+
+def _meta_from_json(obj):
+    """Inverse of :func:`_meta_to_json`.
+    """
+    if isinstance(obj, list):
+        return [_meta_from_json(x) for x in obj]
+    if isinstance(obj, dict):
+        if set(obj) == {'__tuple__'}:
+            return tuple(_meta_from_json(x) for x in obj['__tuple__'])
+        return {k: _meta_from_json(v) for k, v in obj.items()}
+    return obj
+
+
+def _save_arrays(fname, arrays, meta):
+    """Save ``arrays``, plus the json serializable structure ``meta``, to the
+    uncompressed ``.npz`` archive ``fname``. Each array is streamed directly to
+    disk, without making any copies.
+    """
+    members = {f'arr_{i}': do('to_numpy', x) for i, x in enumerate(arrays)}
+    meta = json.dumps(_meta_to_json({**meta, 'num_arrays': len(members)}))
+    members['__meta__'] = np.frombuffer(meta.encode(), dtype=np.uint8)
+    np.savez(_npz_fname(fname), **members)
+
+
+def _mmap_npz_member(fname, fh, info, mmap_mode):
+    """Memory-map the ``.npy`` member ``info`` of the open, uncompressed zip
+    archive ``fh``, located at ``fname``.
+    """
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f"Can't memory-map the compressed member "
+                         f"'{info.filename}' of '{fname}'.")
+
+    # skip the zip local file header, to the start of the .npy file itself
+    fh.seek(info.header_offset)
+    name_len, extra_len = struct.unpack('<HH', fh.read(30)[26:30])
+    fh.seek(info.header_offset + 30 + name_len + extra_len)
+
+    version = np.lib.format.read_magic(fh)
+    read_header = getattr(np.lib.format,
+                          'read_array_header_{}_{}'.format(*version))
+    shape, fortran_order, dtype = read_header(fh)
+
+    if prod(shape) == 0:
+        # can't map an empty region of a file
+        return np.empty(shape, dtype=dtype)
+
+    return np.memmap(fname, dtype=dtype, mode=mmap_mode, shape=shape,
+                     order='F' if fortran_order else 'C', offset=fh.tell())
+
+
+def _load_arrays(fname, mmap_mode=None):
+    """Load the arrays and structure saved with :func:`_save_arrays`. If
+    ``mmap_mode`` is given, memory-map each array from the archive in place,
+    rather than reading it into memory. Nothing is unpickled.
+    """
+    fname = _npz_fname(fname)
+
+    with np.load(fname, allow_pickle=False) as f:
+        meta = _meta_from_json(json.loads(f['__meta__'].tobytes().decode()))
+        if mmap_mode is None:
+            arrays = [f[f'arr_{i}'] for i in range(meta['num_arrays'])]
+            return arrays, meta
+
+    with open(fname, 'rb') as fh, zipfile.ZipFile(fh) as zf:
+        arrays = [
+            _mmap_npz_member(fname, fh, zf.getinfo(f'arr_{i}.npy'), mmap_mode)
+            for i in range(meta['num_arrays'])
+        ]
+
+    return arrays, meta
+
+
 # --------------------------------------------------------------------------- #
 #                                Tensor Class                                 #
 # --------------------------------------------------------------------------- #
 
+class _CowSlot:
+    """A group of tensors, each a shallow copy of the others, viewing the same
+    array, which they share copy-on-write with any other slots in
+    ``sharers``, i.e. with deep copies.
+    """
+
+    __slots__ = ('tensors', 'sharers', '__weakref__')
+
+    def __init__(self, tensors, sharers=None):
+        self.tensors = weakref.WeakSet(tensors)
+        self.sharers = weakref.WeakSet() if sharers is None else sharers
+        self.sharers.add(self)
+
+
 class Tensor(object):
     """A labelled, tagged ndarray. The index labels are used instead of
     axis numbers to identify dimensions, and are preserved through operations.
@@ -1234,16 +1935,25 @@ class Tensor(object):
 
     """
 
+    # the slot, if any, through which this tensor shares its array
+    #     copy-on-write, see ``_CowSlot``
+    _cow = None
+
     def __init__(self, data=1.0, inds=(), tags=None, left_inds=None):
         # a new or copied Tensor always has no owners
         self.owners = dict()
 
         # Short circuit for copying Tensors
         if isinstance(data, Tensor):
-            self._data = data.data
+            self._data = data._data
             self._inds = data.inds
             self._tags = data.tags.copy()
             self._left_inds = data.left_inds
+            if data._cow is not None:
+                # a shallow copy aliases the same array as its source, so
+                #     joins the same slot rather than becoming a new sharer
+                data._cow.tensors.add(self)
+                self._cow = data._cow
             return
 
         self._data = asarray(data)
@@ -1263,17 +1973,53 @@ class Tensor(object):
 
     def copy(self, deep=False):
         """Copy this tensor. Note by default (``deep=False``), the underlying
-        array will *not* be copied.
+        array will *not* be copied. If ``deep=True`` the array is shared
+        copy-on-write: it is only actually copied once either tensor exposes
+        it for possible in-place modification, via the ``data`` attribute,
+        while the other is still alive.
         """
+        t = Tensor(self, None)
         if deep:
-            return copy.deepcopy(self)
-        else:
-            return Tensor(self, None)
+            self._share_data_with(t)
+        return t
 
     __copy__ = copy
 
+    def _share_data_with(self, other):
+        """Mark ``other``, which should hold the same array as this tensor,
+        as sharing it copy-on-write with this tensor (and any of its shallow
+        copies).
+        """
+        if self._cow is None:
+            self._cow = _CowSlot((self,))
+        other._release_data()
+        other._cow = _CowSlot((other,), sharers=self._cow.sharers)
+
+    def _release_data(self):
+        """Stop sharing the current array copy-on-write, without copying it.
+        """
+        slot = self._cow
+        if slot is not None:
+            slot.tensors.discard(self)
+            if not slot.tensors:
+                slot.sharers.discard(slot)
+            self._cow = None
+
     @property
     def data(self):
+        slot = self._cow
+        if slot is not None:
+            # the array might be about to be modified in place -> make sure
+            #     it is private to this tensor and its shallow copies, unless
+            #     every other sharer has already copied
+            old = x = self._data
+            slot.sharers.discard(slot)
+            if slot.sharers:
+                x = do('copy', x)
+            for t in tuple(slot.tensors):
+                if t._data is old:
+                    t._data = x
+                t._cow = None
         return self._data
 
     @property
@@ -1335,12 +2081,22 @@ class Tensor(object):
         tags : sequence of str, optional
             New tags.
         """
+        data_changed = ('data' in kwargs) or ('apply' in kwargs)
+
         if 'data' in kwargs:
+            self._release_data()
             self._data = asarray(kwargs.pop('data'))
 
         if 'apply' in kwargs:
             self._apply_function(kwargs.pop('apply'))
 
+        # let any owners know the tensor has changed
+        if data_changed and self.owners:
+            for ref, tid in tuple(self.owners.values()):
+                tn = ref()
+                if tn is not None:
+                    tn._mark_modified(tid)
+
         if 'inds' in kwargs:
             inds = tuple(kwargs.pop('inds'))
 
@@ -1370,7 +2126,7 @@ class Tensor(object):
         if kwargs:
             raise ValueError(f"Option(s) {kwargs} not valid.")
 
-        if len(self.inds) != ndim(self.data):
+        if len(self.inds) != ndim(self._data):
             raise ValueError("Mismatch between number of data dimensions and "
                              "number of indices supplied.")
 
@@ -1505,7 +2261,7 @@ class Tensor(object):
         return self._data.dtype
 
     def iscomplex(self):
-        return iscomplex(self.data)
+        return iscomplex(self._data)
 
     def astype(self, dtype, inplace=False):
         """Change the type of this tensor to ``dtype``.
@@ -1962,7 +2718,7 @@ class Tensor(object):
     def norm(self):
         """Frobenius norm of this tensor.
         """
-        return norm_fro(self.data)
+        return norm_fro(self._data)
 
     def normalize(self, inplace=False):
         T = self if inplace else self.copy()
@@ -2169,23 +2925,62 @@ class Tensor(object):
 
     graph = draw
 
+    def save(self, fname):
+        """Save this tensor, without copying its array, to the uncompressed
+        numpy archive ``fname`` (with ``'.npz'`` appended if missing). Load it
+        again with :meth:`Tensor.load`.
+
+        Parameters
+        ----------
+        fname : str
+            The file to save to.
+        """
+        meta = {'inds': self.inds, 'tags': self.tags,
+                'left_inds': self.left_inds}
+        _save_arrays(fname, (self._data,), meta)
+
+    @classmethod
+    def load(cls, fname, mmap_mode=None):
+        """Load a tensor saved with :meth:`Tensor.save`.
+
+        Parameters
+        ----------
+        fname : str
+            The file to load from.
+        mmap_mode : {None, 'r', 'r+', 'c'}, optional
+            If given, memory-map the array from ``fname`` with this mode
+            rather than reading it into memory, see :class:`numpy.memmap`.
+
+        Returns
+        -------
+        Tensor
+        """
+        (data,), meta = _load_arrays(fname, mmap_mode=mmap_mode)
+        return cls(data, inds=meta['inds'], tags=meta['tags'],
+                   left_inds=meta['left_inds'])
+
     def __getstate__(self):
-        # This allows pickling, since the copy has no weakrefs.
-        return self.copy().__dict__
+        # This allows pickling, by dropping the owner weakrefs and any
+        #     copy-on-write sharers, without copying the tensor itself. The
+        #     array is left for numpy to pickle, out-of-band with protocol 5
+        state = self.__dict__.copy()
+        state['owners'] = dict()
+        state.pop('_cow', None)
+        return state
 
     def __setstate__(self, state):
         self.__dict__ = state.copy()
 
     def __repr__(self):
         return (f"{self.__class__.__name__}("
-                f"shape={tuple(map(int, self.data.shape))}, "
+                f"shape={tuple(map(int, self.shape))}, "
                 f"inds={self.inds}, "
                 f"tags={self.tags})")
 
     def __str__(self):
         s = self.__repr__()[:-1]
-        s += (f", backend='{infer_backend(self.data)}'"
-              f", dtype='{get_dtype_name(self.data)}')")
+        s += (f", backend='{infer_backend(self._data)}'"
+              f", dtype='{get_dtype_name(self._data)}')")
         return s
 
 
@@ -2247,6 +3042,20 @@ for meth_name, op in [('__radd__', operator.__add__),
 #                            Tensor Network Class                             #
 # --------------------------------------------------------------------------- #
 
+def _get_tn_class(name):
+    """Find the subclass of :class:`TensorNetwork` with the full name
+    ``name``, i.e. ``'module.qualname'``, among those already imported.
+    """
+    queue = [TensorNetwork]
+    while queue:
+        cls = queue.pop()
+        if f'{cls.__module__}.{cls.__qualname__}' == name:
+            return cls
+        queue.extend(cls.__subclasses__())
+
+    raise ValueError(f"Unknown tensor network class '{name}'.")
+
+
 class TensorNetwork(object):
     r"""A collection of (as yet uncontracted) Tensors.
 
@@ -2284,6 +3093,13 @@ class TensorNetwork(object):
     _EXTRA_PROPS = ()
     _CONTRACT_STRUCTURED = False
 
+    # whilst simplifying, the tids of tensors added or modified, the
+    #     memoized structure checks of arrays, and the operations performed,
+    #     see ``full_simplify``
+    _touched = None
+    _structure_checks = None
+    _simplify_ops = None
+
     def __init__(self, ts, *, virtual=False, check_collisions=True):
 
         # short-circuit for copying TensorNetworks
@@ -2394,11 +3210,17 @@ class TensorNetwork(object):
 
     def copy(self, virtual=False, deep=False):
         """Copy this ``TensorNetwork``. If ``deep=False``, (the default), then
-        everything but the actual numeric data will be copied.
+        everything but the actual numeric data will be copied. If
+        ``deep=True``, the arrays are shared copy-on-write, see
+        :meth:`Tensor.copy`.
         """
+        new = self.__class__(self, virtual=virtual and not deep)
         if deep:
-            return copy.deepcopy(self)
-        return self.__class__(self, virtual=virtual)
+            for tid, t in new.tensor_map.items():
+                self.tensor_map[tid]._share_data_with(t)
+            for ep in self.__class__._EXTRA_PROPS:
+                setattr(new, ep, copy.deepcopy(getattr(self, ep)))
+        return new
 
     __copy__ = copy
 
@@ -2443,6 +3265,9 @@ class TensorNetwork(object):
         self._add_tid(T.tags, self.tag_map, tid)
         self._add_tid(T.inds, self.ind_map, tid)
 
+        if self._touched is not None:
+            self._touched.add(tid)
+
     def add_tensor_network(self, tn, virtual=False, check_collisions=True):
         """
         """
@@ -2525,6 +3350,9 @@ class TensorNetwork(object):
         self._remove_tid(old - new, self.ind_map, tid)
         self._add_tid(new - old, self.ind_map, tid)
 
+        if self._touched is not None:
+            self._touched.add(tid)
+
     @property
     def num_tensors(self):
         """The total number of tensors in the tensor network.
@@ -2537,6 +3365,13 @@ class TensorNetwork(object):
         """
         return len(self.ind_map)
 
+    def _mark_modified(self, tid):
+        """Called whenever the data of tensor ``tid`` is changed inplace, so
+        that any information derived from it can be invalidated.
+        """
+        if self._touched is not None:
+            self._touched.add(tid)
+
     def _pop_tensor(self, tid):
         """Remove a tensor from this network, returning said tensor.
         """
@@ -2550,6 +3385,12 @@ class TensorNetwork(object):
         # remove this tensornetwork as an owner
         t.remove_owner(self)
 
+        # the neighbors of the tensor might now simplify differently
+        if self._touched is not None:
+            self._touched.discard(tid)
+            for ix in t.inds:
+                self._touched.update(self.ind_map.get(ix, ()))
+
         return t
 
     def delete(self, tags, which='all'):
@@ -4129,6 +4970,9 @@ class TensorNetwork(object):
         """
         tn = self if inplace else self.copy()
 
+        if not selectors:
+            return tn
+
         for tid in oset.union(*map(self.ind_map.__getitem__, selectors)):
             tn.tensor_map[tid].isel_(selectors)
 
@@ -4175,6 +5019,197 @@ class TensorNetwork(object):
             selector = dict(zip(inds, which))
             yield self.isel(selector)
 
+    def _contract_sliced_info(self, output_inds=None, **contract_opts):
+        """Get the equation, shapes, symbol map and path info for the full
+        contraction of this network, as used for sliced contraction.
+        """
+        i_ix = tuple(t.inds for t in self)
+        total_ix = tuple(concat(i_ix))
+        all_ix = tuple(oset(total_ix))
+
+        if output_inds is None:
+            o_ix = tuple(_gen_output_inds(total_ix))
+        else:
+            o_ix = tuple(output_inds)
+
+        eq = _inds_to_eq(all_ix, i_ix, o_ix)
+        symbol_map = {ix: oe.get_symbol(i) for i, ix in enumerate(all_ix)}
+        path_info = get_contraction(eq, *(t.shape for t in self),
+                                    get='info', **contract_opts)
+        return i_ix, o_ix, symbol_map, path_info
+
+    def find_slices(self, target_size, output_inds=None, **contract_opts):
+        """Find a set of indices to slice, i.e. explicitly sum over, such that
+        no tensor produced during the contraction of the sliced network has
+        more than ``target_size`` entries. The contraction path of the full
+        network is kept fixed, and indices are greedily chosen to appear in
+        as many of the remaining oversized tensors as possible.
+
+        Parameters
+        ----------
+        target_size : int
+            The maximum size of any input or intermediate tensor.
+        output_inds : sequence of str, optional
+            The output indices of the contraction, which can't be sliced.
+        contract_opts
+            Supplied to :func:`~quimb.tensor.tensor_core.get_contraction` to
+            find the contraction path.
+
+        Returns
+        -------
+        tuple[str]
+            The indices to slice.
+
+        See Also
+        --------
+        TensorNetwork.contract_sliced, TensorNetwork.cut_iter
+        """
+        _, o_ix, symbol_map, path_info = self._contract_sliced_info(
+            output_inds, **contract_opts)
+        ix_map = {sym: ix for ix, sym in symbol_map.items()}
+
+        # every input and intermediate tensor, as strings of symbols
+        terms = path_info.input_subscripts.split(',')
+        terms.extend(c[2].split('->')[1] for c in path_info.contraction_list)
+
+        sizes = dict(path_info.size_dict)
+        unsliceable = {symbol_map[ix] for ix in o_ix}
+        sliced = []
+
+        def term_size(term):
+            return prod(sizes[sym] for sym in term)
+
+        while True:
+            big_terms = [t for t in terms if term_size(t) > target_size]
+            if not big_terms:
+                return tuple(ix_map[sym] for sym in sliced)
+
+            candidates = sorted(set(concat(big_terms)) - unsliceable)
+            if not candidates:
+                raise ValueError(
+                    f"Can't reach the target size of {target_size} by only "
+                    "slicing inner indices.")
+
+            # favour indices in many and large oversized tensors
+            sym = max(candidates, key=lambda sym: (
+                sum(math.log2(term_size(term))
+                    for term in big_terms if sym in term),
+                sizes[sym]))
+
+            sliced.append(sym)
+            unsliceable.add(sym)
+            sizes[sym] = 1
+
+    def contract_sliced(self, slicing, output_inds=None, parallel=False,
+                        backend=None, **contract_opts):
+        """Fully contract this network by slicing, i.e. explicitly summing
+        over, some of its indices. Each slice is contracted with the same
+        reused expression, following the path of the full network, and the
+        results are summed. This can be used to contract networks whose
+        largest intermediate tensor would otherwise not fit in memory, and to
+        contract slices in parallel.
+
+        Parameters
+        ----------
+        slicing : int or sequence of str
+            Either the target maximum size of any tensor in the contraction, in
+            which case the indices to slice are chosen automatically with
+            :meth:`~quimb.tensor.tensor_core.TensorNetwork.find_slices`, or an
+            explicit sequence of inner indices to slice.
+        output_inds : sequence of str, optional
+            The output indices, defaults to those appearing only once.
+        parallel : bool or executor, optional
+            Whether to contract the slices in parallel. If ``True`` use the
+            ``quimb`` thread pool, otherwise any executor with a ``submit``
+            method, such as a ``concurrent.futures.ProcessPoolExecutor``.
+        backend : str, optional
+            The backend to perform each sliced contraction with.
+        contract_opts
+            Supplied to :func:`~quimb.tensor.tensor_core.get_contraction` to
+            find the contraction path.
+
+        Returns
+        -------
+        scalar or Tensor
+
+        Examples
+        --------
+        Contract a random regular network, limiting every intermediate tensor
+        to at most 2**8 entries:
+
+            >>> tn = TN_rand_reg(20, 3, D=4)
+            >>> Z = tn.contract_sliced(2**8)
+            >>> Z == pytest.approx(tn ^ all)
+            True
+
+        See Also
+        --------
+        TensorNetwork.find_slices, TensorNetwork.cut_iter
+        """
+        if backend is None:
+            backend = _CONTRACT_BACKEND
+
+        if isinstance(slicing, Integral):
+            slice_inds = self.find_slices(slicing, output_inds=output_inds,
+                                          **contract_opts)
+        else:
+            slice_inds = tuple(slicing)
+
+        if not slice_inds:
+            # the network already fits
+            return tensor_contract(*self, output_inds=output_inds,
+                                   backend=backend, **contract_opts)
+
+        i_ix, o_ix, symbol_map, path_info = self._contract_sliced_info(
+            output_inds, **contract_opts)
+
+        if set(slice_inds) & set(o_ix):
+            raise ValueError("Can't slice output indices.")
+
+        # build a single expression for every slice, using the full path
+        sliced_i_ix = tuple(tuple(ix for ix in term if ix not in slice_inds)
+                            for term in i_ix)
+        all_ix = tuple(oset(concat(sliced_i_ix)))
+        eq = _inds_to_eq(all_ix, sliced_i_ix, o_ix)
+        expr = get_contraction(
+            eq, *(tuple(d for ix, d in zip(t.inds, t.shape)
+                        if ix not in slice_inds) for t in self),
+            optimize=tuple(map(tuple, path_info.path)), **{
+                k: v for k, v in contract_opts.items() if k != 'optimize'})
+
+        # for each tensor, the axes of each sliced index
+        arrays = tuple(t._data for t in self)
+        slice_axes = tuple(
+            tuple((t.inds.index(ix), j) for j, ix in enumerate(slice_inds)
+                  if ix in t.inds)
+            for t in self)
+
+        def gen_sliced_arrays():
+            ranges = [range(self.ind_size(ix)) for ix in slice_inds]
+            for which in itertools.product(*ranges):
+                yield tuple(
+                    x[tuple(_slice_key(ndim(x), axes, which))] if axes else x
+                    for x, axes in zip(arrays, slice_axes))
+
+        if not parallel:
+            results = (expr(*xs, backend=backend)
+                       for xs in gen_sliced_arrays())
+        else:
+            pool = get_thread_pool() if parallel is True else parallel
+            futures = [pool.submit(expr, *xs, backend=backend)
+                       for xs in gen_sliced_arrays()]
+            results = (f.result() for f in futures)
+
+        o_array = functools.reduce(operator.add, results)
+
+        if not o_ix:
+            if isinstance(o_array, np.ndarray):
+                o_array = realify_scalar(o_array.item(0))
+            return o_array
+
+        return Tensor(data=o_array, inds=o_ix,
+                      tags=oset.union(*(t.tags for t in self)))
+
     def insert_operator(self, A, where1, where2, tags=None, inplace=False):
         r"""Insert an operator on the bond between the specified tensors,
         e.g.::
@@ -4334,9 +5369,10 @@ class TensorNetwork(object):
 
         return tn
 
-    def contract(self, tags=..., inplace=False, **opts):
+    def contract(self, tags=..., inplace=False, slicing=None, **opts):
         """Contract some, or all, of the tensors in this network. This method
-        dispatches to ``contract_structured`` or ``contract_tags``.
+        dispatches to ``contract_structured``, ``contract_tags`` or, if
+        ``slicing`` is given, ``contract_sliced``.
 
         Parameters
         ----------
@@ -4346,6 +5382,11 @@ class TensorNetwork(object):
         inplace : bool, optional
             Whether to perform the contraction inplace. This is only valid
             if not all tensors are contracted (which doesn't produce a TN).
+        slicing : int or sequence of str, optional
+            If given, fully contract the network by slicing either these
+            indices or, if an integer, enough indices to keep every
+            intermediate tensor below this size. See
+            :meth:`~quimb.tensor.tensor_core.TensorNetwork.contract_sliced`.
         opts
             Passed to ``tensor_contract``.
 
@@ -4357,8 +5398,15 @@ class TensorNetwork(object):
 
         See Also
         --------
-        contract_structured, contract_tags, contract_cumulative
+        contract_structured, contract_tags, contract_cumulative,
+        contract_sliced
         """
+        if slicing is not None:
+            if (tags is not all) and (tags is not ...):
+                raise ValueError("Slicing is only supported when contracting "
+                                 "all tensors.")
+            return self.contract_sliced(slicing, **opts)
+
         if tags is all:
             return tensor_contract(*self, **opts)
 
@@ -4373,6 +5421,25 @@ class TensorNetwork(object):
 
     contract_ = functools.partialmethod(contract, inplace=True)
 
+    def contraction_tree(self, output_inds=None, **contract_opts):
+        """Compile a :class:`~quimb.tensor.tensor_core.ContractionTree` for
+        repeatedly contracting this network, only recomputing the
+        intermediates that depend on tensors modified in between.
+
+        Parameters
+        ----------
+        output_inds : sequence of str, optional
+            The output indices, defaults to those appearing only once.
+        contract_opts
+            Supplied to :func:`~quimb.tensor.tensor_core.get_contraction` to
+            find the contraction path.
+
+        Returns
+        -------
+        ContractionTree
+        """
+        return ContractionTree(self, output_inds=output_inds, **contract_opts)
+
     def contraction_width(self, **contract_opts):
         """Compute the 'contraction width' of this tensor network. This
         is defined as log2 of the maximum tensor size produced during the
@@ -4382,6 +5449,89 @@ class TensorNetwork(object):
         path_info = self.contract(all, get='path-info', **contract_opts)
         return math.log2(path_info.largest_intermediate)
 
+    def contraction_cost(self, output_inds=None, predict_time=None,
+                         **contract_opts):
+        """Estimate the resources needed to fully contract this tensor network,
+        without performing the contraction.
+
+        Parameters
+        ----------
+        output_inds : sequence of str, optional
+            The output indices, defaults to those appearing only once.
+        predict_time : bool, optional
+            Whether to predict the wall time of the contraction, using the
+            calibration of this machine from :func:`get_contraction_speed`.
+            By default, only if a calibration exists already, which can be
+            made with :func:`calibrate_contraction_speed`. If ``True`` and no
+            calibration exists, raise an error.
+        contract_opts
+            Supplied to :func:`~quimb.tensor.tensor_core.get_contraction` to
+            find the contraction path.
+
+        Returns
+        -------
+        dict
+            With keys:
+
+            - ``'flops'``: the total number of floating point operations.
+            - ``'largest_intermediate'``: the size of the largest
+              intermediate tensor.
+            - ``'peak_size'``: the maximum total size of the tensors that are
+              alive at once during the contraction, including the inputs.
+            - ``'peak_memory'``: ``'peak_size'`` in bytes.
+            - ``'num_contractions'``: the number of pairwise contractions.
+            - ``'time'``: the predicted wall time in seconds, if predicted.
+
+        See Also
+        --------
+        TensorNetwork.contraction_width, TensorNetwork.find_slices,
+        calibrate_contraction_speed
+        """
+        _, _, _, path_info = self._contract_sliced_info(
+            output_inds, **contract_opts)
+        sizes = path_info.size_dict
+
+        def term_size(term):
+            return prod(sizes[sym] for sym in term)
+
+        # track the total size of the tensors alive after each contraction
+        alive = [term_size(term)
+                 for term in path_info.input_subscripts.split(',')]
+        current = peak = sum(alive)
+        for contract_inds, _, eq, _, _ in path_info.contraction_list:
+            out_size = term_size(eq.split('->')[1])
+            # the inputs are only freed once the output has been produced
+            peak = max(peak, current + out_size)
+            for i in sorted(contract_inds, reverse=True):
+                current -= alive.pop(i)
+            alive.append(out_size)
+            current += out_size
+
+        dtype = max((np.dtype(get_dtype_name(t._data)) for t in self),
+                    key=lambda d: d.itemsize)
+
+        cost = {
+            'flops': int(path_info.opt_cost),
+            'largest_intermediate': int(path_info.largest_intermediate),
+            'peak_size': int(peak),
+            'peak_memory': int(peak) * dtype.itemsize,
+            'num_contractions': len(path_info.contraction_list),
+        }
+
+        speed = None
+        if predict_time or predict_time is None:
+            speed = get_contraction_speed(dtype)
+            if (speed is None) and predict_time:
+                raise ValueError(
+                    f"No contraction speed calibration for '{dtype.name}' "
+                    "exists, make one with `calibrate_contraction_speed`.")
+
+        if speed is not None:
+            cost['time'] = (cost['flops'] / speed['flops_per_second'] +
+                            cost['num_contractions'] * speed['overhead'])
+
+        return cost
+
     def __rshift__(self, tags_seq):
         """Overload of '>>' for TensorNetwork.contract_cumulative.
         """
@@ -4670,12 +5820,97 @@ class TensorNetwork(object):
 
     flip_ = functools.partialmethod(flip, inplace=True)
 
+    def _simplify_tids(self, tids=None):
+        """The tids, out of ``tids`` or else all, still in this network, in
+        the order they were added.
+        """
+        if tids is None:
+            return list(self.tensor_map)
+        return [tid for tid in self.tensor_map if tid in tids]
+
+    def _record_simplify(self, *op):
+        """Record a simplification operation, if recording, for replaying
+        with :meth:`_replay_simplify`.
+        """
+        if self._simplify_ops is not None:
+            self._simplify_ops.append(op)
+
+    def _check_structure(self, find_fn, t, atol):
+        """Call ``find_fn(t.data, atol=atol)``, memoized on the identity of
+        the array whilst running ``full_simplify``, such that arrays shared by
+        many tensors (e.g. gates in a circuit) are only checked once.
+        """
+        x = t._data
+        checks = self._structure_checks
+        if checks is None:
+            return find_fn(x, atol=atol)
+
+        key = (find_fn, id(x), atol)
+        try:
+            ref, result = checks[key]
+            # ids can be reused -> check it really is the same array
+            if ref() is x:
+                return result
+        except KeyError:
+            pass
+
+        result = find_fn(x, atol=atol)
+        try:
+            checks[key] = (weakref.ref(x), result)
+        except TypeError:
+            # array doesn't support weak references, don't memoize
+            pass
+
+        return result
+
+    def _contract_pair_simplify(self, tid_a, tid_b, out_ab, tid,
+                                equalize_norms, scalars):
+        """Contract the tensors ``tid_a`` and ``tid_b`` as part of rank
+        simplification, adding the result as ``tid``, or to ``scalars`` if
+        there are no output indices.
+        """
+        ta = self._pop_tensor(tid_a)
+        tb = self._pop_tensor(tid_b)
+        tab = ta.contract(tb, output_inds=out_ab)
+
+        if not out_ab:
+            # handle scalars produced at the end
+            scalars.append(tab)
+            return
+
+        self.add_tensor(tab, tid=tid, virtual=True)
+
+        if equalize_norms:
+            self.strip_exponent(tid, equalize_norms)
+
+    def _absorb_scalars(self, scalars, equalize_norms, tid=None):
+        """Multiply the scalars removed during rank simplification back
+        into this network, adding them as the tensor ``tid`` if no tensors
+        are left.
+        """
+        if not scalars:
+            return
+
+        if equalize_norms:
+            signs = []
+            for s in scalars:
+                signs.append(do("sign", s))
+                self.exponent += do("log10", do('abs', s))
+            scalars = signs
+
+        if self.num_tensors:
+            self.multiply_(prod(scalars))
+        else:
+            # no tensors left! re-add one with all the scalars
+            self.add_tensor(Tensor(prod(scalars)), tid=tid, virtual=True)
+
     def rank_simplify(
         self,
         output_inds=None,
         equalize_norms=False,
         cache=None,
         inplace=False,
+        tids=None,
     ):
         """Simplify this tensor network by performing contractions that don't
         increase the rank of any tensors.
@@ -4693,6 +5928,9 @@ class TensorNetwork(object):
             Persistent cache used to mark already checked tensors.
         inplace : bool, optional
             Whether to perform the rand reduction inplace.
+        tids : sequence of str, optional
+            Only check the indices of these tensors, for instance those
+            modified since a previous simplification, rather than all of them.
 
         Returns
         -------
@@ -4713,128 +5951,130 @@ class TensorNetwork(object):
 
         # first parse all tensors
         scalars = []
-        count = collections.Counter()
-        for tid, t in tuple(tn.tensor_map.items()):
+        for tid in tn._simplify_tids(tids):
+            t = tn.tensor_map[tid]
 
             # remove floating scalar tensors -->
             #     these have no indices so won't be caught otherwise
             if t.ndim == 0:
+                tn._record_simplify('scalar', tid)
                 tn._pop_tensor(tid)
                 scalars.append(t.data)
                 continue
 
             # ... and remove any redundant repeated indices on the same tensor
+            if len(set(t.inds)) != t.ndim:
+                tn._record_simplify('collapse', tid)
             t.collapse_repeated_()
 
-            # ... also build the index counter at the same time
-            count.update(t.inds)
+        # build the index counter
+        count = collections.Counter(concat(t.inds for t in tn))
 
         # this ensures the output indices are not removed (+1 each)
         count.update(output_inds)
 
-        # sorted list of unique indices to check -> start with lowly connected
-        def rank_weight(ind):
-            return (tn.ind_size(ind),
-                    -sum(tn.tensor_map[tid].ndim for tid in tn.ind_map[ind]))
+        if tids is None:
+            check_inds = oset(count)
+        else:
+            check_inds = oset(concat(
+                tn.tensor_map[tid].inds for tid in tn._simplify_tids(tids)))
 
-        queue = oset(sorted(count, key=rank_weight))
+        # indices only appearing on one tensor and not in output -> can sum,
+        #     note contractions below never create any new such indices
+        for ind in check_inds:
+            if (count[ind] != 1) or (ind not in tn.ind_map):
+                continue
+            tid, = tn.ind_map[ind]
+            t = tn.tensor_map[tid]
+            tn._record_simplify('sum', tid, ind)
+            t.sum_reduce_(ind)
 
-        while queue:
-            # get next index
-            ind = queue.popright()
+            # check if we have created a scalar
+            if t.ndim == 0:
+                tn._record_simplify('scalar', tid)
+                tn._pop_tensor(tid)
+                scalars.append(t.data)
 
-            # the tensors it connects
-            try:
-                tids = tn.ind_map[ind]
-            except KeyError:
-                # index already contracted alongside another
-                continue
+        def score_pair(tid_a, tid_b):
+            ta = tn.tensor_map[tid_a]
+            tb = tn.tensor_map[tid_b]
 
-            # index only appears on one tensor and not in output -> can sum
-            if count[ind] == 1:
-                tid, = tids
-                t = tn.tensor_map[tid]
-                t.sum_reduce_(ind)
+            cache_key = ('rs', tid_a, tid_b, id(ta._data), id(tb._data))
+            if cache_key in cache:
+                return None
+
+            # work out the output indices of candidate contraction
+            sizes = dict(zip(ta.inds, ta.shape))
+            sizes.update(zip(tb.inds, tb.shape))
+            involved = frequencies(itertools.chain(ta.inds, tb.inds))
+            out_ab = []
+            for oix, c in involved.items():
+                if c != count[oix]:
+                    out_ab.append(oix)
+                # else this the last occurence of index oix -> remove it
+
+            # check if candidate contraction will reduce rank
+            new_ndim = len(out_ab)
+            old_ndim = max(ta.ndim, tb.ndim)
+
+            if new_ndim > old_ndim:
+                cache.add(cache_key)
+                return None
 
-                # check if we have created a scalar
-                if t.ndim == 0:
-                    tn._pop_tensor(tid)
-                    scalars.append(t.data)
+            new_size = prod(sizes[ix] for ix in out_ab)
+            return (new_ndim - old_ndim, new_size - max(ta.size, tb.size))
 
-                continue
+        # priority queue of candidate pairwise contractions, keyed by the
+        #     change in rank and then size, the counter breaking ties in order
+        heap = []
+        tiebreak = itertools.count()
 
-            # otherwise check pairwise contractions
-            cands = []
-            for tid_a, tid_b in itertools.combinations(tids, 2):
+        def push_pairs(ind):
+            for tid_a, tid_b in itertools.combinations(tn.ind_map[ind], 2):
+                score = score_pair(tid_a, tid_b)
+                if score is not None:
+                    heapq.heappush(
+                        heap, (score, next(tiebreak), tid_a, tid_b))
 
-                ta = tn.tensor_map[tid_a]
-                tb = tn.tensor_map[tid_b]
+        for ind in check_inds:
+            if ind in tn.ind_map:
+                push_pairs(ind)
 
-                cache_key = ('rs', tid_a, tid_b, id(ta.data), id(tb.data))
-                if cache_key in cache:
-                    continue
+        while heap:
+            score, _, tid_a, tid_b = heapq.heappop(heap)
 
-                # work out the output indices of candidate contraction
-                involved = frequencies(itertools.chain(ta.inds, tb.inds))
-                out_ab = []
-                deincr = []
-                for oix, c in involved.items():
-                    if c != count[oix]:
-                        out_ab.append(oix)
-                        if c == 2:
-                            deincr.append(oix)
-                    # else this the last occurence of index oix -> remove it
-
-                # check if candidate contraction will reduce rank
-                new_ndim = len(out_ab)
-                old_ndim = max(ta.ndim, tb.ndim)
-
-                if new_ndim <= old_ndim:
-                    res = (new_ndim - old_ndim, tid_a, tid_b, out_ab, deincr)
-                    cands.append(res)
-                else:
-                    cache.add(cache_key)
+            # one of the tensors has already been contracted
+            if (tid_a not in tn.tensor_map) or (tid_b not in tn.tensor_map):
+                continue
 
-            if not cands:
-                # none of the parwise contractions reduce rank
+            # index counts have changed since this entry was scored -> the
+            #     fresh score has been pushed separately (or is rejected)
+            if score_pair(tid_a, tid_b) != score:
                 continue
 
-            score, tid_a, tid_b, out_ab, deincr = min(cands)
-            ta = tn._pop_tensor(tid_a)
-            tb = tn._pop_tensor(tid_b)
-            tab = ta.contract(tb, output_inds=out_ab)
+            ta = tn.tensor_map[tid_a]
+            tb = tn.tensor_map[tid_b]
+            involved = frequencies(itertools.chain(ta.inds, tb.inds))
+            out_ab = [ix for ix, c in involved.items() if c != count[ix]]
+            deincr = [ix for ix in out_ab if involved[ix] == 2]
+
+            tid = rand_uuid('_T') if out_ab else None
+            tn._record_simplify('contract', tid_a, tid_b, out_ab, tid,
+                                equalize_norms)
+            tn._contract_pair_simplify(tid_a, tid_b, out_ab, tid,
+                                       equalize_norms, scalars)
 
             for ix in deincr:
                 count[ix] -= 1
 
-            if not out_ab:
-                # handle scalars produced at the end
-                scalars.append(tab)
-                continue
-
-            tid = rand_uuid('_T')
-            tn.add_tensor(tab, tid=tid, virtual=True)
-
-            if equalize_norms:
-                tn.strip_exponent(tid, equalize_norms)
-
+            # only pairs sharing an output index need (re)scoring
             for ix in out_ab:
-                # now we need to check outputs indices again
-                queue.add(ix)
+                push_pairs(ix)
 
-        if scalars:
-            if equalize_norms:
-                signs = []
-                for s in scalars:
-                    signs.append(do("sign", s))
-                    tn.exponent += do("log10", do('abs', s))
-                scalars = signs
-
-            if tn.num_tensors:
-                tn *= prod(scalars)
-            else:
-                # no tensors left! re-add one with all the scalars
-                tn |= Tensor(prod(scalars))
+        # the tid of any re-added scalar tensor is recorded for replaying
+        tid = rand_uuid('_T')
+        tn._record_simplify('scalars', equalize_norms, tid)
+        tn._absorb_scalars(scalars, equalize_norms, tid)
 
         return tn
 
@@ -4846,6 +6086,7 @@ class TensorNetwork(object):
         atol=1e-12,
         cache=None,
         inplace=False,
+        tids=None,
     ):
         """Find tensors with diagonal structure and collapse those axes. This
         will create a tensor 'hyper' network with indices repeated 2+ times, as
@@ -4868,6 +6109,9 @@ class TensorNetwork(object):
             Persistent cache used to mark already checked tensors.
         inplace, bool, optional
             Whether to perform the diagonal reduction inplace.
+        tids : sequence of str, optional
+            Only check these tensors, for instance those modified since a
+            previous simplification, rather than all of them.
 
         Returns
         -------
@@ -4885,16 +6129,16 @@ class TensorNetwork(object):
         if output_inds is None:
             output_inds = set(self.outer_inds())
 
-        queue = list(tn.tensor_map)
+        queue = tn._simplify_tids(tids)
         while queue:
             tid = queue.pop()
             t = tn.tensor_map[tid]
 
-            cache_key = ('dr', tid, id(t.data))
+            cache_key = ('dr', tid, id(t._data))
             if cache_key in cache:
                 continue
 
-            ij = find_diag_axes(t.data, atol=atol)
+            ij = tn._check_structure(find_diag_axes, t, atol)
 
             # no diagonals
             if ij is None:
@@ -4912,6 +6156,8 @@ class TensorNetwork(object):
             else:
                 ixmap = {ix_j: ix_i}
 
+            tn._record_simplify('diag', tid, ij, ixmap)
+
             # update wherever else the changed index appears (e.g. 'c' above)
             tn.reindex_(ixmap)
 
@@ -4932,6 +6178,7 @@ class TensorNetwork(object):
         atol=1e-12,
         cache=None,
         inplace=False,
+        tids=None,
     ):
         """Flip the order of any bonds connected to antidiagonal tensors.
         Whilst this is just a gauge fixing (with the gauge being the flipped
@@ -4951,6 +6198,9 @@ class TensorNetwork(object):
             Persistent cache used to mark already checked tensors.
         inplace, bool, optional
             Whether to perform the antidiagonal gauging inplace.
+        tids : sequence of str, optional
+            Only check these tensors, for instance those modified since a
+            previous simplification, rather than all of them.
 
         Returns
         -------
@@ -4970,16 +6220,16 @@ class TensorNetwork(object):
 
         done = set()
 
-        queue = list(tn.tensor_map)
+        queue = tn._simplify_tids(tids)
         while queue:
             tid = queue.pop()
             t = tn.tensor_map[tid]
 
-            cache_key = ('ag', tid, id(t.data))
+            cache_key = ('ag', tid, id(t._data))
             if cache_key in cache:
                 continue
 
-            ij = find_antidiag_axes(t.data, atol=atol)
+            ij = tn._check_structure(find_antidiag_axes, t, atol)
 
             # tensor not anti-diagonal
             if ij is None:
@@ -5003,6 +6253,7 @@ class TensorNetwork(object):
                 continue
 
             # only flip one index
+            tn._record_simplify('antidiag', tid, ij, ix_flip)
             tn.flip_([ix_flip])
             done.add(ix_flip)
             queue.append(tid)
@@ -5017,6 +6268,7 @@ class TensorNetwork(object):
         atol=1e-12,
         cache=None,
         inplace=False,
+        tids=None,
     ):
         """Find bonds on this tensor network which have tensors where all but
         one column (of the respective index) is non-zero, allowing the
@@ -5035,6 +6287,9 @@ class TensorNetwork(object):
             Persistent cache used to mark already checked tensors.
         inplace, bool, optional
             Whether to perform the column reductions inplace.
+        tids : sequence of str, optional
+            Only check these tensors, for instance those modified since a
+            previous simplification, rather than all of them.
 
         Returns
         -------
@@ -5052,16 +6307,16 @@ class TensorNetwork(object):
         if cache is None:
             cache = set()
 
-        queue = list(tn.tensor_map)
+        queue = tn._simplify_tids(tids)
         while queue:
             tid = queue.pop()
             t = tn.tensor_map[tid]
 
-            cache_key = ('cr', tid, id(t.data))
+            cache_key = ('cr', tid, id(t._data))
             if cache_key in cache:
                 continue
 
-            ax_i = find_columns(t.data, atol=atol)
+            ax_i = tn._check_structure(find_columns, t, atol)
 
             # no singlet columns
             if ax_i is None:
@@ -5075,6 +6330,7 @@ class TensorNetwork(object):
             if ind in output_inds:
                 continue
 
+            tn._record_simplify('column', tid, ax_i)
             tn.isel_({ind: i})
             queue.append(tid)
 
@@ -5088,6 +6344,7 @@ class TensorNetwork(object):
         equalize_norms=False,
         cache=None,
         inplace=False,
+        tids=None,
     ):
         """Find tensors which have low rank SVD decompositions across any
         combination of bonds and perform them.
@@ -5104,6 +6361,9 @@ class TensorNetwork(object):
             Persistent cache used to mark already checked tensors.
         inplace, bool, optional
             Whether to perform the split simplification inplace.
+        tids : sequence of str, optional
+            Only check these tensors, for instance those modified since a
+            previous simplification, rather than all of them.
         """
         tn = self if inplace else self.copy()
 
@@ -5112,10 +6372,11 @@ class TensorNetwork(object):
         if cache is None:
             cache = set()
 
-        for tid, t in tuple(tn.tensor_map.items()):
+        for tid in tn._simplify_tids(tids):
+            t = tn.tensor_map[tid]
 
             # id's are reused when objects go out of scope -> use tid as well
-            cache_key = ('sp', tid, id(t.data))
+            cache_key = ('sp', tid, id(t._data))
             if cache_key in cache:
                 continue
 
@@ -5131,15 +6392,11 @@ class TensorNetwork(object):
                     break
 
             if found:
-                tn._pop_tensor(tid)
-                tidl = rand_uuid('_T')
-                tn.add_tensor(tl, tid=tidl, virtual=True)
-                tidr = rand_uuid('_T')
-                tn.add_tensor(tr, tid=tidr, virtual=True)
-
-                if equalize_norms:
-                    tn.strip_exponent(tidl, equalize_norms)
-                    tn.strip_exponent(tidr, equalize_norms)
+                tidl, tidr = rand_uuid('_T'), rand_uuid('_T')
+                tn._record_simplify('split', tid, lix, atol, new_size,
+                                    tidl, tidr, equalize_norms)
+                tn._replace_with_split(tid, tl, tr, tidl, tidr,
+                                       equalize_norms)
 
             else:
                 cache.add(cache_key)
@@ -5148,6 +6405,149 @@ class TensorNetwork(object):
 
     split_simplify_ = functools.partialmethod(split_simplify, inplace=True)
 
+    def _replace_with_split(self, tid, tl, tr, tidl, tidr, equalize_norms):
+        """Replace tensor ``tid`` with its split parts ``tl`` and ``tr``.
+        """
+        self._pop_tensor(tid)
+        self.add_tensor(tl, tid=tidl, virtual=True)
+        self.add_tensor(tr, tid=tidr, virtual=True)
+
+        if equalize_norms:
+            self.strip_exponent(tidl, equalize_norms)
+            self.strip_exponent(tidr, equalize_norms)
+
+    def _replay_simplify(self, ops, output_inds, atol):
+        """Replay the simplification operations ``ops`` recorded by
+        :meth:`full_simplify` on another network with the same initial
+        structure, inplace. Each operation is first checked to still be exact
+        given the current structure and data. If a diagonal, anti-diagonal or
+        column check no longer matches, that method is run on the affected
+        tensor instead, whereas if any other check fails replaying stops. In
+        both cases this network remains equivalent to the original, and the
+        operations actually performed are recorded. Returns whether every
+        operation was replayed.
+        """
+        tensor_map, ind_map = self.tensor_map, self.ind_map
+        scalars = []
+
+        def is_inner(ix, tids):
+            # whether ``ix`` is only on the tensors ``tids``, and not output
+            return (ix not in output_inds) and all(
+                tid in tids for tid in ind_map[ix])
+
+        for op, *args in ops:
+            if op == 'scalar':
+                tid, = args
+                if (tid not in tensor_map) or tensor_map[tid].ndim:
+                    break
+                scalars.append(self._pop_tensor(tid).data)
+
+            elif op == 'collapse':
+                tid, = args
+                if tid not in tensor_map:
+                    break
+                tensor_map[tid].collapse_repeated_()
+
+            elif op == 'sum':
+                tid, ind = args
+                if (tid not in tensor_map) or (ind not in ind_map) or (
+                        not is_inner(ind, {tid})):
+                    break
+                tensor_map[tid].sum_reduce_(ind)
+
+            elif op == 'contract':
+                tid_a, tid_b, out_ab, tid, equalize_norms = args
+                if ((tid_a not in tensor_map) or (tid_b not in tensor_map) or
+                        (tid in tensor_map)):
+                    break
+                pair = {tid_a, tid_b}
+                ixs = {*tensor_map[tid_a].inds, *tensor_map[tid_b].inds}
+                if (not set(out_ab) <= ixs) or not all(
+                        is_inner(ix, pair) for ix in ixs if ix not in out_ab):
+                    break
+                self._contract_pair_simplify(tid_a, tid_b, out_ab, tid,
+                                             equalize_norms, scalars)
+
+            elif op == 'scalars':
+                equalize_norms, tid = args
+                if tid in tensor_map:
+                    break
+                self._absorb_scalars(scalars, equalize_norms, tid)
+                scalars = []
+
+            elif op == 'diag':
+                tid, ij, ixmap = args
+                if tid not in tensor_map:
+                    break
+                t = tensor_map[tid]
+                ixs = (set(ixmap) | set(ixmap.values()))
+                if ((find_diag_axes(t._data, atol=atol) == ij) and
+                        (ixs == {t.inds[i] for i in ij}) and
+                        not (set(ixmap) & output_inds)):
+                    self._record_simplify(op, *args)
+                    self.reindex_(ixmap)
+                    t.collapse_repeated_()
+                else:
+                    self.diagonal_reduce_(output_inds=output_inds, atol=atol,
+                                          tids=(tid,))
+                continue
+
+            elif op == 'antidiag':
+                tid, ij, ix_flip = args
+                if tid not in tensor_map:
+                    break
+                t = tensor_map[tid]
+                if ((find_antidiag_axes(t._data, atol=atol) == ij) and
+                        (ix_flip in {t.inds[i] for i in ij}) and
+                        (ix_flip not in output_inds)):
+                    self._record_simplify(op, *args)
+                    self.flip_([ix_flip])
+                else:
+                    self.antidiag_gauge_(output_inds=output_inds, atol=atol,
+                                         tids=(tid,))
+                continue
+
+            elif op == 'column':
+                tid, (ax, _) = args
+                if tid not in tensor_map:
+                    break
+                t = tensor_map[tid]
+                # the column selected can differ, e.g. for a projector
+                ax_i = find_columns(t._data, atol=atol)
+                if ((ax_i is not None) and (ax_i[0] == ax) and
+                        (t.inds[ax] not in output_inds)):
+                    self._record_simplify(op, tid, ax_i)
+                    self.isel_({t.inds[ax]: ax_i[1]})
+                else:
+                    self.column_reduce_(output_inds=output_inds, atol=atol,
+                                        tids=(tid,))
+                continue
+
+            elif op == 'split':
+                tid, lix, split_atol, new_size, tidl, tidr, eq_n = args
+                if ((tid not in tensor_map) or (tidl in tensor_map) or
+                        (tidr in tensor_map) or
+                        not set(lix) <= set(tensor_map[tid].inds)):
+                    break
+                tl, tr = tensor_map[tid].split(
+                    lix, get='tensors', cutoff=split_atol)
+                if max(tl.size, tr.size) != new_size:
+                    break
+                self._replace_with_split(tid, tl, tr, tidl, tidr, eq_n)
+
+            self._record_simplify(op, *args)
+
+        else:
+            return True
+
+        # stopped early -> make sure no removed scalars are lost
+        if scalars:
+            tid = rand_uuid('_T')
+            self._record_simplify('scalars', False, tid)
+            self._absorb_scalars(scalars, False, tid)
+
+        return False
+
     def full_simplify(
         self,
         seq='ADCR',
@@ -5157,6 +6557,7 @@ class TensorNetwork(object):
         cache=None,
         inplace=False,
         progbar=False,
+        record=None,
         **rank_simplify_opts
     ):
         """Perform a series of tensor network 'simplifications' in a loop until
@@ -5199,6 +6600,16 @@ class TensorNetwork(object):
             Show a live progress bar of the simplification process.
         inplace : bool, optional
             Whether to perform the simplification inplace.
+        record : None or dict, optional
+            If given, the sequence of simplifications performed is recorded
+            into this dict. If it already holds a record made with the same
+            options on a network of identical structure (the same tids, indices
+            and shapes), but possibly different data, then the simplifications
+            are instead replayed, only checking that the data of each tensor
+            still permits them. Tensors whose diagonal, anti-diagonal or
+            column structure has changed are simplified individually, and if
+            any other check fails, the simplification carries on from there
+            as normal (and is recorded afresh).
 
         Returns
         -------
@@ -5210,55 +6621,44 @@ class TensorNetwork(object):
         split_simplify
         """
         tn = self if inplace else self.copy()
-        tn.squeeze_()
+
+        replay_ops = None
+        if record is not None:
+            signature = (
+                seq, atol, equalize_norms,
+                None if output_inds is None else frozenset(output_inds),
+                tuple((tid, t.inds, t.shape)
+                      for tid, t in tn.tensor_map.items()),
+            )
+            if record.get('signature', None) == signature:
+                replay_ops = record['ops']
+            tn._simplify_ops = []
 
         # all the methods
         if output_inds is None:
             output_inds = self.outer_inds()
 
-        if cache is None:
-            cache = set()
-
         # for the index trick reductions, faster to supply set
         ix_o = set(output_inds)
 
-        # keep simplifying until the number of tensors and indices equalizes
-        old_nt, old_ni = -1, -1
-        nt, ni = tn.num_tensors, tn.num_indices
+        try:
+            tn.squeeze_()
 
-        if progbar:
-            import tqdm
-            pbar = tqdm.tqdm()
-            pbar.set_description(f'{nt}, {ni}')
+            # if replaying stops early, the network is still equivalent and
+            #     the operations performed so far are recorded -> carry on
+            if (replay_ops is None) or not tn._replay_simplify(
+                    replay_ops, ix_o, atol):
+                if cache is None:
+                    cache = set()
 
-        while (nt, ni) != (old_nt, old_ni):
-            for meth in seq:
-
-                if progbar:
-                    pbar.update()
-                    pbar.set_description(
-                        f'{meth} {tn.num_tensors}, {tn.num_indices}')
-
-                if meth == 'D':
-                    tn.diagonal_reduce_(output_inds=ix_o, atol=atol,
-                                        cache=cache)
-                elif meth == 'R':
-                    tn.rank_simplify_(output_inds=ix_o, cache=cache,
-                                      equalize_norms=equalize_norms,
-                                      **rank_simplify_opts)
-                elif meth == 'A':
-                    tn.antidiag_gauge_(output_inds=ix_o, atol=atol,
-                                       cache=cache)
-                elif meth == 'C':
-                    tn.column_reduce_(output_inds=ix_o, atol=atol, cache=cache)
-                elif meth == 'S':
-                    tn.split_simplify_(atol=atol, cache=cache,
-                                       equalize_norms=equalize_norms)
-                else:
-                    raise ValueError(f"'{meth}' is not a valid simplify type.")
+                tn._full_simplify_loop(seq, ix_o, atol, equalize_norms,
+                                       cache, progbar, **rank_simplify_opts)
 
-            old_nt, old_ni = nt, ni
-            nt, ni = tn.num_tensors, tn.num_indices
+                if record is not None:
+                    record['signature'] = signature
+                    record['ops'] = tn._simplify_ops
+        finally:
+            tn._simplify_ops = None
 
         if equalize_norms:
             if equalize_norms is True:
@@ -5267,13 +6667,81 @@ class TensorNetwork(object):
             else:
                 tn.equalize_norms_(value=equalize_norms)
 
-        if progbar:
-            pbar.close()
-
         return tn
 
     full_simplify_ = functools.partialmethod(full_simplify, inplace=True)
 
+    def _full_simplify_loop(self, seq, ix_o, atol, equalize_norms, cache,
+                            progbar, **rank_simplify_opts):
+        """The main loop of :meth:`full_simplify`, performed inplace.
+        """
+        # keep simplifying until the number of tensors and indices equalizes
+        old_nt, old_ni = -1, -1
+        nt, ni = self.num_tensors, self.num_indices
+
+        if progbar:
+            import tqdm
+            pbar = tqdm.tqdm()
+            pbar.set_description(f'{nt}, {ni}')
+
+        # for each method, the tensors added or modified since it last ran,
+        #     (``None`` meaning all), which are the only ones to re-examine
+        pending = dict.fromkeys(seq)
+        self._structure_checks = {}
+
+        try:
+            while (nt, ni) != (old_nt, old_ni):
+                for meth in seq:
+                    tids = pending[meth]
+                    if tids is not None and not tids:
+                        continue
+
+                    if progbar:
+                        pbar.update()
+                        pbar.set_description(
+                            f'{meth} {self.num_tensors}, {self.num_indices}')
+
+                    self._touched = set()
+
+                    if meth == 'D':
+                        self.diagonal_reduce_(output_inds=ix_o, atol=atol,
+                                              cache=cache, tids=tids)
+                    elif meth == 'R':
+                        self.rank_simplify_(output_inds=ix_o, cache=cache,
+                                            equalize_norms=equalize_norms,
+                                            tids=tids, **rank_simplify_opts)
+                    elif meth == 'A':
+                        self.antidiag_gauge_(output_inds=ix_o, atol=atol,
+                                             cache=cache, tids=tids)
+                    elif meth == 'C':
+                        self.column_reduce_(output_inds=ix_o, atol=atol,
+                                            cache=cache, tids=tids)
+                    elif meth == 'S':
+                        self.split_simplify_(atol=atol, cache=cache,
+                                             equalize_norms=equalize_norms,
+                                             tids=tids)
+                    else:
+                        raise ValueError(
+                            f"'{meth}' is not a valid simplify type.")
+
+                    # every method needs to revisit the modified tensors
+                    pending[meth] = set()
+                    for m_tids in pending.values():
+                        if m_tids is not None:
+                            m_tids |= self._touched
+                    self._touched = None
+
+                if not any(pending.values()):
+                    break
+
+                old_nt, old_ni = nt, ni
+                nt, ni = self.num_tensors, self.num_indices
+        finally:
+            self._touched = None
+            self._structure_checks = None
+            if progbar:
+                pbar.close()
+
     def max_bond(self):
         """Return the size of the largest bond in this network.
         """
@@ -5305,19 +6773,70 @@ class TensorNetwork(object):
 
     astype_ = functools.partialmethod(astype, inplace=True)
 
-    def __getstate__(self):
-        # This allows pickling, by removing all tensor owner weakrefs
-        d = self.__dict__.copy()
-        d['tensor_map'] = {
-            k: t.copy() for k, t in d['tensor_map'].items()
+    def save(self, fname):
+        """Save this tensor network to the uncompressed numpy archive
+        ``fname`` (with ``'.npz'`` appended if missing). The arrays are written
+        directly without copying, alongside the indices and tags of each
+        tensor, the class of the network and any of its extra properties, such
+        as the site tags of an MPS. Load it again with
+        :meth:`TensorNetwork.load`.
+
+        Parameters
+        ----------
+        fname : str
+            The file to save to.
+        """
+        ts = tuple(self)
+        cls = self.__class__
+        meta = {
+            'class': f'{cls.__module__}.{cls.__qualname__}',
+            'tensors': [(t.inds, t.tags, t.left_inds) for t in ts],
+            'extra_props': {ep: getattr(self, ep)
+                            for ep in self.__class__._EXTRA_PROPS},
         }
-        return d
+        _save_arrays(fname, (t._data for t in ts), meta)
+
+    @staticmethod
+    def load(fname, mmap_mode=None):
+        """Load a tensor network saved with :meth:`TensorNetwork.save`, as the
+        same class it was saved from.
+
+        Parameters
+        ----------
+        fname : str
+            The file to load from.
+        mmap_mode : {None, 'r', 'r+', 'c'}, optional
+            If given, memory-map each array from ``fname`` with this mode
+            rather than reading them into memory, see :class:`numpy.memmap`.
+            This allows very large networks to be opened lazily.
+
+        Returns
+        -------
+        TensorNetwork
+        """
+        arrays, meta = _load_arrays(fname, mmap_mode=mmap_mode)
+
+        tn = TensorNetwork((
+            Tensor(data, inds=inds, tags=tags, left_inds=left_inds)
+            for data, (inds, tags, left_inds) in zip(arrays, meta['tensors'])
+        ), virtual=True, check_collisions=False)
+
+        for ep, value in meta['extra_props'].items():
+            setattr(tn, ep, value)
+        tn.__class__ = _get_tn_class(meta['class'])
+
+        return tn
+
+    def __getstate__(self):
+        # The tensors themselves drop their owner weakrefs when pickled, so
+        #     no copies need to be made here
+        return self.__dict__.copy()
 
     def __setstate__(self, state):
         # This allows picklings, by restoring the returned TN as owner
         self.__dict__ = state.copy()
-        for t in self.__dict__['tensor_map'].values():
-            t.add_owner(self, tid=rand_uuid(base="_T"))
+        for tid, t in self.__dict__['tensor_map'].items():
+            t.add_owner(self, tid=tid)
 
     def __str__(self):
         return "{}([{}{}{}])".format(
@@ -5338,6 +6857,229 @@ class TensorNetwork(object):
     graph = draw_tn
 
 
+class ContractionTree:
+    """A compiled, binary contraction tree for fully contracting a tensor
+    network, which stores every intermediate tensor. When some of the
+    network's tensors change, only the intermediates that depend on them are
+    recomputed. This is useful for repeatedly contracting a network whose
+    tensors are modified one or a few at a time, for example during
+    optimization or sweeping algorithms.
+
+    The network is kept as a reference, and any tensor whose data has been
+    replaced (e.g. via ``Tensor.modify``) since the last contraction is
+    detected automatically. Writing into an array in place can't be
+    detected however, so call :meth:`ContractionTree.invalidate` after
+    doing so. The tensors and their indices must not change, else an error
+    is raised and the tree needs to be rebuilt.
+
+    Parameters
+    ----------
+    tn : TensorNetwork
+        The tensor network to contract.
+    output_inds : sequence of str, optional
+        The output indices, defaults to those appearing only once.
+    contract_opts
+        Supplied to :func:`~quimb.tensor.tensor_core.get_contraction` to find
+        the contraction path.
+
+    Attributes
+    ----------
+    num_contractions : int
+        The total number of pairwise contractions performed so far.
+
+    Examples
+    --------
+    Only the branches containing the modified tensor are recomputed:
+
+        >>> psi = MPS_rand_state(20, 7)
+        >>> norm = psi.H & psi
+        >>> tree = norm.contraction_tree()
+        >>> tree.contract(), tree.num_contractions
+        (1.0, 39)
+        >>> t = norm.tensors[5]
+        >>> t.modify(data=2 * t.data)
+        >>> tree.contract(), tree.num_contractions
+        (2.0, 49)
+    """
+
+    def __init__(self, tn, output_inds=None, **contract_opts):
+        self.tn = tn
+        self.tids = tuple(tn.tensor_map)
+        i_ix = tuple(t.inds for t in tn)
+        total_ix = tuple(concat(i_ix))
+
+        if output_inds is None:
+            o_ix = tuple(_gen_output_inds(total_ix))
+        else:
+            o_ix = tuple(output_inds)
+        self.output_inds = o_ix
+
+        n = len(self.tids)
+        ix_counts = frequencies(total_ix)
+
+        # each node is either a leaf (a tensor) or the pair of its children
+        self.children = [None] * n
+        self.parents = [None] * n
+        self.node_inds = list(i_ix)
+        self._leaf_counts = [frequencies(ix) for ix in i_ix]
+        self._specs = [None] * n
+
+        if n > 1:
+            eq = _inds_to_eq(tuple(oset(total_ix)), i_ix, o_ix)
+            path = get_contraction(eq, *(t.shape for t in tn), get='info',
+                                   **contract_opts).path
+            ssa_path = oe.paths.linear_to_ssa(path)
+        else:
+            ssa_path = ()
+
+        for k, con in enumerate(ssa_path):
+            node = n + k
+            counts = merge_with(sum, *(self._leaf_counts[c] for c in con))
+
+            if k == len(ssa_path) - 1:
+                inds = o_ix
+            else:
+                # keep indices needed elsewhere or in the output
+                inds = tuple(
+                    ix for ix in oset(concat(self.node_inds[c] for c in con))
+                    if (ix in o_ix) or (counts[ix] < ix_counts[ix]))
+
+            self.children.append(tuple(con))
+            self.parents.append(None)
+            for c in con:
+                self.parents[c] = node
+            self.node_inds.append(inds)
+            self._leaf_counts.append(counts)
+            self._specs.append(_pairwise_contract_spec(
+                *(self.node_inds[c] for c in con), inds)
+                if len(con) == 2 else None)
+
+        self.root = len(self.children) - 1
+        self._cache = {}
+        self._leaf_data = [None] * n
+        self.num_contractions = 0
+
+    def _invalidate(self, node):
+        while node is not None:
+            self._cache.pop(node, None)
+            node = self.parents[node]
+
+    def invalidate(self, tags=None):
+        """Mark the tensors matching ``tags`` (or tensor id), or all tensors
+        if ``None``, as modified, for example after writing into their
+        arrays in place.
+        """
+        if tags is None:
+            tids = self.tids
+        else:
+            try:
+                self.tn.tensor_map[tags]
+                tids = (tags,)
+            except (KeyError, TypeError):
+                tids = self.tn._get_tids_from_tags(tags, which='all')
+
+        for tid in tids:
+            self._leaf_data[self.tids.index(tid)] = None
+
+    def _sync_leaves(self):
+        """Check every tensor for modified data, invalidating any branches
+        that depend on it.
+        """
+        tensor_map = self.tn.tensor_map
+        if (len(tensor_map) != len(self.tids)) or any(
+                tid not in tensor_map for tid in self.tids):
+            raise ValueError("Tensors have been added to or removed from the "
+                             "network, the contraction tree needs to be "
+                             "rebuilt.")
+
+        for i, tid in enumerate(self.tids):
+            t = tensor_map[tid]
+            if t.inds != self.node_inds[i]:
+                raise ValueError(
+                    f"The indices of tensor {tid} have changed from "
+                    f"{self.node_inds[i]} to {t.inds}, the contraction "
+                    "tree needs to be rebuilt.")
+
+            # compare the raw array, so copy-on-write data isn't copied
+            if t._data is not self._leaf_data[i]:
+                self._leaf_data[i] = t._data
+                self._invalidate(i)
+                self._cache[i] = t._data
+
+    def update(self, tags, data):
+        """Update the data of the single tensor matching ``tags`` (or tensor
+        id), in the underlying network as well.
+        """
+        try:
+            t = self.tn.tensor_map[tags]
+        except (KeyError, TypeError):
+            tids = self.tn._get_tids_from_tags(tags, which='all')
+            if len(tids) != 1:
+                raise ValueError(f"The tags {tags} match {len(tids)} "
+                                 "tensors rather than exactly one.")
+            t = self.tn.tensor_map[tids.popleft()]
+        t.modify(data=data)
+
+    def _compute(self, node):
+        # find the nodes that need (re)computing, depth first
+        stack, order = [node], []
+        while stack:
+            nd = stack.pop()
+            if nd in self._cache:
+                continue
+            order.append(nd)
+            stack.extend(self.children[nd])
+
+        for nd in reversed(order):
+            children = self.children[nd]
+            xs = [self._cache[c] for c in children]
+            spec = self._specs[nd]
+            if spec is not None:
+                axes, perm, _ = spec
+                z = do('tensordot', *xs, axes=axes)
+                if perm is not None:
+                    z = transpose(z, perm)
+            else:
+                # e.g. traces or hyper indices
+                inputs = tuple(self.node_inds[c] for c in children)
+                eq = _inds_to_eq(tuple(oset(concat(inputs))), inputs,
+                                 self.node_inds[nd])
+                z = do('einsum', eq, *xs, like=xs[0])
+            self._cache[nd] = z
+            self.num_contractions += 1
+
+        return self._cache[node]
+
+    def contract(self):
+        """Contract the network, recomputing only the intermediates which
+        depend on tensors that have changed since the last call.
+
+        Returns
+        -------
+        scalar or Tensor
+        """
+        self._sync_leaves()
+
+        if self.root < len(self.tids):
+            # single tensor - nothing to reuse
+            return tensor_contract(self.tn.tensor_map[self.tids[0]],
+                                   output_inds=self.output_inds)
+
+        o_array = self._compute(self.root)
+
+        if not self.output_inds:
+            if isinstance(o_array, np.ndarray):
+                o_array = realify_scalar(o_array.item(0))
+            return o_array
+
+        return Tensor(data=o_array, inds=self.output_inds,
+                      tags=oset.union(*(t.tags for t in self.tn)))
+
+    def __repr__(self):
+        return (f"<ContractionTree(tensors={len(self.tids)}, "
+                f"cached={len(self._cache)})>")
+
+
 class TNLinearOperator(spla.LinearOperator):
     r"""Get a linear operator - something that replicates the matrix-vector
     operation - for an arbitrary uncontracted TensorNetwork, e.g::
@@ -5586,6 +7328,10 @@ class PTensor(Tensor):
         return PTensor.from_parray(self._parray.copy(), inds=self.inds,
                                    tags=self.tags, left_inds=self.left_inds)
 
+    def _share_data_with(self, other):
+        # the array is generated from the parameters, so copy those instead
+        other._parray = copy.deepcopy(self._parray)
+
     @property
     def _data(self):
         """Make ``_data`` read-only and handle conjugation lazily.
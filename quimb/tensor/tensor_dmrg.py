@@ -4,7 +4,7 @@
 import itertools
 import numpy as np
 
-from ..utils import progbar
+from ..utils import progbar, profiled
 from ..core import prod
 from ..linalg.base_linalg import eigh, IdentityLinearOperator
 from .tensor_core import (
@@ -839,6 +839,7 @@ class DMRG:
             2: self._update_local_state_2site,
         }[self.bsz](i, **update_opts)
 
+    @profiled()
     def sweep(self, direction, canonize=True, verbosity=0, **update_opts):
         r"""Perform a sweep of optimizations, either rightwards::
 
@@ -1293,6 +1294,7 @@ class DMRGX(DMRG):
             # 2: self._update_local_state_2site_dmrgx,
         }[self.bsz](i, **update_opts)
 
+    @profiled()
     def sweep(self, direction, canonize=True, verbosity=0, **update_opts):
         """Perform a sweep of the algorithm.
 
@@ -9,9 +9,10 @@ from numbers import Integral
 import numpy as np
 import opt_einsum as oe
 
-from ..core import make_immutable, ikron
+from ..core import make_immutable, ikron, kron
 from ..utils import deprecated
-from ..gen.operators import spin_operator, eye, _gen_mbl_random_factors
+from ..gen.operators import (spin_operator, eye, _gen_mbl_random_factors,
+                             _build_ham_from_terms, _parse_sector)
 from ..gen.rand import randn, choice, random_seed_fn, rand_phase
 from .tensor_core import Tensor, new_bond, TensorNetwork, rand_uuid
 from .array_ops import asarray, sensibly_scale
@@ -1132,6 +1133,195 @@ def spin_ham_mpo_tensor(one_site_terms, two_site_terms, S=1 / 2,
         return HL, H, HR
 
 
+def fit_exponential_sum(coeffs, n):
+    """Fit the sequence ``coeffs``, taken to be the values of some function
+    ``f(r)`` at ``r = 1, 2, 3, ...``, with a sum of ``n`` exponentials::
+
+        f(r) ~ sum(amps[k] * lams[k]**r for k in range(n))
+
+    using the matrix pencil method. This is useful for representing decaying
+    interactions, such as power laws, in an MPO with bond dimension that does
+    not depend on their range.
+
+    Parameters
+    ----------
+    coeffs : sequence of scalar
+        The values to fit, at distances ``1, 2, 3, ...``.
+    n : int
+        The number of exponentials, at most half the number of values.
+
+    Returns
+    -------
+    amps : numpy.ndarray
+        The amplitude of each exponential.
+    lams : numpy.ndarray
+        The decay factor of each exponential.
+    """
+    y = np.asarray(coeffs)
+    N = y.size
+    if not 0 < n <= N // 2:
+        raise ValueError(f"Can fit between 1 and {N // 2} exponentials to "
+                         f"{N} values, but {n} were requested.")
+
+    # the rows of the hankel matrix, and thus the first ``n`` right singular
+    #     vectors, span the geometric sequences of the decay factors
+    P = N // 2
+    Y = np.stack([y[a:a + P + 1] for a in range(N - P)])
+    _, _, VH = np.linalg.svd(Y)
+    V = VH[:n].T
+
+    # which are invariant under a shift by one
+    M = np.linalg.lstsq(V[:-1], V[1:], rcond=None)[0]
+    lams = np.linalg.eigvals(M)
+
+    rs = np.arange(1, N + 1)
+    amps = np.linalg.lstsq(lams[None, :]**rs[:, None], y, rcond=None)[0]
+
+    if np.isrealobj(y) and np.allclose(lams.imag, 0.0):
+        lams, amps = lams.real, amps.real
+
+    return amps, lams
+
+
+def _sorted_site_ops(site_ops, S=1 / 2, sparse=False):
+    """Group the ``(site, operator)`` pairs ``site_ops`` by site, multiplying
+    together, in the given order, any operators that act on the same site.
+    Returns the sorted sites, the operator acting on each, and a hashable key
+    identifying each operator, only valid while any arrays given are alive.
+    """
+    grouped = {}
+    for site, s in site_ops:
+        grouped.setdefault(site, []).append(s)
+
+    sites = sorted(grouped)
+    keys, ops = [], []
+    for site in sites:
+        ss = grouped[site]
+        keys.append(tuple(s if isinstance(s, str) else id(s) for s in ss))
+        ss = [spin_operator(s, S=S, sparse=sparse) if isinstance(s, str)
+              else s for s in ss]
+        ops.append(functools.reduce(lambda a, b: a @ b, ss))
+
+    return sites, ops, keys
+
+
+class _MPOAutomaton:
+    """Finite state automaton describing an operator on an open chain of
+    ``L`` sites, from which a MPO can be directly read off. The states on
+    bond ``b``, between sites ``b - 1`` and ``b``, label how much of each
+    term has been placed so far - ``'start'`` meaning none of it and
+    ``'done'`` all of it - and each transition across a site carries a local
+    operator. Terms that begin with the same operators share the states
+    until they differ.
+    """
+
+    def __init__(self, L, S=1 / 2):
+        self.L = L
+        self.S = S
+        self.eye_op = eye(int(2 * S + 1))
+        self.states = [{} for _ in range(L + 1)]
+        self.transitions = [{} for _ in range(L)]
+
+        for i in range(L):
+            self.set(i, 'start', 'start', self.eye_op)
+            self.set(i, 'done', 'done', self.eye_op)
+
+    def _transition(self, i, left, right):
+        # the ends of the chain only have the 'start' and 'done' states
+        if ((i == 0) and (left != 'start')) or (
+                (i == self.L - 1) and (right != 'done')):
+            return None
+
+        bl, br = self.states[i], self.states[i + 1]
+        return bl.setdefault(left, len(bl)), br.setdefault(right, len(br))
+
+    def set(self, i, left, right, op):
+        """Set the transition across site ``i`` from state ``left`` to
+        ``right``.
+        """
+        lr = self._transition(i, left, right)
+        if lr is not None:
+            self.transitions[i][lr] = op
+
+    def add(self, i, left, right, op):
+        """Add to the transition across site ``i`` from state ``left`` to
+        ``right``.
+        """
+        lr = self._transition(i, left, right)
+        if lr is not None:
+            self.transitions[i][lr] = self.transitions[i].get(lr, 0) + op
+
+    def add_term(self, factor, site_ops):
+        """Add the product of operators ``site_ops``, a sequence of
+        ``(site, operator)`` pairs, multiplied by ``factor``.
+        """
+        sites, ops, keys = _sorted_site_ops(site_ops, S=self.S)
+        if (sites[0] < 0) or (sites[-1] >= self.L):
+            raise ValueError(f"Term acts on sites {sites}, outside of the "
+                             f"chain of length {self.L}.")
+
+        state, prefix = 'start', ()
+        for k in range(len(sites) - 1):
+            # terms share states for as long as their operators match
+            prefix += ((sites[k], keys[k]),)
+            new_state = ('prefix', prefix)
+
+            self.set(sites[k], state, new_state, ops[k])
+            for i in range(sites[k] + 1, sites[k + 1]):
+                self.set(i, new_state, new_state, self.eye_op)
+            state = new_state
+
+        self.add(sites[-1], state, 'done', factor * ops[-1])
+
+    def add_distance_term(self, coeffs, s1, s2, label):
+        """Add ``coeffs[r - 1] * s1_i * s2_{i + r}`` for all ``i`` and ``r``,
+        using a new state for each distance.
+        """
+        _, (op1, op2), _ = _sorted_site_ops(((0, s1), (1, s2)), S=self.S)
+        R = min(len(coeffs), self.L - 1)
+
+        for i in range(self.L):
+            self.set(i, 'start', (label, 1), op1)
+            # state ``(label, r)`` on bond ``i`` means ``s1`` is on ``i - r``
+            for r in range(1, min(R, i) + 1):
+                if coeffs[r - 1] != 0.0:
+                    self.add(i, (label, r), 'done', coeffs[r - 1] * op2)
+                if r < R:
+                    self.set(i, (label, r), (label, r + 1), self.eye_op)
+
+    def add_exponential_term(self, amps, lams, s1, s2, label):
+        """Add ``amps[k] * lams[k]**r * s1_i * s2_{i + r}`` for all ``i``,
+        ``r`` and ``k``, using a single state for each exponential.
+        """
+        _, (op1, op2), _ = _sorted_site_ops(((0, s1), (1, s2)), S=self.S)
+
+        for k, (amp, lam) in enumerate(zip(amps, lams)):
+            state = (label, k)
+            for i in range(self.L):
+                self.set(i, 'start', state, amp * op1)
+                self.set(i, state, state, lam * self.eye_op)
+                self.add(i, state, 'done', lam * op2)
+
+    def build_arrays(self):
+        """Generate the MPO arrays, each with shape
+        ``(left_bond, right_bond, upper, lower)``, but without the left bond
+        on the first site and right bond on the last site.
+        """
+        for i, transitions in enumerate(self.transitions):
+            ops = tuple(transitions.values())
+            W = np.zeros((len(self.states[i]), len(self.states[i + 1]),
+                          *ops[0].shape), dtype=np.result_type(*ops))
+            for (a, b), op in transitions.items():
+                W[a, b] = op
+
+            W = maybe_make_real(W)
+            if i == 0:
+                W = W[0]
+            elif i == self.L - 1:
+                W = W[:, 0]
+            yield W
+
+
 class _TermAdder:
     """Simple class to allow ``SpinHam1D`` syntax like
     ``builder[i, j] += (1/2, 'Z', 'X')``. This object is temporarily created
@@ -1155,11 +1345,19 @@ class _TermAdder:
         return self
 
 
+def _is_nearest_neighbour(sites):
+    """Check if ``sites`` is a pair of adjacent sites, in ascending order.
+    """
+    return (len(sites) == 2) and (sites[1] - sites[0] == 1)
+
+
 class SpinHam1D:
     """Class for easily building custom spin hamiltonians in MPO or LocalHam1D
-    form. Currently limited to nearest neighbour interactions (and single site
-    terms). It is possible to set 'default' translationally invariant terms,
+    form. It is possible to set 'default' translationally invariant terms,
     but also terms acting on specific sites only (which take precedence).
+    Long range and many-body terms are also supported when building the MPO
+    (but not the LocalHam1D) form, in which case the MPO is built from a
+    finite state automaton then compressed to its minimal bond dimension.
     It is also possible to build a sparse matrix version of the hamiltonian
     (obviously for small sizes only).
 
@@ -1209,6 +1407,17 @@ class SpinHam1D:
 
         >>> builder[10] += 3.7, 'Z'
         >>> builder[11] += 0.0, 'I' # '0' term turns off field
+
+    Terms acting on any other sites are simply added, for instance long
+    range or three-body terms:
+
+        >>> builder[3, 17] += 0.1, 'Z', 'Z'
+        >>> builder[4, 5, 6] += 0.2, 'X', 'Z', 'X'
+
+    As are translationally invariant terms acting at every distance, here a
+    power law approximated by a sum of 4 exponentials:
+
+        >>> builder.add_long_range_term(lambda r: r**-3, 'Z', 'Z', n_exp=4)
     """
 
     def __init__(self, S=1 / 2, cyclic=False):
@@ -1221,6 +1430,10 @@ class SpinHam1D:
         self.var_one_site_terms = {}
         self.var_two_site_terms = {}
 
+        # Holders for any terms beyond nearest neighbour
+        self.long_range_terms = []
+        self.var_long_range_terms = {}
+
     def add_term(self, factor, *operators):
         """Add another term to the expression to be built.
 
@@ -1245,6 +1458,51 @@ class SpinHam1D:
         else:
             raise NotImplementedError("3-body+ terms are not supported yet.")
 
+    def add_long_range_term(self, coeffs, op1, op2, max_dist=None,
+                            n_exp=None):
+        """Add the translationally invariant two-site term acting at all
+        distances ``r``::
+
+            sum(coeffs(r) * op1_i * op2_{i + r} for all i and r > 0)
+
+        Parameters
+        ----------
+        coeffs : callable or sequence of scalar
+            The coefficient as a function of distance, or the sequence of
+            coefficients for the distances ``r = 1, 2, 3, ...``.
+        op1 : str or array
+            The operator on the left site.
+        op2 : str or array
+            The operator on the right site.
+        max_dist : int, optional
+            The maximum distance to include, by default the whole chain (or
+            as many coefficients as are given).
+        n_exp : int, optional
+            If given, approximate the coefficients up to ``max_dist`` by a sum
+            of this many exponentials, see :func:`fit_exponential_sum`, which
+            then acts at all distances. The MPO bond dimension then grows by
+            ``n_exp``, rather than by the range of the interaction.
+        """
+        self.long_range_terms.append((coeffs, op1, op2, max_dist, n_exp))
+
+    def _long_range_coeffs(self, L, coeffs, max_dist=None, n_exp=None):
+        """Get the coefficients of a translationally invariant long range
+        term, for the distances present in a chain of length ``L``, and if
+        ``n_exp`` is given, the exponentials fitted to them.
+        """
+        R = L - 1 if max_dist is None else min(max_dist, L - 1)
+        if callable(coeffs):
+            coeffs = [coeffs(r) for r in range(1, R + 1)]
+        else:
+            coeffs = list(coeffs)[:R]
+
+        if n_exp is None:
+            return coeffs, None
+
+        amps, lams = fit_exponential_sum(coeffs, n_exp)
+        coeffs = [np.sum(amps * lams**r) for r in range(1, L)]
+        return coeffs, (amps, lams)
+
     def sub_term(self, factor, *operators):
         """Subtract a term - simple alias that flips sign of ``factor``.
         """
@@ -1269,11 +1527,11 @@ class SpinHam1D:
         if isinstance(sites, Integral):
             return _TermAdder(self.var_one_site_terms.get(sites, None), 1)
 
-        i, j = sorted(sites)
-        if j - i != 1:
-            raise NotImplementedError("Can only add nearest neighbour terms.")
+        if _is_nearest_neighbour(sites):
+            return _TermAdder(self.var_two_site_terms.get(sites, None), 2)
 
-        return _TermAdder(self.var_two_site_terms.get(sites, None), 2)
+        return _TermAdder(self.var_long_range_terms.get(sites, None),
+                          len(sites))
 
     def __setitem__(self, sites, value):
         """Part of the machinery that allows terms to be added to specific
@@ -1295,17 +1553,95 @@ class SpinHam1D:
 
         if isinstance(sites, Integral):
             self.var_one_site_terms[sites] = terms
-        else:
-            i, j = sorted(sites)
-            if j - i != 1:
-                raise ValueError("Can only add nearest neighbour terms.")
+        elif _is_nearest_neighbour(sites):
             self.var_two_site_terms[sites] = terms
+        else:
+            self.var_long_range_terms[tuple(sites)] = terms
+
+    def _build_mpo_automaton(self, L):
+        """Build the finite state automaton of this spin hamiltonian of size
+        ``L``, including any long range terms.
+        """
+        if self.cyclic:
+            raise NotImplementedError("Long range terms are only supported "
+                                      "for open boundary conditions.")
+
+        fsa = _MPOAutomaton(L, S=self.S)
+
+        for i in range(L):
+            for factor, s in self.var_one_site_terms.get(
+                    i, self.one_site_terms):
+                fsa.add_term(factor, ((i, s),))
+
+            if i + 1 < L:
+                for factor, s1, s2 in self.var_two_site_terms.get(
+                        (i, i + 1), self.two_site_terms):
+                    fsa.add_term(factor, ((i, s1), (i + 1, s2)))
+
+        for sites, terms in self.var_long_range_terms.items():
+            for factor, *ss in terms:
+                fsa.add_term(factor, tuple(zip(sites, ss)))
+
+        for n, (coeffs, s1, s2, max_dist, n_exp) in enumerate(
+                self.long_range_terms):
+            coeffs, exps = self._long_range_coeffs(L, coeffs, max_dist, n_exp)
+            if exps is None:
+                fsa.add_distance_term(coeffs, s1, s2, ('dist', n))
+            else:
+                fsa.add_exponential_term(*exps, s1, s2, ('exp', n))
+
+        return fsa
 
     def build_mpo(self, L, upper_ind_id='k{}', lower_ind_id='b{}',
-                  site_tag_id='I{}', tags=None, bond_name=""):
+                  site_tag_id='I{}', tags=None, bond_name="",
+                  compress=True, cutoff=1e-12):
         """Build an MPO instance of this spin hamiltonian of size ``L``. See
         also ``MatrixProductOperator``.
+
+        If there are any terms beyond nearest neighbour, the MPO is built
+        from a finite state automaton, with the states describing how much of
+        each term has been placed, then optionally compressed.
+
+        Parameters
+        ----------
+        L : int
+            The number of spins.
+        upper_ind_id : str, optional
+            The format string for the upper site indices.
+        lower_ind_id : str, optional
+            The format string for the lower site indices.
+        site_tag_id : str, optional
+            The format string for the site tags.
+        tags : str or sequence of str, optional
+            Global tags to add to every tensor.
+        bond_name : str, optional
+            The base name of the bond indices.
+        compress : bool, optional
+            If there are long range terms, whether to compress the MPO with
+            SVDs to (close to) its minimal bond dimension.
+        cutoff : float, optional
+            The relative singular value cutoff to use when compressing.
+
+        Returns
+        -------
+        MatrixProductOperator
         """
+        if self.long_range_terms or self.var_long_range_terms:
+            fsa = self._build_mpo_automaton(L)
+            mpo = MatrixProductOperator(
+                arrays=fsa.build_arrays(), bond_name=bond_name,
+                upper_ind_id=upper_ind_id, lower_ind_id=lower_ind_id,
+                site_tag_id=site_tag_id, tags=tags)
+
+            if compress:
+                # normalize the identity, else the norm grows exponentially
+                D = int(2 * self.S + 1)
+                mpo.multiply_each_(D**-0.5)
+                mpo.compress(cutoff=cutoff, cutoff_mode='rel')
+                mpo.multiply_each_(D**0.5)
+
+            return mpo
+
         # cache the default term
         t_defs = {}
 
@@ -1350,13 +1686,19 @@ class SpinHam1D:
                                      lower_ind_id=lower_ind_id,
                                      site_tag_id=site_tag_id, tags=tags)
 
-    def build_sparse(self, L, **ikron_opts):
+    def build_sparse(self, L, sector=None, **ikron_opts):
         """Build a sparse matrix representation of this Hamiltonian.
 
         Parameters
         ----------
         L : int, optional
             The number of spins to build the matrix for.
+        sector : float, optional
+            If given, build the matrix directly in this total spin-z subspace,
+            using the same convention as
+            :func:`~quimb.gen.operators.zspin_projector`, without ever
+            forming the full operator. Only ``ownership`` is then used from
+            ``ikron_opts``.
         ikron_opts
             Supplied to :func:`~quimb.core.ikron`.
 
@@ -1370,12 +1712,16 @@ class SpinHam1D:
         dims = [D] * L
 
         terms = []
+        sector_terms = []
         for i in range(L):
 
             t1s = self.var_one_site_terms.get(i, self.one_site_terms)
             for factor, s in t1s:
                 if isinstance(s, str):
                     s = spin_operator(s, S=self.S, sparse=True)
+                if sector is not None:
+                    sector_terms.append(((i,), s, factor))
+                    continue
                 terms.append(
                     ikron(factor * s, dims, i, **ikron_opts)
                 )
@@ -1389,10 +1735,42 @@ class SpinHam1D:
                     s1 = spin_operator(s1, S=self.S, sparse=True)
                 if isinstance(s2, str):
                     s2 = spin_operator(s2, S=self.S, sparse=True)
+                if sector is not None:
+                    sector_terms.append(
+                        ((i, (i + 1) % L), kron(s1, s2), factor))
+                    continue
                 terms.append(
-                    ikron([factor * s1, s2], dims, [i, i + 1], **ikron_opts)
+                    ikron([factor * s1, s2], dims, [i, (i + 1) % L],
+                          **ikron_opts)
                 )
 
+        long_range_terms = [
+            (factor, tuple(zip(sites, ss)))
+            for sites, lr_terms in self.var_long_range_terms.items()
+            for factor, *ss in lr_terms
+        ]
+        for coeffs, s1, s2, max_dist, n_exp in self.long_range_terms:
+            coeffs, _ = self._long_range_coeffs(L, coeffs, max_dist, n_exp)
+            long_range_terms.extend(
+                (c, ((i, s1), (i + r, s2)))
+                for r, c in enumerate(coeffs, 1) if c != 0.0
+                for i in range(L - r)
+            )
+
+        for factor, site_ops in long_range_terms:
+            sites, ops, _ = _sorted_site_ops(site_ops, S=self.S, sparse=True)
+            if sector is not None:
+                sector_terms.append((tuple(sites), kron(*ops), factor))
+                continue
+            terms.append(
+                ikron([factor * ops[0], *ops[1:]], dims, sites, **ikron_opts)
+            )
+
+        if sector is not None:
+            return _build_ham_from_terms(
+                sector_terms, L, d=D, charge=_parse_sector(L, D, sector),
+                ownership=ikron_opts.get('ownership', None))
+
         return sum(terms)
 
     def _get_spin_op(self, factor, *ss):
@@ -1431,6 +1809,10 @@ class SpinHam1D:
         -------
         LocalHam1D
         """
+        if self.long_range_terms or self.var_long_range_terms:
+            raise NotImplementedError("Long range terms can only be built "
+                                      "into an MPO or sparse matrix.")
+
         H1s, H2s = {}, {}
 
         # add default two site term
@@ -1,7 +1,13 @@
 """Miscellenous
 """
+import time
+import pickle
+import functools
 import importlib
 import itertools
+import threading
+import contextlib
+import collections
 
 
 try:
@@ -236,6 +242,220 @@ def load_from_disk(fname, **load_opts):
     return joblib.load(fname, **load_opts)
 
 
+def dumps_oob(obj):
+    """Pickle ``obj``, collecting any large contiguous buffers it contains,
+    such as numpy arrays and thus the data of tensors and tensor networks,
+    out-of-band rather than copying them into the pickle. Requires pickle
+    protocol 5 (python 3.8+), else everything is pickled in-band.
+
+    Parameters
+    ----------
+    obj : object
+        The object to pickle.
+
+    Returns
+    -------
+    header : bytes
+        The pickled structure of ``obj``.
+    buffers : list[pickle.PickleBuffer]
+        The out-of-band buffers, which can be sent to another process by any
+        zero-copy means before being given to :func:`loads_oob`.
+    """
+    if pickle.HIGHEST_PROTOCOL < 5:
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), []
+
+    buffers = []
+    header = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    return header, buffers
+
+
+def loads_oob(header, buffers=()):
+    """Unpickle an object pickled with :func:`dumps_oob`, reusing the
+    out-of-band ``buffers`` (any objects supporting the buffer protocol) for
+    its arrays without copying them.
+    """
+    if not buffers:
+        return pickle.loads(header)
+    return pickle.loads(header, buffers=buffers)
+
+
+_PROFILER = None
+
+
+class Profiler:
+    """A record of the calls made to functions instrumented with
+    :func:`profiled`, while profiling with :func:`profile`. Every call is
+    aggregated by caller and name, but only the most recent calls are kept
+    in full, such that long running computations use bounded memory.
+
+    Parameters
+    ----------
+    max_records : int or None, optional
+        How many of the most recent calls to keep in full, ``None`` meaning
+        all of them.
+
+    Attributes
+    ----------
+    records : collections.deque[dict]
+        One dict per recent call, with keys ``'name'``, ``'time'`` (in
+        seconds, including any nested calls), ``'stack'`` (the names of the
+        enclosing instrumented calls), ``'caller'`` (the outermost of these,
+        such as ``'DMRG.sweep'``, or ``None``), plus any of e.g. ``'shapes'``,
+        ``'backend'`` and ``'flops'`` (a rough estimate) that the function
+        reports.
+    totals : dict
+        Mapping each ``(caller, name)`` to the total ``'calls'``, ``'time'``
+        and ``'flops'``, and the ``'max_time'`` of a single call, over all
+        calls.
+    """
+
+    def __init__(self, max_records=10000):
+        self.records = collections.deque(maxlen=max_records)
+        self.totals = {}
+        self._local = threading.local()
+
+    @property
+    def _stack(self):
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def call(self, name, fn, info, args, kwargs):
+        """Call ``fn(*args, **kwargs)``, recording it as ``name``, with extra
+        fields given by ``info(*args, **kwargs)`` if ``info`` is not None.
+        """
+        stack = self._stack
+        record = {'name': name, 'stack': tuple(stack),
+                  'caller': stack[0] if stack else None}
+        if info is not None:
+            record.update(info(*args, **kwargs))
+
+        stack.append(name)
+        t0 = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            record['time'] = time.perf_counter() - t0
+            stack.pop()
+            self.records.append(record)
+            self._add_to(self.totals, (record['caller'], name), 1,
+                         record['time'], record['time'],
+                         record.get('flops', None) or 0)
+
+    @staticmethod
+    def _add_to(groups, key, calls, total_time, max_time, flops):
+        group = groups.setdefault(
+            key, {'calls': 0, 'time': 0.0, 'max_time': 0.0, 'flops': 0})
+        group['calls'] += calls
+        group['time'] += total_time
+        group['max_time'] = max(group['max_time'], max_time)
+        group['flops'] += flops
+
+    def summary(self, by='name'):
+        """Aggregate the calls.
+
+        Parameters
+        ----------
+        by : str or tuple[str], optional
+            Which field(s) of the records to group by, e.g. ``'name'``,
+            ``'caller'`` or ``('caller', 'name')``, which are aggregated over
+            all calls. Any other fields, such as ``'backend'``, can only be
+            aggregated over the recent calls kept in :attr:`records`.
+
+        Returns
+        -------
+        dict
+            Mapping each group to a dict with the total ``'calls'``, ``'time'``
+            and (estimated) ``'flops'``, and the ``'max_time'`` of a single
+            call.
+        """
+        single = isinstance(by, str)
+        fields = (by,) if single else tuple(by)
+
+        if set(fields) <= {'caller', 'name'}:
+            items = (
+                (dict(zip(('caller', 'name'), key)), group)
+                for key, group in self.totals.items())
+        else:
+            items = (
+                (record, {'calls': 1, 'time': record['time'],
+                          'max_time': record['time'],
+                          'flops': record.get('flops', None) or 0})
+                for record in self.records)
+
+        groups = {}
+        for record, group in items:
+            key = tuple(record.get(f) for f in fields)
+            self._add_to(groups, key[0] if single else key, group['calls'],
+                         group['time'], group['max_time'], group['flops'])
+
+        return groups
+
+
+@contextlib.contextmanager
+def profile(max_records=10000):
+    """Profile the calls, within this context, to functions instrumented with
+    :func:`profiled` - such as tensor contractions and splits, SVDs, partial
+    eigen-solves and ``expm_multiply`` - labelled by the outermost
+    instrumented caller, such as ``DMRG.sweep``, ``TEBD.step`` or
+    ``Circuit.amplitude``.
+
+    Parameters
+    ----------
+    max_records : int or None, optional
+        How many of the most recent calls to keep in full, see
+        :class:`Profiler`. All calls are aggregated regardless.
+
+    Examples
+    --------
+
+        >>> with quimb.profile() as prof:
+        ...     dmrg.solve()
+        >>> prof.summary(by=('caller', 'name'))
+
+    Yields
+    ------
+    Profiler
+    """
+    global _PROFILER
+    old_profiler, _PROFILER = _PROFILER, Profiler(max_records)
+    try:
+        yield _PROFILER
+    finally:
+        _PROFILER = old_profiler
+
+
+def profiled(name=None, info=None):
+    """Decorator instrumenting a function to be recorded when profiling with
+    :func:`profile`. When not profiling, the only overhead is a single check.
+
+    Parameters
+    ----------
+    name : str, optional
+        The name to record calls under, defaults to the function's qualified
+        name.
+    info : callable, optional
+        Called with the same arguments as the function, returning a dict of
+        extra fields to record, such as ``'shapes'``, ``'backend'`` and
+        ``'flops'``.
+    """
+
+    def decorator(fn):
+        fn_name = fn.__qualname__ if name is None else name
+
+        @functools.wraps(fn)
+        def wrapped(*args, **kwargs):
+            if _PROFILER is None:
+                return fn(*args, **kwargs)
+            return _PROFILER.call(fn_name, fn, info, args, kwargs)
+
+        return wrapped
+
+    return decorator
+
+
 class Verbosify:  # pragma: no cover
     """Decorator for making functions print their inputs. Simply for
     illustrating a MPI example in the docs.
@@ -527,6 +527,33 @@ class TestDecomp:
         )
         assert_allclose(pr, p1)
 
+    @pytest.mark.parametrize("qtype", ['ket', 'dop', 'sparse', 'nherm'])
+    def test_pauli_transform_matches_overlaps(self, qtype):
+        n = 3
+        p = {
+            'ket': lambda: qu.rand_ket(2**n),
+            'dop': lambda: qu.rand_rho(2**n),
+            'sparse': lambda: qu.rand_herm(2**n, sparse=True, density=0.5),
+            'nherm': lambda: qu.rand_matrix(2**n),
+        }[qtype]()
+        c = qu.pauli_transform(p)
+        assert c.shape == (4,) * n
+        P = qu.dop(p) if qu.isvec(p) else p
+        for ijk in itertools.product(range(4), repeat=n):
+            op = qu.kron(*(qu.pauli('IXYZ'[i]) for i in ijk))
+            assert_allclose(c[ijk], qu.tr(P @ op) / 2**n, atol=1e-12)
+        if qtype != 'nherm':
+            assert not np.iscomplexobj(c)
+
+    def test_pauli_decomp_cutoff(self):
+        p = qu.rand_rho(8)
+        full = qu.pauli_decomp(p, mode='c')
+        assert len(full) == 4**3
+        sparse = qu.pauli_decomp(p, mode='c', cutoff=0.05)
+        assert 0 < len(sparse) < len(full)
+        assert all(abs(x) >= 0.05 for x in sparse.values())
+        assert list(sparse) == list(full)[:len(sparse)]
+
     @pytest.mark.parametrize(
         "state, out",
         [(qu.up() & qu.down(), {0: 0.5, 1: 0.5, 2: 0, 3: 0}),
@@ -176,6 +176,12 @@ class TestHamHeis:
         lk = qu.eigvalsh(h, k=4)
         assert_allclose(lk, [-2, -1, -1, -1])
 
+    def test_ham_heis_restores_num_threads(self):
+        import numba
+        num_threads = numba.get_num_threads()
+        qu.ham_heis(4, sparse=True, parallel=False)
+        assert numba.get_num_threads() == num_threads
+
     def test_ham_heis_bz(self):
         h = qu.ham_heis(2, cyclic=False, b=1)
         evals = qu.eigvalsh(h)
@@ -280,6 +286,88 @@ class TestSpinZProjector:
             assert_allclose(qu.expec(h, gs0), qu.expec(h, gs))
 
 
+class TestSectorHamiltonians:
+
+    @pytest.mark.parametrize("sz", [0, 1, -2])
+    @pytest.mark.parametrize("cyclic", [False, True])
+    @pytest.mark.parametrize("ham_fn, kwargs", [
+        (qu.ham_heis, {'j': (0.3, 0.5, 1.2), 'b': 0.2}),
+        (qu.ham_j1j2, {'bz': 0.1}),
+        (qu.ham_mbl, {'dh': 2.0, 'seed': 42}),
+    ])
+    def test_matches_projected(self, ham_fn, kwargs, cyclic, sz):
+        n = 8
+        prj = qu.zspin_projector(n, sz)
+        H = ham_fn(n, cyclic=cyclic, sparse=True, **kwargs)
+        H0 = ham_fn(n, cyclic=cyclic, sparse=True, sector=sz, **kwargs)
+        assert H0.shape == (prj.shape[1],) * 2
+        assert_allclose(H0.A, (prj.T @ H @ prj).A, atol=1e-14)
+
+    @pytest.mark.parametrize("cyclic", [False, True])
+    def test_heis_2D_and_hubbard(self, cyclic):
+        prj = qu.zspin_projector(6, 1)
+        H = qu.ham_heis_2D(2, 3, bz=0.3, cyclic=cyclic)
+        H0 = qu.ham_heis_2D(2, 3, bz=0.3, cyclic=cyclic, sector=1)
+        assert_allclose(H0, prj.T @ H @ prj, atol=1e-14)
+        H = qu.ham_hubbard_hardcore(6, cyclic=cyclic)
+        H0 = qu.ham_hubbard_hardcore(6, cyclic=cyclic, sector=4)
+        assert_allclose(H0, prj.T @ H @ prj, atol=1e-14)
+
+    def test_ownership(self):
+        H = qu.ham_heis(6, sparse=True, sector=0)
+        H_own = qu.ham_heis(6, sparse=True, sector=0, ownership=(3, 11))
+        assert_allclose(H_own.A, H[3:11, :].A)
+
+    def test_groundenergy(self):
+        H = qu.ham_heis(10, sparse=True, cyclic=True)
+        H0 = qu.ham_heis(10, sparse=True, cyclic=True, sector=0)
+        assert qu.groundenergy(H0) == pytest.approx(qu.groundenergy(H))
+
+    def test_raises(self):
+        with pytest.raises(ValueError):
+            qu.ham_heis(5, sector=0)
+        with pytest.raises(ValueError):
+            qu.ham_heis(4, sector=3)
+
+
+class TestHamFromTerms:
+
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_matches_ikron(self, sparse):
+        n = 6
+        X, Z = qu.pauli('X'), qu.pauli('Z')
+        ZZ = qu.kron(Z, Z)
+        terms = [((i, i + 2), ZZ, 0.3) for i in range(n - 2)]
+        terms += [((i,), X, -0.7) for i in range(n)]
+        H = qu.ham_from_terms(terms, n, sparse=sparse)
+        Hx = sum(0.3 * qu.ikron([Z, Z], [2] * n, [i, i + 2])
+                 for i in range(n - 2))
+        Hx = Hx + sum(-0.7 * qu.ikron(X, [2] * n, i) for i in range(n))
+        assert qu.issparse(H) is sparse
+        assert_allclose(H.A if sparse else H, Hx, atol=1e-14)
+
+    def test_qutrits_sector(self):
+        n = 4
+        S = qu.spin_operator('Z', S=1)
+        terms = [((i, i + 1), qu.kron(S, S), 1.0) for i in range(n - 1)]
+        H = qu.ham_from_terms(terms, n, d=3, sparse=True)
+        H0 = qu.ham_from_terms(terms, n, d=3, sparse=True, sector=0)
+        # basis states with total spin-z zero (charge n)
+        basis = [i for i in range(3**n)
+                 if sum(int(x) for x in np.base_repr(i, 3)) == n]
+        assert_allclose(H0.A, H.A[np.ix_(basis, basis)], atol=1e-14)
+
+    def test_heis_2D_anisotropic(self):
+        H1 = qu.ham_heis_2D(1, 4, j=(0.5, 1.0, 2.0))
+        H2 = qu.ham_heis(4, j=(0.5, 1.0, 2.0))
+        assert_allclose(H1, H2, atol=1e-14)
+
+    def test_raises(self):
+        with pytest.raises(ValueError):
+            qu.ham_from_terms([((0, 4), qu.kron(qu.pauli('Z'),
+                                                qu.pauli('Z')), 1.0)], 4)
+
+
 class TestSwap:
     @pytest.mark.parametrize("sparse", [False, True])
     def test_swap_qubits(self, sparse):
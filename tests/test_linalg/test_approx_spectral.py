@@ -233,6 +233,35 @@ class TestLanczosApprox:
                                             bsz=bsz, verbosity=2)
         assert_allclose(actual_x, approx_x, rtol=rtol)
 
+    @pytest.mark.parametrize("mpi", MPI_PARALLEL)
+    @pytest.mark.parametrize("bsz", [1, 2])
+    def test_approx_spectral_function_multiple_fns(self, bsz, mpi):
+        a = rand_pos(2**7)
+        fns = [np.sqrt, np.log1p, np.exp]
+        actual_xs = [sum(fn(eigvalsh(a))) for fn in fns]
+        approx_xs = approx_spectral_function(a, fns, mpi=mpi, bsz=bsz,
+                                             pos=[True, False, False])
+        assert isinstance(approx_xs, tuple)
+        assert_allclose(actual_xs, approx_xs, rtol=1e-1)
+
+    @pytest.mark.parametrize("parallel", ['threads', 'processes'])
+    @pytest.mark.parametrize("bsz", [1, 2])
+    def test_approx_spectral_function_local_parallel(self, parallel, bsz):
+        a = rand_pos(2**7)
+        actual_x = sum(np.sqrt(eigvalsh(a)))
+        approx_x = approx_spectral_function(a, np.sqrt, pos=True, bsz=bsz,
+                                            parallel=parallel, num_workers=2)
+        assert_allclose(actual_x, approx_x, rtol=1e-1)
+
+    def test_approx_spectral_function_parallel_raises(self):
+        with pytest.raises(ValueError):
+            approx_spectral_function(rand_pos(2**4), np.sqrt, parallel='mpi')
+
+    def test_approx_spectral_function_multiple_fns_bad_pos(self):
+        with pytest.raises(ValueError):
+            approx_spectral_function(rand_pos(2**4), [np.sqrt, np.exp],
+                                     pos=[True])
+
     @pytest.mark.parametrize("bsz", [1, 2, 5])
     @pytest.mark.parametrize("dist", ['gaussian', 'phase', 'rademacher'])
     @pytest.mark.parametrize(
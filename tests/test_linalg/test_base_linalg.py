@@ -344,3 +344,57 @@ class TestLazy:
 
         assert ge == pytest.approx(-2)
         assert qu.expec(gs, gs) == pytest.approx(1.0)
+
+
+class TestIKronLinearOperator:
+
+    @pytest.mark.parametrize("cyclic", [False, True])
+    def test_heis_matches(self, cyclic):
+        n = 6
+        Sx, Sy, Sz = map(qu.spin_operator, 'xyz')
+        terms = [((S, S), (i, (i + 1) % n))
+                 for i in range(n if cyclic else n - 1)
+                 for S in (Sx, Sy, Sz)]
+        H = qu.IKronLinearOperator(terms, [2] * n)
+        H_ex = qu.ham_heis(n, cyclic=cyclic, sparse=True)
+        assert_allclose(H.to_sparse().A, H_ex.A)
+        x = qu.rand_ket(2**n)
+        assert_allclose(H @ x, H_ex @ x)
+        X = qu.randn((2**n, 3))
+        assert_allclose(H @ X, H_ex @ X)
+        assert_allclose(H.H @ x, H_ex @ x)
+        assert H.trace() == pytest.approx(0.0)
+        assert qu.groundenergy(H) == pytest.approx(qu.groundenergy(H_ex))
+
+    def test_overlay_and_coeffs(self):
+        dims = [5, 2, 2, 3]
+        A, B = qu.rand_matrix(4), qu.rand_matrix(3, sparse=True)
+        H = qu.IKronLinearOperator([(0.5, A, [1, 2]), (B, 3)], dims)
+        H_ex = 0.5 * qu.ikron(A, dims, [1, 2]) + qu.ikron(B, dims, 3).A
+        assert_allclose(H.to_sparse().A, H_ex)
+        x = qu.rand_ket(60)
+        assert_allclose(H @ x, H_ex @ x)
+        assert_allclose(H.H @ x, qu.dag(H_ex) @ x)
+        assert H.trace() == pytest.approx(np.trace(H_ex))
+
+    def test_2d_dims(self):
+        dims = [[2, 2], [2, 2]]
+        Z = qu.pauli('Z')
+        H = qu.IKronLinearOperator([(Z, [(0, 1)]), (Z, [(1, 0)])], dims)
+        H_ex = qu.ikron(Z, dims, [(0, 1)]) + qu.ikron(Z, dims, [(1, 0)])
+        assert_allclose(H.to_sparse().A, H_ex)
+
+    def test_bad_placement(self):
+        with pytest.raises(ValueError):
+            qu.IKronLinearOperator([(qu.rand_matrix(4), [0, 2])], [2, 2, 2])
+
+    def test_expm_multiply(self):
+        n = 5
+        H_ex = qu.ham_heis(n, sparse=True)
+        Sx, Sy, Sz = map(qu.spin_operator, 'xyz')
+        H = qu.IKronLinearOperator(
+            [((S, S), (i, i + 1)) for i in range(n - 1) for S in (Sx, Sy, Sz)],
+            [2] * n)
+        x = qu.rand_ket(2**n)
+        assert_allclose(qu.expm_multiply(-0.3j * H, x, traceA=0.0),
+                        qu.expm_multiply(-0.3j * H_ex, x))
@@ -197,6 +197,39 @@ class TestMatrixProductState:
         assert co == (8, 11)
         assert p.dtype == dtype
 
+    def test_tracked_canonical_form(self):
+        p = MPS_rand_state(10, 7)
+        assert p._num_canonized == (0, 0)
+        p.canonize(4)
+        assert p._num_canonized == (4, 5)
+        assert p.calc_current_orthog_center() == (4, 4)
+
+        # copies and conjugates keep the form
+        assert p.copy()._num_canonized == (4, 5)
+        assert p.H._num_canonized == (4, 5)
+
+        # moving the center only touches the sites in between
+        p.canonize(6)
+        assert p._num_canonized == (6, 3)
+        assert p.count_canonized() == (6, 3)
+
+        # modifying a tensor invalidates the form around it
+        p[2].modify(apply=lambda x: 2 * x)
+        assert p._num_canonized == (2, 3)
+        p.canonize(3)
+        assert p._num_canonized == (3, 6)
+        assert p.count_canonized() == (3, 6)
+
+        # changing the array inplace isn't tracked, but ``None`` is safe
+        x = p[5].data
+        x *= 2
+        p.canonize(3, cur_orthog=None)
+        assert p.count_canonized() == (3, 6)
+
+        # and so does changing the structure
+        p.add_tensor(qu.tensor.Tensor())
+        assert p._num_canonized == (0, 0)
+
     def test_can_change_data(self):
         p = MPS_rand_state(3, 10)
         assert_allclose(p.H @ p, 1)
@@ -540,6 +573,64 @@ class TestMatrixProductState:
 
         assert ghz.H @ ghz == pytest.approx(1.0)
 
+    @pytest.mark.parametrize('connected', [False, True])
+    def test_correlation_matrix(self, connected):
+        n = 6
+        p = MPS_rand_state(n, 4, dtype=complex)
+        p /= (p.H @ p)**0.5
+        pd = p.to_dense()
+        dims = [2] * n
+        Z, X, Y = (qu.pauli(s) for s in 'ZXY')
+
+        def dense_corr(A, B, i, j):
+            if i == j:
+                c = qu.expec(qu.ikron(A @ B, dims, i), pd)
+            else:
+                c = qu.expec(qu.ikron([A, B], dims, [i, j]), pd)
+            if connected:
+                c -= (qu.expec(qu.ikron(A, dims, i), pd) *
+                      qu.expec(qu.ikron(B, dims, j), pd))
+            return c
+
+        C = p.correlation_matrix(Z, connected=connected)
+        assert C.shape == (n, n)
+        assert_allclose(C, [[dense_corr(Z, Z, i, j) for j in range(n)]
+                            for i in range(n)], atol=1e-10)
+
+        # many operator pairs and a subset of sites
+        sites = (0, 2, 5)
+        C = p.correlation_matrix([Z, X], B=[Y, Z, X], sites=sites,
+                                 connected=connected)
+        assert C.shape == (2, 3, 3, 3)
+        for a, A in enumerate([Z, X]):
+            for b, B in enumerate([Y, Z, X]):
+                assert_allclose(C[a, b], [[dense_corr(A, B, i, j)
+                                           for j in sites] for i in sites],
+                                atol=1e-10)
+
+    def test_sample(self):
+        n = 5
+        p = MPS_rand_state(n, 3, dtype=complex)
+        pd = p.to_dense()
+        probs = abs(np.ravel(pd))**2
+
+        C = 20000
+        arrays = [t.data.copy() for t in p]
+        samples = list(p.sample(C, seed=42, batch_size=3000))
+        assert len(samples) == C
+        # the state itself is left untouched
+        for t, x in zip(p, arrays):
+            assert_allclose(t.data, x)
+        assert (list(p.sample(100, seed=7)) ==
+                list(p.sample(100, seed=7)))
+
+        counts = np.zeros(2**n)
+        for config, omega in samples:
+            k = int("".join(map(str, config)), 2)
+            assert omega == pytest.approx(probs[k])
+            counts[k] += 1
+        assert_allclose(counts / C, probs, atol=0.02)
+
     def test_gate_split(self):
         psi = MPS_rand_state(10, 3)
         psi2 = psi.copy()
@@ -759,6 +850,33 @@ class TestMatrixProductOperator:
         Ad, xd, yd = A.to_dense(), x.to_dense(), y.to_dense()
         assert_allclose(Ad @ xd, yd)
 
+    @pytest.mark.parametrize("method", ('zipup', 'fit', 'density'))
+    def test_apply_mps_methods(self, method):
+        A = MPO_rand_herm(8, 3)
+        x = MPS_rand_state(8, 5)
+        yd = A.apply(x).to_dense()
+
+        # no truncation -> exact
+        y = A.apply(x, method=method)
+        assert isinstance(y, MatrixProductState)
+        assert_allclose(y.to_dense(), yd, atol=1e-8)
+
+        # zero weight singular vectors are always dropped
+        y = A.apply(x, method=method, cutoff=0.0)
+        assert y.max_bond() <= 15
+        assert_allclose(y.to_dense(), yd, atol=1e-8)
+
+        # truncated -> comparable to direct then compress
+        yc = A.apply(x, compress=True, max_bond=6)
+        y = A.apply(x, method=method, max_bond=6)
+        assert y.max_bond() <= 6
+        err = np.linalg.norm(y.to_dense() - yd)
+        err_c = np.linalg.norm(yc.to_dense() - yd)
+        assert err <= 1.5 * err_c + 1e-10
+
+        with pytest.raises(NotImplementedError):
+            A.apply(A, method=method)
+
 
 # --------------------------------------------------------------------------- #
 #                         Test specific 1D instances                          #
@@ -97,6 +97,28 @@ class TestContractOpts:
             # need to release close the cache so the directory can be deleted
             qtn.set_contract_path_cache(None)
 
+    def test_contract_cache_canonical(self):
+        qtn.set_contract_path_cache()
+        mps = qtn.MPS_rand_state(6, 3)
+        bra = mps.H.reindex({f'k{i}': f'b{i}' for i in range(6)})
+        tn = bra & qtn.MPO_rand_herm(6, 2) & mps
+        info0 = qtn.get_contract_path_cache_info()
+        x = tn ^ all
+        info = qtn.get_contract_path_cache_info()
+        assert info['misses'] == info0['misses'] + 1
+
+        # same contraction with different index names and tensor order
+        tn2 = qtn.TensorNetwork(reversed(tuple(tn)))
+        tn2.reindex_({ix: qtn.rand_uuid() for ix in tn2.ind_map})
+        assert tn2 ^ all == pytest.approx(x)
+        info = qtn.get_contract_path_cache_info()
+        assert info['misses'] == info0['misses'] + 1
+        assert info['hits'] == info0['hits'] + 1
+        assert info['search_time'] > 0.0
+
+        qtn.set_contract_path_cache()
+        assert qtn.get_contract_path_cache_info()['hits'] == 0
+
 
 class TestBasicTensorOperations:
 
@@ -133,6 +155,53 @@ class TestBasicTensorOperations:
         # still reference the same underlying array
         assert_allclose(a.data / 2, b.data)
 
+    def test_tensor_deep_copy_on_write(self):
+        x = np.random.randn(2, 3, 4)
+        a = Tensor(x, inds=[0, 1, 2], tags='blue')
+        b = a.copy(deep=True)
+        # array shared until exposed for writing
+        assert b._data is x
+        assert b.norm() == pytest.approx(a.norm())
+        assert b._data is x
+        # replacing the data just drops the shared reference
+        b.modify(data=np.zeros((2, 3, 4)))
+        assert a._cow is not None
+        assert a.data is x
+        c = a.copy(deep=True)
+        del a
+        # the only other sharer is gone, so no need to copy
+        assert c.data is x
+
+    def test_tensor_shallow_copy_of_copy_on_write(self):
+        a = rand_tensor((2, 3, 4), inds='abc')
+        b = a.copy(deep=True)
+        c = b.copy()
+        # shallow copies still alias each other, but not the deep copy
+        c.data[:] = 0
+        assert_allclose(b.data, 0)
+        assert np.all(a.data != 0)
+        d = a.copy(deep=True)
+        TensorNetwork([d]).tensors[0].data[:] = 0
+        assert_allclose(d.data, 0)
+        assert np.all(a.data != 0)
+
+    def test_tensor_save_load(self):
+        import tempfile
+        import os
+
+        a = rand_tensor((2, 3, 4), inds='abc', tags={'X', 'Y'})
+        with tempfile.TemporaryDirectory() as tdir:
+            fname = os.path.join(tdir, "t.npz")
+            a.save(fname)
+            b = Tensor.load(fname)
+            # the extension is added in both directions
+            a.save(os.path.join(tdir, "t2"))
+            c = Tensor.load(os.path.join(tdir, "t2"))
+        assert a.inds == b.inds == c.inds
+        assert a.tags == b.tags == c.tags
+        assert_allclose(a.data, b.data)
+        assert_allclose(a.data, c.data)
+
     def test_with_alpha_construct(self):
         x = np.random.randn(2, 3, 4)
         a = Tensor(x, inds='ijk', tags='blue')
@@ -239,6 +308,36 @@ class TestBasicTensorOperations:
         assert d.inds == (4,)
         assert d.tags == oset(('red', 'blue'))
 
+    @pytest.mark.parametrize("output_inds", [None, 'adx', 'xda', (), 'abd'])
+    @pytest.mark.parametrize("inds_b", ['bcxd', 'cbxd', 'bcd', 'bbd', 'abd'])
+    def test_pairwise_contract_matches_einsum(self, inds_b, output_inds):
+        a = rand_tensor((2, 3, 4), inds='abc', tags='red')
+        sizes = {'a': 2, 'b': 3, 'c': 4, 'd': 5, 'x': 6}
+        b = rand_tensor([sizes[ix] for ix in inds_b], inds=inds_b,
+                        tags='blue')
+
+        if output_inds is not None:
+            # only test valid requested outputs
+            if set(output_inds) - set(a.inds + b.inds):
+                pytest.skip("requested output index not present")
+
+        try:
+            x = tensor_contract(a, b, output_inds=output_inds,
+                                backend='numpy')
+        except ValueError:
+            with pytest.raises(ValueError):
+                tensor_contract(a, b, output_inds=output_inds)
+            return
+
+        y = tensor_contract(a, b, output_inds=output_inds)
+        if isinstance(x, Tensor):
+            assert y.inds == x.inds
+            assert y.tags == x.tags
+            assert_allclose(y.data, x.data)
+        else:
+            assert type(y) is type(x)
+            assert y == pytest.approx(x)
+
     def test_contract_with_legal_characters(self):
         a = Tensor(np.random.randn(2, 3, 4), inds='abc',
                    tags='red')
@@ -376,6 +475,140 @@ class TestBasicTensorOperations:
         assert sum(tn ^ all for tn in pp.cut_iter(*bnds)) == pytest.approx(1.0)
         assert pp ^ all == pytest.approx(1.0)
 
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_contract_sliced_explicit(self, parallel):
+        psi = MPS_rand_state(10, 7, cyclic=True)
+        pp = psi.H & psi
+        bnds = bonds(pp[0], pp[-1])
+        x = pp.contract(all, slicing=bnds, parallel=parallel)
+        assert x == pytest.approx(1.0)
+
+    @pytest.mark.parametrize("target_size", [2**6, 2**8, 2**20])
+    def test_contract_sliced_auto(self, target_size):
+        psi = MPS_rand_state(12, 6, cyclic=True, seed=42)
+        tn = TensorNetwork(psi)
+        out = ['k0', 'k1', 'k2']
+        tn.isel_({f'k{i}': 0 for i in range(3, 12)})
+        x = tn.contract(all, output_inds=out)
+
+        slice_inds = tn.find_slices(target_size, output_inds=out)
+        assert not set(slice_inds) & set(out)
+        sliced_width = max(
+            t.size for t in tn.isel({ix: 0 for ix in slice_inds}))
+        assert sliced_width <= target_size
+
+        y = tn.contract(..., slicing=target_size, output_inds=out)
+        assert y.inds == x.inds
+        assert_allclose(y.data, x.data)
+
+    def test_contraction_tree_incremental(self):
+        psi = MPS_rand_state(10, 5)
+        norm = psi.H & psi
+        tree = norm.contraction_tree()
+        assert tree.contract() == pytest.approx(1.0)
+        n = tree.num_contractions
+        assert n == norm.num_tensors - 1
+
+        # nothing changed
+        assert tree.contract() == pytest.approx(1.0)
+        assert tree.num_contractions == n
+
+        # only the branches depending on the tensor are recomputed
+        t = norm.tensors[3]
+        t.modify(data=2 * t.data)
+        assert tree.contract() == pytest.approx(2.0)
+        assert n < tree.num_contractions < 2 * n
+
+        tid = next(iter(norm.tensor_map))
+        tree.update(tid, 3 * norm.tensor_map[tid].data)
+        assert tree.contract() == pytest.approx(6.0)
+
+        with pytest.raises(ValueError):
+            tree.update('I0', norm['I0'][0].data)
+
+    def test_contraction_tree_output_inds(self):
+        tn = qtn.TN_rand_reg(8, 3, D=2, phys_dim=2, seed=7)
+        out = sorted(tn.outer_inds())
+        tree = tn.contraction_tree(output_inds=out)
+        assert_allclose(tree.contract().data,
+                        tn.contract(all, output_inds=out).data)
+        t = tn.tensors[2]
+        t.modify(data=np.random.randn(*t.shape))
+        x = tree.contract()
+        assert x.inds == tuple(out)
+        assert_allclose(x.data, tn.contract(all, output_inds=out).data)
+
+        # changing the index structure requires a new tree
+        t.modify(inds=t.inds[::-1], data=t.data.transpose())
+        with pytest.raises(ValueError):
+            tree.contract()
+
+    def test_contraction_tree_stale(self):
+        psi = MPS_rand_state(6, 3)
+        norm = psi.H & psi
+        tree = norm.contraction_tree()
+        assert tree.contract() == pytest.approx(1.0)
+
+        # in place writes need explicit invalidation
+        norm['I2'][0].data[...] *= 2
+        tree.invalidate('I2')
+        assert tree.contract() == pytest.approx(norm ^ all)
+
+        # reading copy-on-write arrays doesn't make them look modified
+        tree = norm.copy(deep=True).contraction_tree()
+        n = tree.num_contractions
+        assert tree.contract() == pytest.approx(norm ^ all)
+        assert tree.contract() == pytest.approx(norm ^ all)
+        assert tree.num_contractions == n + norm.num_tensors - 1
+
+        # reindexing or removing tensors requires a new tree
+        tree = norm.contraction_tree()
+        norm.reindex_({'k0': 'q0'})
+        with pytest.raises(ValueError):
+            tree.contract()
+        norm.reindex_({'q0': 'k0'})
+        assert tree.contract() == pytest.approx(norm ^ all)
+        norm._pop_tensor(next(iter(norm.tensor_map)))
+        with pytest.raises(ValueError):
+            tree.contract()
+
+    def test_contract_sliced_raises(self):
+        tn = qtn.TN_rand_reg(6, 3, D=2, phys_dim=2)
+        with pytest.raises(ValueError):
+            tn.contract(all, slicing=2)
+        with pytest.raises(ValueError):
+            tn.contract(tn.tensors[0].tags, slicing=2**4)
+
+    def test_contraction_cost(self, tmp_path, monkeypatch):
+        from quimb.tensor import tensor_core
+        monkeypatch.setattr(tensor_core, '_CONTRACT_CALIBRATION_FILE',
+                            str(tmp_path / 'speed.json'))
+        monkeypatch.setattr(tensor_core, '_CONTRACT_CALIBRATION', {})
+
+        a = rand_tensor((2, 3), 'ab')
+        b = rand_tensor((3, 4), 'bc')
+        c = rand_tensor((4, 5), 'cd')
+        tn = a & b & c
+        cost = tn.contraction_cost(predict_time=False)
+        assert cost['num_contractions'] == 2
+        assert 10 <= cost['largest_intermediate'] <= 15
+        assert cost['peak_size'] >= 6 + 12 + 20
+        assert cost['peak_memory'] == 8 * cost['peak_size']
+        assert 'time' not in cost
+
+        # no calibration is made implicitly
+        assert 'time' not in tn.contraction_cost()
+        assert not (tmp_path / 'speed.json').exists()
+        assert qtn.get_contraction_speed() is None
+        with pytest.raises(ValueError):
+            tn.contraction_cost(predict_time=True)
+
+        qtn.calibrate_contraction_speed(size=64)
+        assert (tmp_path / 'speed.json').exists()
+        monkeypatch.setattr(tensor_core, '_CONTRACT_CALIBRATION', {})
+        assert qtn.get_contraction_speed()['flops_per_second'] > 0
+        assert tn.contraction_cost()['time'] > 0
+
     @pytest.mark.parametrize("method", ['qr', 'exp', 'mgs', 'svd'])
     def test_unitize(self, method):
         t = rand_tensor((2, 3, 4), 'abc')
@@ -411,7 +644,7 @@ class TestBasicTensorOperations:
 
 
 class TestTensorFunctions:
-    @pytest.mark.parametrize('method', ['svd', 'eig', 'isvd', 'svds'])
+    @pytest.mark.parametrize('method', ['svd', 'eig', 'isvd', 'svds', 'auto'])
     @pytest.mark.parametrize('linds', [('a', 'b', 'd'), ('c', 'e')])
     @pytest.mark.parametrize('cutoff', [-1.0, 1e-13, 1e-10])
     @pytest.mark.parametrize('cutoff_mode', ['abs', 'rel', 'sum2'])
@@ -444,6 +677,47 @@ class TestTensorFunctions:
                     (a_split.shape == (2, 3, 6, 5, 4)))
         assert (a_split ^ ...).almost_equals(a)
 
+    def test_split_auto_method(self):
+        from quimb.tensor.tensor_core import _choose_split_method
+        opts = qtn.get_split_auto_opts()
+        try:
+            qtn.set_split_auto_opts(eig_aspect=4, rsvd_fraction=0.1,
+                                    rsvd_min_dim=100)
+            assert _choose_split_method(
+                10, 10, None, 0.0, 'right', None) == 'qr'
+            assert _choose_split_method(
+                10, 10, 10, -1.0, 'left', None) == 'lq'
+            assert _choose_split_method(
+                10, 10, None, 0.0, 'both', None) == 'svd'
+            assert _choose_split_method(
+                10, 40, None, 1e-10, 'right', None) == 'eig'
+            assert _choose_split_method(
+                200, 200, 10, 1e-10, 'right', None) == 'rsvd'
+            assert _choose_split_method(
+                200, 200, 10, 1e-10, 'right', 'values') == 'svd'
+            assert _choose_split_method(
+                200, 200, 10, 1e-10, 'right', None,
+                randomizable=False) == 'svd'
+
+            t = rand_tensor((10, 20, 30), inds='abc')
+            tl, tr = t.split(['a', 'b'], method='auto', max_bond=15,
+                             get='tensors')
+            assert tl.shape == (10, 20, 15)
+            tl_svd, tr_svd = t.split(['a', 'b'], method='svd', max_bond=15,
+                                     get='tensors')
+            assert (tl @ tr).almost_equals(tl_svd @ tr_svd)
+            assert_allclose(t.singular_values(['a', 'b'], method='auto'),
+                            t.singular_values(['a', 'b'], method='svd'))
+        finally:
+            qtn.set_split_auto_opts(**opts)
+
+    def test_calibrate_split_auto(self):
+        opts = qtn.get_split_auto_opts()
+        new_opts = qtn.calibrate_split_auto(size=16, repeats=1,
+                                            set_opts=False)
+        assert set(new_opts) == set(opts)
+        assert qtn.get_split_auto_opts() == opts
+
     @pytest.mark.parametrize('method', ['svd', 'eig'])
     def test_singular_values(self, method):
         psim = Tensor(np.eye(2) * 2**-0.5, inds='ab')
@@ -709,6 +983,19 @@ class TestTensorNetwork:
         tn2['t1'].data[:] /= 2
         assert_allclose(tn1['t1'].data / 2, tn2['t1'].data)
 
+    def test_copy_deep_on_write(self):
+        tn1 = TensorNetwork([rand_tensor((2, 3, 4), inds='abc', tags='t0'),
+                             rand_tensor((2, 3, 4), inds='abd', tags='t1')])
+        x = tn1['t1']._data
+        tn2 = tn1.copy(deep=True)
+        # contracting doesn't require a private copy
+        assert_allclose((tn2 ^ all)._data, (tn1 ^ all)._data)
+        assert tn2['t1']._data is x
+        tn2['t1'].data[:] /= 2
+        assert tn2['t1']._data is not x
+        assert tn1['t1'].data is x
+        assert_allclose(tn1['t1'].data / 2, tn2['t1'].data)
+
     def test_TensorNetwork_init_checks(self):
         a = rand_tensor((2, 3, 4), inds=[0, 1, 2], tags={'red'})
         b = rand_tensor((3, 4, 5), inds=[1, 2, 3], tags={'blue'})
@@ -1292,6 +1579,48 @@ class TestTensorNetwork:
         assert all(hash(tn) not in t.owners for t in tn2)
         assert all(hash(tn2) in t.owners for t in tn2)
 
+    def test_pickle_out_of_band(self):
+        tn = MPS_rand_state(10, 7, tags='KET')
+        # copy-on-write sharers shouldn't prevent pickling
+        tn = tn.copy(deep=True)
+
+        header, buffers = qu.dumps_oob(tn)
+        if buffers:
+            # arrays shouldn't be copied into the pickle itself
+            assert len(buffers) == tn.num_tensors
+            assert len(header) < sum(t.data.nbytes for t in tn)
+
+        tn2 = qu.loads_oob(header, buffers)
+        assert tn.H @ tn2 == pytest.approx(1.0)
+        assert all(hash(tn2) in t.owners for t in tn2)
+        assert all(t.owners[hash(tn2)][1] == tid
+                   for tid, t in tn2.tensor_map.items())
+
+    @pytest.mark.parametrize('mmap_mode', [None, 'r'])
+    def test_save_load(self, mmap_mode):
+        import tempfile
+        import os
+
+        tn = MPS_rand_state(10, 7, tags='KET', dtype='complex128')
+        # properties can be numpy scalars, e.g. computed from shapes
+        tn._L = np.int64(10)
+
+        with tempfile.TemporaryDirectory() as tdir:
+            fname = os.path.join(tdir, "tn")
+            tn.save(fname)
+            tn2 = TensorNetwork.load(fname, mmap_mode=mmap_mode)
+
+            assert isinstance(tn2, qtn.MatrixProductState)
+            assert tn2.L == 10
+            assert tn2.site_tag_id == tn.site_tag_id
+            assert tn2.site_ind_id == tn.site_ind_id
+            assert all(t.tags == t2.tags and t.inds == t2.inds
+                       for t, t2 in zip(tn, tn2))
+            if mmap_mode is not None:
+                assert all(isinstance(t._data, np.memmap) for t in tn2)
+            assert tn.H @ tn2 == pytest.approx(1.0)
+            del tn2
+
     @pytest.mark.parametrize('dtype', [None, 'float32', 'complex128'])
     def test_randomize(self, dtype):
         psi = MPS_rand_state(5, 3, dtype='float64')
@@ -1351,6 +1680,20 @@ class TestTensorNetworkSimplifications:
         # checl that 'B' was absorbed into 'A' not 'C'
         assert set(tn_s['B'].tags) == {'A', 'B'}
 
+    def test_rank_simplify_large(self):
+        # long chain of matrices with some vectors hanging off
+        ts = [rand_tensor([2, 2], [f'k{i}', f'k{i + 1}']) for i in range(50)]
+        ts += [rand_tensor([2], [f'k{i}']) for i in range(5, 45, 10)]
+        tn = TensorNetwork(ts)
+        # the vectors make hyper indices -> specify the output indices
+        out = ['k0', 'k50']
+        tn_s = tn.rank_simplify(output_inds=out)
+        assert tn_s.num_tensors == 1
+        assert set(tn_s.outer_inds()) == {'k0', 'k50'}
+        x = tn.contract(all, output_inds=out)
+        y = tn_s.contract(all, output_inds=out)
+        assert_allclose(x.data, y.data)
+
     def test_diagonal_reduce(self):
         A = rand_tensor([2, 2], 'ab', dtype=complex)
         B = Tensor([[3j, 0.], [0., 4j]], 'bc')
@@ -1387,6 +1730,91 @@ class TestTensorNetworkSimplifications:
         assert tn_s.num_indices == 4
         assert (tn ^ all).almost_equals(tn_s ^ all)
 
+    def test_simplify_tids(self):
+        A = rand_tensor([2, 2], 'ab', dtype=complex)
+        B = Tensor([[3j, 0.], [0., 4j]], 'bc', tags='B')
+        C = rand_tensor([2, 2], 'ca', dtype=complex)
+        tn = A & B & C
+        tid_b, = tn._get_tids_from_tags('B')
+        # not checking B -> no diagonals found
+        assert tn.diagonal_reduce(tids=()).num_indices == 3
+        assert tn.diagonal_reduce(tids=[tid_b]).num_indices == 2
+
+    @pytest.mark.parametrize('seq', ['ADCR', 'ADCRS', 'RC'])
+    def test_full_simplify(self, seq):
+        circ = qtn.Circuit(6)
+        for i in range(6):
+            circ.apply_gate('H', i)
+        for _ in range(2):
+            for i in range(0, 5):
+                circ.apply_gate('CNOT', i, i + 1)
+                circ.apply_gate('RZ', 0.3, i + 1)
+        psi = circ.psi
+        tn = psi.isel({psi.site_ind(i): int(x)
+                       for i, x in enumerate('010110')})
+        x = tn.contract(all, output_inds=())
+
+        tn_s = tn.full_simplify(seq=seq, output_inds=())
+        assert tn_s.num_tensors < tn.num_tensors
+        assert tn_s._touched is None
+        assert tn_s._structure_checks is None
+        assert tn_s.contract(all, output_inds=()) == pytest.approx(x)
+
+    def test_full_simplify_record(self):
+        circ = qtn.Circuit(6)
+        for i in range(6):
+            circ.apply_gate('H', i)
+        for i in range(0, 5):
+            circ.apply_gate('CNOT', i, i + 1)
+            circ.apply_gate('RZ', 0.3, i + 1)
+        psi = circ.psi
+
+        record = {}
+        for k, b in enumerate(['010110', '111000', '000001']):
+            tn = psi.isel({psi.site_ind(i): int(x) for i, x in enumerate(b)})
+            x = tn.contract(all, output_inds=())
+            tn_s = tn.full_simplify(output_inds=(), record=record)
+            assert tn_s.num_tensors < tn.num_tensors
+            assert tn_s._simplify_ops is None
+            assert tn_s.contract(all, output_inds=()) == pytest.approx(x)
+            if k == 0:
+                ops = record['ops']
+                assert any(op[0] == 'contract' for op in ops)
+            else:
+                # replayed rather than simplified from scratch
+                assert record['ops'] is ops
+
+        # a different structure is simplified from scratch
+        tn = psi.isel({psi.site_ind(0): 0})
+        ops = record['ops']
+        tn.full_simplify(record=record)
+        assert record['ops'] is not ops
+
+    def test_full_simplify_record_contract(self):
+        # only rank simplification -> the replay is purely contractions
+        tn0 = TensorNetwork([
+            rand_tensor([2, 3], 'ab'),
+            rand_tensor([3, 4], 'bc'),
+            rand_tensor([4, 2], 'cd'),
+            rand_tensor([2, 3, 2], 'dea'),
+        ])
+        record = {}
+        for k in range(2):
+            # same structure and tids, but different data
+            tn = tn0.copy(deep=True)
+            for t in tn:
+                t.modify(data=np.random.randn(*t.shape))
+            x = tn.contract(all, output_inds=['e'])
+            tn_s = tn.full_simplify('R', output_inds=['e'], record=record)
+            if k == 0:
+                ops = record['ops']
+                assert any(op[0] == 'contract' for op in ops)
+            else:
+                assert record['ops'] is ops
+            assert tn_s.num_tensors == 1
+            y = tn_s.contract(all, output_inds=['e'])
+            assert_allclose(x.data, y.data)
+
 
 class TestTensorNetworkAsLinearOperator:
 
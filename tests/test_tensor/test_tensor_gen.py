@@ -1,4 +1,7 @@
+import itertools
+
 import pytest
+import numpy as np
 from numpy.testing import assert_allclose
 
 import quimb as qu
@@ -51,6 +54,27 @@ class TestSpinHam1D:
 
         assert_allclose(H_mpo.to_dense(), H_sps.A)
 
+    @pytest.mark.parametrize("S, sector", [(1 / 2, 1 / 2), (1, 0), (1, -1)])
+    @pytest.mark.parametrize("cyclic", [False, True])
+    def test_build_sparse_sector(self, S, sector, cyclic):
+        L = 5
+        HB = qtn.SpinHam1D(S=S, cyclic=cyclic)
+        HB += 1.0, 'X', 'X'
+        HB += 0.5, 'Y', 'Y'
+        HB += 0.3, 'Z', 'Z'
+        HB += 0.2, 'Z'
+        HB[1, 2] += 0.7, '+', '-'
+        HB[1, 2] += 0.7, '-', '+'
+        H = HB.build_sparse(L).A
+        H0 = HB.build_sparse(L, sector=sector).A
+
+        # the spin of level k is k - S, find matching basis states
+        d = int(2 * S + 1)
+        charge = L * S + sector
+        basis = [i for i, levels in enumerate(
+            itertools.product(range(d), repeat=L)) if sum(levels) == charge]
+        assert_allclose(H0, H[np.ix_(basis, basis)], atol=1e-14)
+
     def test_no_default_term(self):
         N = 10
         builder = qtn.SpinHam1D(1 / 2)
@@ -65,6 +89,61 @@ class TestSpinHam1D:
 
         assert dmrg.energy == pytest.approx(-2.25)
 
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_long_range_terms(self, compress):
+        L = 8
+        K1 = qu.rand_herm(2)
+        HB = qtn.SpinHam1D(S=1 / 2)
+        HB += 0.5, 'Z', 'Z'
+        HB += 0.3, 'X'
+        HB[1, 4] += 0.7, 'X', 'Y'
+        HB[6, 2] += 0.4, K1, 'Z'
+        HB[0, 3, 7] += 0.4, 'Z', K1, 'Z'
+        HB[2, 2, 5] += 0.2, '+', '-', 'X'
+        HB.add_long_range_term(lambda r: r**-2, '+', '-', max_dist=5)
+        HB.add_long_range_term(lambda r: r**-2, '-', '+', max_dist=5)
+
+        H_mpo = HB.build_mpo(L, compress=compress)
+        H_sps = HB.build_sparse(L)
+        assert_allclose(H_mpo.to_dense(), H_sps.A, atol=1e-10)
+
+        with pytest.raises(NotImplementedError):
+            HB.build_local_ham(L)
+
+    def test_long_range_compress_minimal(self):
+        # explicit exponential decay has an exact bond dimension 3 MPO
+        L = 10
+        HB = qtn.SpinHam1D(S=1 / 2)
+        HB.add_long_range_term(lambda r: 0.5**r, 'Z', 'Z')
+        assert HB.build_mpo(L, compress=False).max_bond() > 3
+        H_mpo = HB.build_mpo(L)
+        assert H_mpo.max_bond() == 3
+        assert_allclose(H_mpo.to_dense(), HB.build_sparse(L).A, atol=1e-10)
+
+    def test_long_range_power_law_fit(self):
+        L = 30
+        HB = qtn.SpinHam1D(S=1 / 2)
+        HB.add_long_range_term(lambda r: r**-3, 'Z', 'Z', n_exp=4)
+        H = HB.build_mpo(L)
+        assert H.max_bond() <= 6
+
+        # compare the energy of the neel state with the exact power law
+        psi = qtn.MPS_neel_state(L)
+        en = qtn.expec_TN_1D(psi.H, H, psi)
+        ex = sum((L - r) * (-1)**r * r**-3 / 4 for r in range(1, L))
+        assert en == pytest.approx(ex, rel=1e-2)
+
+    def test_fit_exponential_sum(self):
+        rs = np.arange(1, 21)
+        coeffs = 0.5 * 0.9**rs - 2.0 * 0.3**rs
+        amps, lams = qtn.fit_exponential_sum(coeffs, 2)
+        assert_allclose(sorted(lams), [0.3, 0.9])
+        fit = (amps[None, :] * lams[None, :]**rs[:, None]).sum(axis=1)
+        assert_allclose(fit, coeffs)
+
+        with pytest.raises(ValueError):
+            qtn.fit_exponential_sum(coeffs, 11)
+
 
 class TestMPSSpecificStates:
 
@@ -3,6 +3,8 @@ from quimb.utils import (
     raise_cant_find_library_function,
     deprecated,
     oset,
+    profile,
+    profiled,
 )
 
 
@@ -84,3 +86,66 @@ class TestOset:
         a = oset('abcdefg')
         a.difference_update(oset('abd'), oset('bdf'))
         assert list(a) == ['c', 'e', 'g']
+
+
+class TestProfile:
+
+    def test_profiled_sections(self):
+
+        @profiled(info=lambda x: {'flops': x})
+        def inner(x):
+            return x + 1
+
+        @profiled('outer')
+        def outer():
+            return inner(2) + inner(3)
+
+        assert outer() == 7
+
+        with profile() as prof:
+            outer()
+            inner(4)
+
+        name = inner.__qualname__
+        assert name.endswith('test_profiled_sections.<locals>.inner')
+        assert [r['name'] for r in prof.records] == [
+            name, name, 'outer', name]
+        assert [r['caller'] for r in prof.records] == [
+            'outer', 'outer', None, None]
+
+        by_caller = prof.summary(by=('caller', 'name'))
+        key = ('outer', name)
+        assert by_caller[key]['calls'] == 2
+        assert by_caller[key]['flops'] == 5
+        assert prof.summary()['outer']['time'] > 0
+        assert prof.summary()['outer']['max_time'] > 0
+
+    def test_profile_bounded_records(self):
+
+        @profiled('f', info=lambda x: {'flops': x})
+        def f(x):
+            return x
+
+        with profile(max_records=3) as prof:
+            for x in range(10):
+                f(x)
+
+        # only the recent calls are kept in full, but all are aggregated
+        assert [r['flops'] for r in prof.records] == [7, 8, 9]
+        assert prof.summary()['f']['calls'] == 10
+        assert prof.summary()['f']['flops'] == 45
+        assert prof.summary(by='caller')[None]['calls'] == 10
+
+    def test_profile_tensor_functions(self):
+        import quimb.tensor as qtn
+
+        a = qtn.rand_tensor((2, 3), 'ab')
+        b = qtn.rand_tensor((3, 4), 'bc')
+        with profile() as prof:
+            (a @ b).split('a')
+
+        summary = prof.summary()
+        assert summary['tensor_contract']['flops'] == 2 * 2 * 3 * 4
+        assert summary['tensor_split']['calls'] == 1
+        assert summary['svd']['calls'] == 1
+        assert all(r['backend'] == 'numpy' for r in prof.records)